@@ -0,0 +1,419 @@
+"""
+End-to-end benchmarks for the sample applications, run headlessly against the mock Graphlit API.
+
+Each app runs in its own interpreter, since every sample has top-level `components` and `other` packages.
+The runner calls the handlers in the app's `components/*.py` in workflow order
+(upload, feed, prompt, summarize, extract, publish), with Streamlit in bare mode.
+Each handler is timed, and its round trips, bytes on the wire and peak memory are recorded.
+
+Usage:
+    python benchmarks/e2e.py [--app ../streamlit-multipage-chat-pdf] [--iterations N] [--latency SECONDS]
+                             [--json PATH] [--baseline PATH] [--save-baseline PATH] [--tolerance 0.25]
+"""
+
+import argparse
+import glob
+import inspect
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+CORE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLES_DIR = os.path.dirname(CORE_DIR)
+
+# handler modules, in the order a user walks through the pages
+COMPONENT_ORDER = ["upload", "feed", "prompt", "summarize", "extract", "publish"]
+
+# arguments for the handlers, by parameter name
+ARGUMENTS = {
+    "uri": "https://example.com/sample.pdf",
+    "prompt": "What are the key topics discussed?",
+    "name": "https://example.com",
+    "identifier": "sample",
+    "owner": "graphlit",
+    "personal_access_token": "mock-token",
+    "account_name": "mockaccount",
+    "container_name": "mockcontainer",
+    "storage_key": "mock-key",
+    "prefix": None,
+    "summarization_prompt": "",
+    "description": "A person in front of a whiteboard.",
+    "voice": "mock-voice",
+    # feed groups: SharePoint (account name, library id, folder id) and OneDrive folder ids, by name
+    "targets": {
+        "Mock Library": ("mockaccount", "mock-library", None),
+        "Mock Library / Mock Folder": ("mockaccount", "mock-library", "mock-folder"),
+    },
+    "folders": {
+        "Mock Folder": "mock-folder",
+        "Mock Folder / Mock Subfolder": "mock-subfolder",
+    },
+}
+
+# selections normally made through the UI before a handler runs
+SESSION_DEFAULTS = {
+    "refresh_token": "mock-refresh-token",
+    "schema": '{"type": "object", "properties": {"title": {"type": "string"}}}',
+    "onedrive_folder_id": "mock-folder",
+    "onedrive_folder_name": "Mock Folder",
+    "sharepoint_account_name": "mockaccount",
+    "sharepoint_library_id": "mock-library",
+    "sharepoint_library_name": "Mock Library",
+    "sharepoint_folder_id": "mock-folder",
+    "sharepoint_folder_name": "Mock Folder",
+}
+
+STEP_METRICS = ["latency_p50", "round_trips", "bytes", "peak_memory"]
+
+# seconds
+LATENCY_NOISE = 0.005
+
+class UploadedFile:
+    """
+    Stand-in for Streamlit's `UploadedFile`.
+    """
+
+    def __init__(self, name, type, size):
+        self.name = name
+        self.type = type
+        self.data = bytes(i % 251 for i in range(size))
+
+    def getvalue(self):
+        return self.data
+
+def percentile(values, p):
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * len(ordered) + 0.5)) - 1))
+
+    return ordered[index]
+
+def discover_steps(app_dir):
+    import importlib
+
+    steps = []
+
+    for component in COMPONENT_ORDER:
+        if not os.path.exists(os.path.join(app_dir, "components", f"{component}.py")):
+            continue
+
+        module = importlib.import_module(f"components.{component}")
+
+        handlers = [
+            (name, func) for name, func in vars(module).items()
+            if inspect.iscoroutinefunction(func) and func.__module__ == module.__name__
+        ]
+
+        # definition order, e.g. list folders before creating the feed
+        handlers.sort(key=lambda item: item[1].__code__.co_firstlineno)
+
+        for name, func in handlers:
+            steps.append((f"{component}.{name}", func))
+
+    return steps
+
+def handler_arguments(func, upload_size):
+    from graphlit_api import SummarizationTypes
+
+    args = []
+
+    for name in inspect.signature(func).parameters:
+        if name == "uploaded_file":
+            args.append(UploadedFile("sample.pdf", "application/pdf", upload_size))
+        elif name == "uploaded_files":
+            args.append([UploadedFile("sample.pdf", "application/pdf", upload_size)])
+        elif name == "summarization_type":
+            args.append(SummarizationTypes.SUMMARY)
+        else:
+            args.append(ARGUMENTS.get(name, "sample"))
+
+    return args
+
+def reset_session(server):
+    import streamlit as st
+    from components import session_state
+    from graphlit_samples_core import listings, mock, ratelimit
+
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+    session_state.reset_session_state()
+
+    for key, value in SESSION_DEFAULTS.items():
+        st.session_state[key] = value
+
+    # every run starts cold: feeds take their polls again, listings are queried again rather than cached, and the
+    # rate limiters have their full bursts, as for a new session
+    server.reset_state()
+    listings.invalidate(SESSION_DEFAULTS["refresh_token"])
+    ratelimit.reset()
+
+    mock.connect(server)
+
+def wait_for_jobs(timeout=30.0):
+    """
+    Wait for the session's background jobs, e.g. a feed group's wait, so their round trips count towards the step
+    which started them rather than the next one.
+    """
+
+    from graphlit_samples_core import jobs
+
+    deadline = time.monotonic() + timeout
+
+    for name in list(jobs.session_jobs()):
+        job = jobs.get(name)
+
+        while job is not None and not job.done() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+def run_scenario(steps, server, upload_size, errors, trace_memory=False):
+    from graphlit_samples_core.runtime import run_async_task
+
+    results = {}
+
+    for name, func in steps:
+        args = handler_arguments(func, upload_size)
+
+        requests = sum(server.requests.values())
+        transferred = sum(server.bytes_sent.values()) + sum(server.bytes_received.values())
+        reported = len(errors)
+
+        if trace_memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        result = run_async_task(func, *args)
+        elapsed = time.perf_counter() - start
+
+        peak = None
+
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        wait_for_jobs()
+
+        # handlers either report through st.error, or return (..., error_message)
+        failed = len(errors) > reported or (isinstance(result, tuple) and isinstance(result[-1], str))
+
+        results[name] = {
+            "elapsed": elapsed,
+            "round_trips": sum(server.requests.values()) - requests,
+            "bytes": sum(server.bytes_sent.values()) + sum(server.bytes_received.values()) - transferred,
+            "peak_memory": peak,
+            "failed": failed,
+        }
+
+    return results
+
+def run_app(app_dir, iterations, latency, upload_size, seed):
+    """
+    Benchmark one app, in this interpreter.
+    """
+
+    import logging
+    import warnings
+
+    warnings.filterwarnings("ignore")
+    logging.disable(logging.WARNING)
+
+    sys.path.insert(0, app_dir)
+    sys.path.insert(1, CORE_DIR)
+    os.chdir(app_dir)
+
+    import streamlit as st
+    from graphlit_samples_core import feeds
+    from graphlit_samples_core.mock import MockGraphlit
+
+    errors = []
+    st.error = lambda body, *args, **kwargs: errors.append(str(body))
+
+    # the mock finishes feeds after one poll; don't wait for a real feed to start
+    feeds.INITIAL_DELAY = 0
+    feeds.POLL_INTERVAL = latency
+
+    server = MockGraphlit(latency=latency, seed=seed)
+
+    steps = discover_steps(app_dir)
+
+    # warm up lazy imports and the mock's model lookups, so the first timed run isn't an outlier
+    reset_session(server)
+    run_scenario(steps, server, upload_size, [])
+    server.reset()
+
+    runs = []
+
+    for _ in range(iterations):
+        reset_session(server)
+        runs.append(run_scenario(steps, server, upload_size, errors))
+
+    # separate pass for memory, as tracing slows down the timed runs
+    reset_session(server)
+    traced = run_scenario(steps, server, upload_size, errors, trace_memory=True)
+
+    report = {}
+
+    for name, _ in steps:
+        latencies = [run[name]["elapsed"] for run in runs]
+
+        report[name] = {
+            "latency_p50": percentile(latencies, 50),
+            "latency_p95": percentile(latencies, 95),
+            "latency_p99": percentile(latencies, 99),
+            "latency_mean": statistics.mean(latencies),
+            "round_trips": statistics.median(run[name]["round_trips"] for run in runs),
+            "bytes": statistics.median(run[name]["bytes"] for run in runs),
+            "peak_memory": traced[name]["peak_memory"],
+            "failures": sum(1 for run in runs if run[name]["failed"]),
+        }
+
+    return {"steps": report, "operations": server.stats(), "errors": sorted(set(errors))}
+
+def list_apps():
+    return sorted(path for path in glob.glob(os.path.join(SAMPLES_DIR, "streamlit-multipage-*")) if os.path.isdir(path))
+
+def benchmark_app(app_dir, args):
+    process = subprocess.run(
+        [
+            sys.executable, os.path.abspath(__file__), "--child", app_dir,
+            "--iterations", str(args.iterations),
+            "--latency", str(args.latency),
+            "--upload-size", str(args.upload_size),
+            "--seed", str(args.seed),
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    if process.returncode != 0:
+        return {"error": process.stderr.strip().splitlines()[-1] if process.stderr.strip() else f"exit code {process.returncode}"}
+
+    return json.loads(process.stdout)
+
+def compare(results, baseline, tolerance):
+    """
+    Compare step metrics with a baseline.
+
+    Returns:
+    A list of regressions, as (app, step, metric, baseline value, current value).
+    """
+
+    regressions = []
+
+    for app, result in results["apps"].items():
+        if "error" in result and "steps" in baseline.get("apps", {}).get(app, {}):
+            # an app which ran before and now fails to run regressed as a whole
+            regressions.append((app, "*", "error", None, result["error"]))
+            continue
+
+        for step, metrics in result.get("steps", {}).items():
+            previous = baseline.get("apps", {}).get(app, {}).get("steps", {}).get(step)
+
+            if previous is None:
+                continue
+
+            for metric in STEP_METRICS:
+                before, after = previous.get(metric), metrics.get(metric)
+
+                if before is None or after is None:
+                    continue
+
+                # round trips are deterministic against the mock, so any increase is a regression;
+                # millisecond latencies are within timer noise, so allow at least LATENCY_NOISE on top
+                if metric == "round_trips":
+                    allowed = before
+                elif metric.startswith("latency"):
+                    allowed = max(before * (1 + tolerance), before + LATENCY_NOISE)
+                else:
+                    allowed = before * (1 + tolerance)
+
+                if after > allowed:
+                    regressions.append((app, step, metric, before, after))
+
+    return regressions
+
+def format_value(metric, value):
+    if value is None:
+        return "-"
+
+    if metric.startswith("latency"):
+        return f"{value * 1000:.1f} ms"
+
+    if metric in ("bytes", "peak_memory"):
+        return f"{value / 1024:.1f} KiB"
+
+    return f"{value:g}"
+
+def print_report(results):
+    for app, result in results["apps"].items():
+        print(app)
+
+        if "error" in result:
+            print(f"    failed: {result['error']}")
+            continue
+
+        for step, metrics in result["steps"].items():
+            failures = f", {metrics['failures']} failed" if metrics["failures"] else ""
+
+            print(
+                f"    {step:<40} p50 {format_value('latency', metrics['latency_p50']):>10}  p95 {format_value('latency', metrics['latency_p95']):>10}"
+                f"  {metrics['round_trips']:g} round trips  {format_value('bytes', metrics['bytes']):>11}"
+                f"  peak {format_value('peak_memory', metrics['peak_memory']):>11}{failures}"
+            )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the sample applications end to end against the mock Graphlit API.")
+    parser.add_argument("--app", action="append", default=None, help="Sample application folder. Repeatable; defaults to all samples.")
+    parser.add_argument("--iterations", type=int, default=5, help="Timed runs of each app's workflow.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock API latency per request, in seconds.")
+    parser.add_argument("--upload-size", type=int, default=256 * 1024, help="Size of uploaded files, in bytes.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the mock API.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Write results as JSON to this path.")
+    parser.add_argument("--baseline", default=None, help="Compare with a baseline written by --save-baseline.")
+    parser.add_argument("--save-baseline", default=None, help="Write results as the new baseline to this path.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative increase in latency, bytes and memory over the baseline.")
+    parser.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        json.dump(run_app(args.child, args.iterations, args.latency, args.upload_size, args.seed), sys.stdout)
+        return 0
+
+    apps = [os.path.abspath(app) for app in args.app] if args.app else list_apps()
+
+    results = {
+        "config": {"iterations": args.iterations, "latency": args.latency, "upload_size": args.upload_size, "seed": args.seed},
+        "apps": {os.path.basename(app): benchmark_app(app, args) for app in apps},
+    }
+
+    print_report(results)
+
+    for path in [args.json_path, args.save_baseline]:
+        if path:
+            with open(path, "w") as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.tolerance)
+
+        for app, step, metric, before, after in regressions:
+            print(f"REGRESSION {app} {step} {metric}: {format_value(metric, before)} -> {format_value(metric, after)}")
+
+        if regressions:
+            return 1
+
+        print(f"No regressions against {args.baseline}.")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
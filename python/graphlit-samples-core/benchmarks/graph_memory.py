@@ -0,0 +1,83 @@
+"""
+Memory and conversion time of a contents graph as returned by the API (a pydantic object per node and per edge),
+and as a `columnar.ColumnarGraph`.
+
+Sizes are measured with `tracemalloc`, as the memory still allocated once the other representation is gone.
+
+Usage:
+    python benchmarks/graph_memory.py [--contents N] [--observables N] [--edges-per-content N] [--json PATH]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy  # noqa: F401 - imported up front, so its own allocations aren't counted
+
+from graphlit_samples_core.columnar import ColumnarGraph
+from graphlit_samples_core.mock import synthetic
+
+def measure(contents, observables, edges_per_content):
+    data = synthetic.contents_graph_dict(contents, observables, edges_per_content)
+
+    from graphlit_api import QueryContentsGraphContentsGraph
+
+    gc.collect()
+    tracemalloc.start()
+
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    graph = QueryContentsGraphContentsGraph.model_validate(data)
+    del data
+    gc.collect()
+
+    pydantic_bytes = tracemalloc.get_traced_memory()[0] - baseline
+
+    start = time.perf_counter()
+    columnar = ColumnarGraph.from_graph(graph)
+    seconds = time.perf_counter() - start
+
+    # the columns keep only the strings they need from the API models
+    del graph
+    gc.collect()
+
+    columnar_bytes = tracemalloc.get_traced_memory()[0] - baseline
+
+    tracemalloc.stop()
+
+    return {
+        "nodes": columnar.node_count,
+        "edges": columnar.edge_count,
+        "pydantic_bytes": pydantic_bytes,
+        "columnar_bytes": columnar_bytes,
+        "ratio": pydantic_bytes / columnar_bytes,
+        "convert_seconds": seconds,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the memory of pydantic and columnar contents graphs.")
+    parser.add_argument("--contents", type=int, default=10000, help="Content nodes.")
+    parser.add_argument("--observables", type=int, default=40000, help="Observable nodes.")
+    parser.add_argument("--edges-per-content", type=int, default=20, help="Edges from each content node.")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    result = measure(args.contents, args.observables, args.edges_per_content)
+
+    print(f"{result['nodes']} nodes, {result['edges']} edges")
+    print(f"{'pydantic':<10}{result['pydantic_bytes'] / 1024 / 1024:>10.1f} MiB{result['pydantic_bytes'] / result['nodes']:>10.0f} bytes/node")
+    print(f"{'columnar':<10}{result['columnar_bytes'] / 1024 / 1024:>10.1f} MiB{result['columnar_bytes'] / result['nodes']:>10.0f} bytes/node")
+    print(f"{result['ratio']:.1f}x smaller, converted in {result['convert_seconds']:.2f} s")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+if __name__ == "__main__":
+    main()
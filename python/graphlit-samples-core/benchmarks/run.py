@@ -0,0 +1,166 @@
+"""
+Benchmarks for the hot paths shared by all the sample applications.
+
+Usage:
+    python benchmarks/run.py [--filter NAME] [--repeat N] [--json PATH]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graphlit_samples_core import citations, graph, graph_analytics
+from graphlit_samples_core.columnar import ColumnarGraph
+from graphlit_samples_core.graph_search import InvertedIndex
+from graphlit_samples_core.mock import synthetic
+
+BENCHMARKS = {}
+
+def benchmark(name):
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+@benchmark("graph.parse_metadata")
+def bench_parse_metadata():
+    g = synthetic.contents_graph(contents=1000, observables=0, edges_per_content=0)
+
+    def run():
+        for node in g.nodes:
+            graph.parse_metadata(node.metadata)
+            graph.parse_label(node.metadata)
+            graph.parse_title(node.metadata)
+
+    return run
+
+@benchmark("graph.create_pyvis_graph[small]")
+def bench_pyvis_small():
+    g = synthetic.contents_graph(contents=20, observables=80, edges_per_content=5)
+
+    return lambda: graph.create_pyvis_graph(g)
+
+@benchmark("graph.create_pyvis_graph[medium]")
+def bench_pyvis_medium():
+    g = synthetic.contents_graph(contents=100, observables=400, edges_per_content=8)
+
+    return lambda: graph.create_pyvis_graph(g)
+
+@benchmark("graph.generate_graph_html[medium]")
+def bench_graph_html_medium():
+    g = graph.create_pyvis_graph(synthetic.contents_graph(contents=100, observables=400, edges_per_content=8))
+
+    return lambda: graph.generate_graph_html(g)
+
+@benchmark("columnar.from_graph[medium]")
+def bench_columnar_medium():
+    g = synthetic.contents_graph(contents=100, observables=400, edges_per_content=8)
+
+    return lambda: ColumnarGraph.from_graph(g)
+
+@benchmark("columnar.compact[medium]")
+def bench_columnar_compact_medium():
+    g = ColumnarGraph.from_graph(synthetic.contents_graph(contents=100, observables=400, edges_per_content=8))
+
+    return lambda: g.compact()
+
+@benchmark("graph_search.update[large]")
+def bench_search_index_large():
+    g = ColumnarGraph.from_graph(synthetic.contents_graph(contents=2000, observables=8000, edges_per_content=20))
+
+    def run():
+        InvertedIndex().update(g)
+
+    return run
+
+@benchmark("graph_search.search[large]")
+def bench_search_large():
+    g = ColumnarGraph.from_graph(synthetic.contents_graph(contents=2000, observables=8000, edges_per_content=20))
+
+    index = InvertedIndex()
+    index.update(g)
+
+    def run():
+        for query in ("e", "en", "ent", "entity", "entity 1", "entity 12", "entity 123"):
+            index.search(query)
+
+    return run
+
+@benchmark("graph_analytics.analyze[large]")
+def bench_analytics_large():
+    g = ColumnarGraph.from_graph(synthetic.contents_graph(contents=5000, observables=20000, edges_per_content=20))
+
+    return lambda: graph_analytics.GraphAnalytics(g)
+
+@benchmark("graph_analytics.analyze[large, cached]")
+def bench_analytics_large_cached():
+    g = ColumnarGraph.from_graph(synthetic.contents_graph(contents=5000, observables=20000, edges_per_content=20))
+
+    def run():
+        analytics = graph_analytics.analyze(g)
+        analytics.top_entities("PERSON")
+        analytics.top_entities("ORGANIZATION")
+
+    return run
+
+@benchmark("citations.select_emoji")
+def bench_select_emoji():
+    types = [("FILE", "DOCUMENT"), ("PAGE", None), ("FILE", None), ("EMAIL", None)] * 250
+
+    def run():
+        for content_type, file_type in types:
+            citations.select_emoji(content_type, file_type)
+            citations.index_to_emoji(7)
+
+    return run
+
+def measure(setup, repeat):
+    run = setup()
+
+    # warm up caches and lazy imports
+    run()
+
+    timings = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+
+    return {
+        "repeat": repeat,
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the graphlit-samples-core benchmarks.")
+    parser.add_argument("--filter", default=None, help="Only run benchmarks whose name contains this string.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write results as JSON to this path.")
+    args = parser.parse_args(argv)
+
+    results = {}
+
+    for name, setup in BENCHMARKS.items():
+        if args.filter and args.filter not in name:
+            continue
+
+        results[name] = measure(setup, args.repeat)
+
+        print(f"{name:<40} median {results[name]['median'] * 1000:9.2f} ms   min {results[name]['min'] * 1000:9.2f} ms")
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Cold start profiler for the Streamlit sample pages.
+
+Runs each page script in a fresh interpreter (Streamlit bare mode, no server) under `python -X importtime`,
+and reports the time to finish the script, i.e. first paint, with the import time broken down by top-level package.
+
+Usage:
+    python benchmarks/startup.py ../streamlit-multipage-files-graph [--page Start_Here.py] [--top 10] [--repeat N] [--json PATH]
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+CORE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# executed in the child interpreter; markers delimit the page's own imports from interpreter startup
+RUNNER = """
+import logging, runpy, sys, time, warnings
+warnings.filterwarnings("ignore")
+logging.disable(logging.WARNING)
+sys.stderr.write("#startup-begin\\n")
+start = time.perf_counter()
+error = None
+try:
+    runpy.run_path(sys.argv[1], run_name="__main__")
+except BaseException as e:
+    error = f"{type(e).__name__}: {e}"
+elapsed = time.perf_counter() - start
+sys.stderr.write("#startup-end\\n")
+sys.stderr.write("#startup-result " + repr((elapsed, error)) + "\\n")
+"""
+
+IMPORT_TIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)$")
+
+def list_pages(app_dir):
+    pages = [os.path.join(app_dir, "Start_Here.py")]
+    pages += sorted(glob.glob(os.path.join(app_dir, "pages", "*.py")))
+
+    return [page for page in pages if os.path.exists(page)]
+
+def profile_page(app_dir, page):
+    """
+    Run one page in a fresh interpreter.
+
+    Returns:
+    The elapsed seconds for the page script, any exception it raised, and the self import time in seconds per module.
+    """
+
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([app_dir, CORE_DIR] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []))
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", RUNNER, page],
+        cwd=app_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    modules = {}
+    elapsed, error = None, None
+    inside = False
+
+    for line in process.stderr.splitlines():
+        if line == "#startup-begin":
+            inside = True
+        elif line == "#startup-end":
+            inside = False
+        elif line.startswith("#startup-result "):
+            elapsed, error = ast.literal_eval(line[len("#startup-result "):])
+        elif inside:
+            match = IMPORT_TIME.match(line)
+
+            if match is not None:
+                modules[match.group(4)] = int(match.group(1)) / 1e6
+
+    if elapsed is None:
+        raise RuntimeError(f"Profiling {page} failed:\n{process.stderr[-2000:]}")
+
+    return elapsed, error, modules
+
+def by_package(modules):
+    packages = {}
+
+    for name, seconds in modules.items():
+        package = name.split(".")[0]
+        packages[package] = packages.get(package, 0.0) + seconds
+
+    return dict(sorted(packages.items(), key=lambda item: item[1], reverse=True))
+
+def profile_app(app_dir, pages=None, repeat=1):
+    results = {}
+
+    for page in pages or list_pages(app_dir):
+        page_path = page if os.path.isabs(page) else os.path.join(app_dir, page)
+
+        runs = [profile_page(app_dir, page_path) for _ in range(repeat)]
+
+        # report the breakdown of the median run
+        runs.sort(key=lambda run: run[0])
+        elapsed, error, modules = runs[len(runs) // 2]
+
+        results[os.path.relpath(page_path, app_dir)] = {
+            "elapsed": statistics.median(run[0] for run in runs),
+            "imports": sum(modules.values()),
+            "error": error,
+            "packages": by_package(modules),
+        }
+
+    return results
+
+def print_report(results, top):
+    for page, result in results.items():
+        print(f"{page:<50} {result['elapsed'] * 1000:8.1f} ms   (imports {result['imports'] * 1000:.1f} ms)")
+
+        if result["error"]:
+            print(f"    raised {result['error']}")
+
+        for package, seconds in list(result["packages"].items())[:top]:
+            print(f"    {package:<46} {seconds * 1000:8.1f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the cold start import time of a sample application's pages.")
+    parser.add_argument("app_dir", help="Sample application folder, e.g. ../streamlit-multipage-files-graph.")
+    parser.add_argument("--page", action="append", default=None, help="Page to profile, relative to the app folder. Repeatable; defaults to all pages.")
+    parser.add_argument("--top", type=int, default=10, help="Packages to list per page.")
+    parser.add_argument("--repeat", type=int, default=1, help="Fresh interpreter runs per page; the median is reported.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write results as JSON to this path.")
+    args = parser.parse_args(argv)
+
+    results = profile_app(os.path.abspath(args.app_dir), args.page, args.repeat)
+
+    print_report(results, args.top)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+    return results
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Bulk ingestion against a rate-limited mock Graphlit API, with and without the adaptive rate limiters.
+
+Concurrent `ingestUri` requests are sent to a `MockGraphlit` which throttles above `--rate-limit` requests per second.
+Both runs retry throttled requests (`retry`); the paced run also goes through `ratelimit`.
+Reports the wall time, throughput, 429 responses and requests which failed after their retries.
+
+Usage:
+    python benchmarks/throttling.py [--files N] [--rate-limit RPS] [--latency SECONDS] [--json PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from graphlit import Graphlit
+from graphlit_samples_core import ratelimit, retry
+from graphlit_samples_core.mock.server import MOCK_API_URI, MockGraphlit
+
+async def ingest_all(graphlit, files):
+    results = await asyncio.gather(
+        *[graphlit.client.ingest_uri(uri=f"https://example.com/file-{i}.pdf", is_synchronous=False) for i in range(files)],
+        return_exceptions=True,
+    )
+
+    return sum(1 for result in results if isinstance(result, Exception))
+
+def run(paced, files, rate_limit, latency):
+    server = MockGraphlit(latency=latency, rate_limit=rate_limit)
+
+    graphlit = Graphlit(organization_id="mock-organization", environment_id="mock-environment", jwt_secret="mock-secret", api_uri=MOCK_API_URI)
+    server.install(graphlit)
+
+    # fresh limiters and breakers, so the runs don't share what they learned
+    ratelimit._limiters.clear()
+    retry._breakers.clear()
+
+    if paced:
+        ratelimit.install(graphlit)
+
+    retry.install(graphlit, retry.RetryPolicy(max_attempts=5))
+
+    start = time.perf_counter()
+    failed = asyncio.run(ingest_all(graphlit, files))
+    elapsed = time.perf_counter() - start
+
+    stats = server.stats().get("IngestUri", {})
+
+    return {
+        "paced": paced,
+        "files": files,
+        "seconds": elapsed,
+        "files_per_second": (files - failed) / elapsed,
+        "requests": stats.get("requests", 0),
+        "throttled": stats.get("throttled", 0),
+        "failed": failed,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark bulk ingestion against a throttling mock API.")
+    parser.add_argument("--files", type=int, default=200, help="Files to ingest concurrently.")
+    parser.add_argument("--rate-limit", type=float, default=10.0, help="Requests per second the mock API allows.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock API latency, in seconds.")
+    parser.add_argument("--json", default=None, help="Write results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    results = [run(paced, args.files, args.rate_limit, args.latency) for paced in (False, True)]
+
+    print(f"{'Rate limiter':<14}{'Seconds':>10}{'Files/s':>10}{'Requests':>10}{'429s':>8}{'Failed':>8}")
+
+    for result in results:
+        print(f"{'on' if result['paced'] else 'off':<14}{result['seconds']:>10.2f}{result['files_per_second']:>10.2f}{result['requests']:>10}{result['throttled']:>8}{result['failed']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Shared core for the Graphlit sample applications.
+
+Each Streamlit sample keeps its own pages and components, and imports the common
+async runtime, Graphlit client plumbing, ingestion, feed polling, citation and
+knowledge graph rendering helpers from here.
+"""
+
+__version__ = "0.1.0"
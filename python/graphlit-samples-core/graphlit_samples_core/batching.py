@@ -0,0 +1,281 @@
+import asyncio
+import json
+import re
+
+# operation name of merged documents, followed by the names of the merged operations, e.g. Batch_DeleteFeed_CreateFeed
+BATCH_PREFIX = "Batch_"
+
+MAX_BATCH_SIZE = 20
+
+# operations always sent on their own: ingestion carries file payloads, which would serialize into one large document,
+# and prompts are timed per model
+UNBATCHED_OPERATIONS = ("Ingest", "Prompt")
+
+OPERATION_HEADER = re.compile(r"^\s*(query|mutation)\s+(\w+)\s*(?:\((.*?)\))?\s*\{", re.S)
+
+VARIABLE = re.compile(r"\$(\w+)")
+
+ALIAS = re.compile(r"b\d+_")
+
+def alias_prefix(index):
+    return f"b{index}_"
+
+def split_operation(query):
+    """
+    Returns:
+    The operation type, name, variable definitions and selection set of a single-operation GraphQL document,
+    or None if it can't be merged (e.g. it uses fragments).
+    """
+
+    if "fragment " in query:
+        return None
+
+    match = OPERATION_HEADER.match(query)
+
+    if match is None:
+        return None
+
+    kind, name, definitions = match.groups()
+
+    return kind, name, definitions or "", query[match.end():query.rindex("}")]
+
+def alias_root_fields(selection, prefix):
+    """
+    Prefix the response key of every root field in a selection set, e.g. `feed(id: $id) {...}`
+    becomes `b0_feed: feed(id: $id) {...}`.
+    """
+
+    result = []
+    depth = 0
+    aliased = False
+    i = 0
+
+    while i < len(selection):
+        ch = selection[i]
+
+        if ch in "({[":
+            depth += 1
+        elif ch in ")}]":
+            depth -= 1
+        elif depth == 0 and (ch.isalpha() or ch == "_"):
+            end = i
+
+            while end < len(selection) and (selection[end].isalnum() or selection[end] == "_"):
+                end += 1
+
+            name = selection[i:end]
+            is_alias = selection[end:].lstrip().startswith(":")
+
+            if is_alias:
+                # already aliased, e.g. `result: feed(...)`; prefix the alias and keep the field
+                result.append(prefix + name)
+                aliased = True
+            elif aliased:
+                result.append(name)
+                aliased = False
+            else:
+                result.append(f"{prefix}{name}: {name}")
+
+            i = end
+            continue
+
+        result.append(ch)
+        i += 1
+
+    return "".join(result)
+
+def merge_operations(kind, operations):
+    """
+    Merge operations of the same type into one document, renaming their variables and aliasing their root fields
+    by position.
+
+    Args:
+    kind (str): `"query"` or `"mutation"`.
+    operations (list): (name, variable definitions, selection set, variables) of each operation.
+
+    Returns:
+    The merged document, its operation name and its variables.
+    """
+
+    definitions = []
+    selections = []
+    variables = {}
+
+    for index, (name, operation_definitions, selection, operation_variables) in enumerate(operations):
+        prefix = alias_prefix(index)
+        rename = lambda match: f"${prefix}{match.group(1)}"
+
+        if operation_definitions.strip():
+            definitions.append(VARIABLE.sub(rename, operation_definitions.strip()))
+
+        selections.append(alias_root_fields(VARIABLE.sub(rename, selection), prefix))
+
+        for key, value in (operation_variables or {}).items():
+            variables[prefix + key] = value
+
+    operation_name = BATCH_PREFIX + "_".join(name for name, _, _, _ in operations)
+    arguments = f"({', '.join(definitions)})" if definitions else ""
+
+    query = f"{kind} {operation_name}{arguments} {{\n" + "\n".join(selection.strip() for selection in selections) + "\n}\n"
+
+    return query, operation_name, variables
+
+def merged_operations(operation_name, variables):
+    """
+    Returns:
+    The name and variables of each operation of a document merged by `merge_operations`, in order,
+    or just the operation itself if it isn't a merged document.
+    """
+
+    if not operation_name.startswith(BATCH_PREFIX):
+        return [(operation_name, variables or {})]
+
+    return [
+        (name, {key[len(alias_prefix(index)):]: value for key, value in (variables or {}).items() if key.startswith(alias_prefix(index))})
+        for index, name in enumerate(operation_name[len(BATCH_PREFIX):].split("_"))
+    ]
+
+def split_response(data, errors, index):
+    """
+    Returns:
+    The response body of the operation at `index` of a merged document.
+    """
+
+    prefix = alias_prefix(index)
+
+    body = {"data": {key[len(prefix):]: value for key, value in (data or {}).items() if key.startswith(prefix)} or None}
+
+    operation_errors = []
+
+    for error in errors or []:
+        path = error.get("path") or []
+
+        if not path or not ALIAS.match(str(path[0])):
+            # not tied to a merged field, so every operation failed
+            operation_errors.append(error)
+        elif path[0].startswith(prefix):
+            operation_errors.append(dict(error, path=[path[0][len(prefix):]] + list(path[1:])))
+
+    if operation_errors:
+        body["errors"] = operation_errors
+
+    return body
+
+class Batcher:
+    """
+    Coalesces concurrent requests of a `graphlit.Graphlit` client into one round trip.
+
+    Operations started in the same event loop iteration, e.g. with `asyncio.gather`, are merged into a single
+    GraphQL document per operation type, with aliased root fields and renamed variables, and the response is split
+    back into one response per operation. The generated client methods parse those as usual, so callers see the same
+    results and exceptions as unbatched calls, in call order.
+
+    Mutations in a document run one after another, so merged mutations behave as if sent sequentially,
+    but they can't depend on each other's results.
+    Operations awaited one at a time, and `UNBATCHED_OPERATIONS`, are sent as before.
+    """
+
+    def __init__(self, client, max_batch_size=MAX_BATCH_SIZE):
+        self.client = client
+        self.execute_one = client.execute
+        self.max_batch_size = max_batch_size
+        self.pending = {}
+
+    async def execute(self, query, operation_name=None, variables=None, **kwargs):
+        operation = split_operation(query)
+
+        # requests with extra options, e.g. headers, are sent as they are
+        if operation is None or kwargs or operation[1].startswith(UNBATCHED_OPERATIONS):
+            return await self.execute_one(query=query, operation_name=operation_name, variables=variables, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        pending = self.pending.setdefault(loop, [])
+
+        if not pending:
+            # the flush task runs after the callers already scheduled in this iteration have queued their operations
+            loop.create_task(self.flush(loop))
+
+        pending.append((query, operation, variables, future))
+
+        return await future
+
+    async def flush(self, loop):
+        # callers gathering in nested tasks queue a loop iteration later, so wait until no more arrive
+        queued = -1
+
+        while queued != len(self.pending[loop]):
+            queued = len(self.pending[loop])
+            await asyncio.sleep(0)
+
+        pending = self.pending.pop(loop)
+
+        groups = {}
+
+        for item in pending:
+            groups.setdefault(item[1][0], []).append(item)
+
+        batches = []
+
+        for kind, items in groups.items():
+            for start in range(0, len(items), self.max_batch_size):
+                batches.append((kind, items[start:start + self.max_batch_size]))
+
+        await asyncio.gather(*[self.send(kind, items) for kind, items in batches])
+
+    async def send(self, kind, items):
+        import httpx
+
+        try:
+            if len(items) == 1:
+                query, (_, name, _, _), variables, future = items[0]
+
+                response = await self.execute_one(query=query, operation_name=name, variables=variables)
+
+                if not future.done():
+                    future.set_result(response)
+                return
+
+            query, operation_name, variables = merge_operations(
+                kind, [(name, definitions, selection, variables) for _, (_, name, definitions, selection), variables, _ in items]
+            )
+
+            response = await self.execute_one(query=query, operation_name=operation_name, variables=variables)
+        except Exception as e:
+            for _, _, _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        try:
+            body = response.json() if response.is_success else None
+        except ValueError:
+            body = None
+
+        for index, (_, _, _, future) in enumerate(items):
+            if future.done():
+                continue
+
+            if not isinstance(body, dict):
+                # HTTP or invalid response errors apply to every operation
+                future.set_result(response)
+            else:
+                future.set_result(httpx.Response(
+                    response.status_code,
+                    headers={"Content-Type": "application/json"},
+                    content=json.dumps(split_response(body.get("data"), body.get("errors"), index)).encode("utf-8"),
+                    request=response.request,
+                ))
+
+def install(graphlit):
+    """
+    Coalesce concurrent requests of a `graphlit.Graphlit` client, see `Batcher`.
+    """
+
+    client = graphlit.client
+
+    if not isinstance(getattr(client.execute, "__self__", None), Batcher):
+        client.execute = Batcher(client).execute
+
+    return graphlit
@@ -0,0 +1,172 @@
+import asyncio
+import os
+import streamlit as st
+from typing import Optional, TYPE_CHECKING
+from graphlit_samples_core import batching, ratelimit, retry, runtime, tracing
+from graphlit_samples_core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    from graphlit import Graphlit
+    from graphlit_api import WorkflowInput, SpecificationInput, ConversationInput, FeedInput
+
+# loaded on first use, so pages which only render forms (e.g. Start_Here) don't pay for the generated API models
+graphlit_sdk = lazy_import("graphlit")
+graphlit_api = lazy_import("graphlit_api")
+
+def connect(organization_id, environment_id, jwt_secret, api_uri=None) -> "Graphlit":
+    """
+    Create the Graphlit client for this session, and store it in session state.
+
+    The API endpoint can be overridden with `api_uri`, or the `GRAPHLIT_API_URI` environment variable,
+    e.g. to run a sample against the standalone mock server.
+
+    The client is set up with `instrument`.
+    """
+
+    graphlit = graphlit_sdk.Graphlit(organization_id=organization_id, environment_id=environment_id, jwt_secret=jwt_secret, api_uri=api_uri if api_uri is not None else os.getenv("GRAPHLIT_API_URI"))
+
+    instrument(graphlit)
+
+    st.session_state['graphlit'] = graphlit
+    st.session_state['token'] = graphlit.token
+
+    return graphlit
+
+def instrument(graphlit: "Graphlit") -> "Graphlit":
+    """
+    Set up a Graphlit client's requests: connections are pooled per event loop (`runtime`), each request is recorded
+    by the process-wide tracer (`tracing`), paced by the process-wide rate limiters (`ratelimit`), transient failures
+    are retried behind a circuit breaker (`retry`), and concurrent requests are merged into one round trip
+    (`batching`).
+
+    Call again after replacing the client's `http_client`.
+    """
+
+    runtime.install(graphlit)
+    tracing.instrument(graphlit)
+    ratelimit.install(graphlit)
+    retry.install(graphlit)
+    batching.install(graphlit)
+
+    return graphlit
+
+def get_graphlit() -> Optional["Graphlit"]:
+    return st.session_state['graphlit']
+
+async def create_workflow(input: "WorkflowInput"):
+    graphlit = get_graphlit()
+
+    try:
+        response = await graphlit.client.create_workflow(input)
+
+        st.session_state['workflow_id'] = response.create_workflow.id
+    except graphlit_api.GraphQLClientError as e:
+        return str(e)
+
+    return None
+
+async def create_specification(input: "SpecificationInput"):
+    graphlit = get_graphlit()
+
+    try:
+        response = await graphlit.client.create_specification(input)
+
+        st.session_state['specification_id'] = response.create_specification.id
+    except graphlit_api.GraphQLClientError as e:
+        return str(e)
+
+    return None
+
+async def create_conversation(input: "ConversationInput"):
+    graphlit = get_graphlit()
+
+    try:
+        response = await graphlit.client.create_conversation(input)
+
+        st.session_state['conversation_id'] = response.create_conversation.id
+    except graphlit_api.GraphQLClientError as e:
+        return str(e)
+
+    return None
+
+async def create_feed(input: "FeedInput"):
+    graphlit = get_graphlit()
+
+    try:
+        response = await graphlit.client.create_feed(input)
+
+        st.session_state['feed_id'] = response.create_feed.id
+    except graphlit_api.GraphQLClientError as e:
+        return str(e)
+
+    return None
+
+async def is_feed_done(feed_id):
+    graphlit = get_graphlit()
+
+    response = await graphlit.client.is_feed_done(feed_id)
+
+    return response.is_feed_done.result
+
+async def is_content_done(content_id):
+    graphlit = get_graphlit()
+
+    response = await graphlit.client.is_content_done(content_id)
+
+    return response.is_content_done.result
+
+async def delete_all_feeds():
+    graphlit = get_graphlit()
+
+    _ = await graphlit.client.delete_all_feeds(is_synchronous=True)
+
+async def delete_all_contents():
+    graphlit = get_graphlit()
+
+    _ = await graphlit.client.delete_all_contents(is_synchronous=True)
+
+async def delete_all_workflows():
+    graphlit = get_graphlit()
+
+    _ = await graphlit.client.delete_all_workflows(is_synchronous=True)
+
+async def delete_all_specifications():
+    graphlit = get_graphlit()
+
+    _ = await graphlit.client.delete_all_specifications(is_synchronous=True)
+
+async def delete_all_conversations():
+    graphlit = get_graphlit()
+
+    _ = await graphlit.client.delete_all_conversations(is_synchronous=True)
+
+async def delete_all_observables():
+    graphlit = get_graphlit()
+
+    # independent mutations, merged into one round trip
+    _ = await asyncio.gather(
+        graphlit.client.delete_all_persons(),
+        graphlit.client.delete_all_organizations(),
+        graphlit.client.delete_all_places(),
+        graphlit.client.delete_all_events(),
+        graphlit.client.delete_all_products(),
+        graphlit.client.delete_all_softwares(),
+        graphlit.client.delete_all_repos(),
+        graphlit.client.delete_all_labels(),
+        graphlit.client.delete_all_categories(),
+    )
+
+async def delete_all_data():
+    """
+    Delete all workflows, conversations, specifications, feeds, contents and observables in the project,
+    in one round trip.
+    """
+
+    _ = await asyncio.gather(
+        delete_all_workflows(),
+        delete_all_conversations(),
+        delete_all_specifications(),
+        delete_all_feeds(),
+        delete_all_contents(),
+        delete_all_observables(),
+    )
@@ -0,0 +1,329 @@
+import json
+import sys
+import uuid
+from graphlit_api import ContentTypes, EntityTypes, FileTypes
+from graphlit_samples_core.lazy import lazy_import
+
+# only loaded when a graph is converted
+np = lazy_import("numpy")
+
+# codes of the enum columns, by position; -1 is None
+ENTITY_TYPES = tuple(entity_type.name for entity_type in EntityTypes)
+CONTENT_TYPES = tuple(content_type.name for content_type in ContentTypes)
+FILE_TYPES = tuple(file_type.name for file_type in FileTypes)
+
+def enum_code(names, name):
+    return names.index(name) if name in names else -1
+
+class StringTable:
+    """
+    Interned strings: each distinct string is stored once, and referred to by its integer code.
+    """
+
+    def __init__(self):
+        self.values = []
+        self.codes = {}
+
+    def intern(self, value):
+        code = self.codes.get(value)
+
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+
+        return code
+
+    def code(self, value):
+        return self.codes.get(value, -1)
+
+    def __getitem__(self, code):
+        return self.values[code] if code >= 0 else None
+
+    def __len__(self):
+        return len(self.values)
+
+    def __contains__(self, value):
+        return value in self.codes
+
+class ColumnarGraph:
+    """
+    A knowledge graph in columns, instead of a pydantic object per node and per edge.
+
+    Nodes are numbered in the order they were added, and `ids` maps the Graphlit ids to those numbers. Labels and
+    relations are interned; entity, content and file types are small integer codes into `ENTITY_TYPES`,
+    `CONTENT_TYPES` and `FILE_TYPES`. Edges are three NumPy arrays: `sources` and `targets` (node numbers) and
+    `relations` (codes into the `relation_names` table).
+
+    Only the raw metadata of content nodes is kept as a string, since it's parsed for tooltips when rendered.
+
+    The graph only grows, by `merge`, which increments `version`, so `snapshot()` identifies what's in it.
+    """
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.version = 0
+
+        self.ids = StringTable()
+        self.strings = StringTable()
+        self.relation_names = StringTable()
+
+        self.labels = np.empty(0, dtype=np.int32)
+        self.types = np.empty(0, dtype=np.int8)
+        self.content_types = np.empty(0, dtype=np.int8)
+        self.file_types = np.empty(0, dtype=np.int8)
+        self.metadata = []
+
+        # nodes added as edge endpoints, whose typed record was merged later, in that order
+        self.upgraded = []
+
+        self.sources = np.empty(0, dtype=np.int32)
+        self.targets = np.empty(0, dtype=np.int32)
+        self.relations = np.empty(0, dtype=np.int16)
+
+    @classmethod
+    def from_graph(cls, graph):
+        columnar = cls()
+        columnar.merge(graph)
+
+        return columnar
+
+    def snapshot(self):
+        """
+        Returns:
+        An immutable key of the graph as it is now, e.g. to cache results computed from it.
+        """
+
+        return self.id, self.version, self.node_count, self.edge_count
+
+    @property
+    def node_count(self):
+        return len(self.ids)
+
+    @property
+    def edge_count(self):
+        return len(self.sources)
+
+    def merge(self, graph):
+        """
+        Add the nodes and edges of a graph returned by the API which aren't in this graph yet, e.g. the next page
+        of a paged query.
+
+        Returns:
+        The number of nodes and edges added.
+        """
+
+        labels = []
+        types = []
+        content_types = []
+        file_types = []
+        metadata = []
+
+        def describe(name, node_metadata):
+            # the label, content type and file type of a node
+            if node_metadata is None:
+                return name, None, None
+
+            o = json.loads(node_metadata)
+
+            for key in ("document", "video", "audio"):
+                if isinstance(o.get(key), dict) and "title" in o[key]:
+                    return o[key]["title"], o.get("type"), o.get("fileType")
+
+            return o.get("fileName") or name, o.get("type"), o.get("fileType")
+
+        def add_node(node_id, name, entity_type=None, node_metadata=None):
+            label, content_type, file_type = describe(name, node_metadata)
+
+            self.ids.intern(node_id)
+            labels.append(self.strings.intern(label))
+            types.append(enum_code(ENTITY_TYPES, entity_type))
+            content_types.append(enum_code(CONTENT_TYPES, content_type))
+            file_types.append(enum_code(FILE_TYPES, file_type))
+            metadata.append(node_metadata)
+
+        node_count = self.node_count
+        upgraded = len(self.upgraded)
+
+        for node in graph.nodes or []:
+            index = self.ids.code(node.id)
+            node_metadata = node.metadata if node.type == EntityTypes.CONTENT else None
+
+            if index < 0:
+                add_node(node.id, node.name, node.type.name, node_metadata)
+            elif index < len(self.types) and self.types[index] < 0:
+                # first seen as an edge endpoint, without a type
+                label, content_type, file_type = describe(node.name, node_metadata)
+
+                self.labels[index] = self.strings.intern(label)
+                self.types[index] = enum_code(ENTITY_TYPES, node.type.name)
+                self.content_types[index] = enum_code(CONTENT_TYPES, content_type)
+                self.file_types[index] = enum_code(FILE_TYPES, file_type)
+                self.metadata[index] = node_metadata
+
+                self.upgraded.append(index)
+
+        sources = []
+        targets = []
+        relations = []
+
+        for edge in graph.edges or []:
+            # ensure start and end vertex exist in graph
+            for node_id in (edge.from_, edge.to):
+                if node_id not in self.ids:
+                    add_node(node_id, node_id)
+
+            sources.append(self.ids.code(edge.from_))
+            targets.append(self.ids.code(edge.to))
+            relations.append(self.relation_names.intern(edge.relation))
+
+        self.labels = np.concatenate([self.labels, np.asarray(labels, dtype=np.int32)])
+        self.types = np.concatenate([self.types, np.asarray(types, dtype=np.int8)])
+        self.content_types = np.concatenate([self.content_types, np.asarray(content_types, dtype=np.int8)])
+        self.file_types = np.concatenate([self.file_types, np.asarray(file_types, dtype=np.int8)])
+        self.metadata.extend(metadata)
+
+        edge_count = self.edge_count
+
+        if sources:
+            self.add_edges(np.asarray(sources, dtype=np.int32), np.asarray(targets, dtype=np.int32), np.asarray(relations, dtype=np.int16))
+
+        if self.node_count > node_count or self.edge_count > edge_count or len(self.upgraded) > upgraded:
+            self.version += 1
+
+        return self.node_count - node_count, self.edge_count - edge_count
+
+    def add_edges(self, sources, targets, relations):
+        edges = np.empty(len(self.sources) + len(sources), dtype=[("source", np.int32), ("target", np.int32), ("relation", np.int16)])
+        edges["source"] = np.concatenate([self.sources, sources])
+        edges["target"] = np.concatenate([self.targets, targets])
+        edges["relation"] = np.concatenate([self.relations, relations])
+
+        # drop repeated edges, keeping the first of each in order
+        _, first = np.unique(edges, return_index=True)
+        edges = edges[np.sort(first)]
+
+        self.sources = np.ascontiguousarray(edges["source"])
+        self.targets = np.ascontiguousarray(edges["target"])
+        self.relations = np.ascontiguousarray(edges["relation"])
+
+    def node_id(self, index):
+        return self.ids[index]
+
+    def label(self, index):
+        return self.strings[int(self.labels[index])]
+
+    def entity_type(self, index):
+        code = int(self.types[index])
+
+        return ENTITY_TYPES[code] if code >= 0 else None
+
+    def degrees(self):
+        """
+        Returns:
+        The number of edges of each node, in and out, as an array indexed by node number.
+        """
+
+        return np.bincount(self.sources, minlength=self.node_count) + np.bincount(self.targets, minlength=self.node_count)
+
+    def neighborhood(self, nodes, hops=1):
+        """
+        Returns:
+        The given node numbers and the nodes up to `hops` edges away from them, in either direction, as a sorted array.
+        """
+
+        selected = np.zeros(self.node_count, dtype=bool)
+        selected[np.asarray(nodes, dtype=np.int64)] = True
+
+        for _ in range(hops):
+            reached = selected.copy()
+            reached[self.targets[selected[self.sources]]] = True
+            reached[self.sources[selected[self.targets]]] = True
+
+            selected = reached
+
+        return np.flatnonzero(selected)
+
+    def nbytes(self):
+        """
+        Returns:
+        The approximate memory used by the columns, in bytes, including the strings.
+        """
+
+        arrays = (self.labels, self.types, self.content_types, self.file_types, self.sources, self.targets, self.relations)
+
+        strings = sum(sys.getsizeof(value) for table in (self.ids, self.strings, self.relation_names) for value in table.values)
+        tables = sum(sys.getsizeof(table.values) + sys.getsizeof(table.codes) for table in (self.ids, self.strings, self.relation_names))
+        metadata = sys.getsizeof(self.metadata) + sum(sys.getsizeof(value) for value in self.metadata if value is not None)
+
+        return sum(array.nbytes for array in arrays) + strings + tables + metadata
+
+    def compact(self, nodes=None, highlight=None, edges=None):
+        """
+        Returns:
+        The graph, or the subgraph of the given node numbers, in the form of `graph.compact_graph`, for rendering,
+        with the `highlight` node numbers highlighted. The subgraph has the edges between its nodes, or the given
+        edge numbers.
+        """
+
+        from graphlit_samples_core.graph import parse_title
+
+        if nodes is None:
+            nodes = np.arange(self.node_count)
+            edges = np.arange(self.edge_count) if edges is None else edges
+        else:
+            nodes = np.asarray(nodes, dtype=np.int64)
+
+            if edges is None:
+                selected = np.zeros(self.node_count, dtype=bool)
+                selected[nodes] = True
+
+                edges = np.flatnonzero(selected[self.sources] & selected[self.targets])
+
+        compact_nodes = []
+
+        for index in nodes.tolist():
+            entity_type = self.entity_type(index)
+            content_type = int(self.content_types[index])
+            file_type = int(self.file_types[index])
+            node_id = self.ids[index]
+
+            title = parse_title(self.metadata[index])
+
+            if title is None:
+                # edge endpoints which weren't among the nodes have no type
+                title = f'{entity_type} [{node_id}]' if entity_type is not None else node_id
+
+            compact_nodes.append([
+                node_id,
+                self.label(index),
+                entity_type,
+                CONTENT_TYPES[content_type] if content_type >= 0 else None,
+                FILE_TYPES[file_type] if file_type >= 0 else None,
+                title,
+            ])
+
+        compact_edges = [
+            [self.ids[source], self.ids[target], self.relation_names[relation]]
+            for source, target, relation in zip(self.sources[edges].tolist(), self.targets[edges].tolist(), self.relations[edges].tolist())
+        ]
+
+        compact = {"nodes": compact_nodes, "edges": compact_edges}
+
+        if highlight is not None:
+            compact["highlight"] = [self.ids[index] for index in np.asarray(highlight).tolist()]
+
+        return compact
+
+    def compact_since(self, node_count, edge_count, upgraded=0):
+        """
+        Returns:
+        The nodes and edges added since the graph had `node_count` nodes, `edge_count` edges and `upgraded` upgraded
+        nodes, in the form of `compact`, e.g. to add them to a graph which is drawn already. `merge` appends nodes and
+        edges, so these are the ones numbered from those counts on, along with the nodes drawn before which got their
+        type since.
+        """
+
+        relabeled = [index for index in self.upgraded[upgraded:] if index < node_count]
+
+        return self.compact(np.concatenate([np.asarray(relabeled, dtype=np.int64), np.arange(node_count, self.node_count)]), edges=np.arange(edge_count, self.edge_count))
@@ -0,0 +1,116 @@
+import datetime
+import streamlit as st
+from graphlit_samples_core import performance, ratelimit
+
+# label, seconds
+WINDOWS = {
+    "Last 5 minutes": 300,
+    "Last 15 minutes": 900,
+    "Last hour": 3600,
+}
+
+def format_seconds(value):
+    if value is None:
+        return "-"
+
+    return f"{value * 1000:.0f} ms" if value < 1 else f"{value:.2f} s"
+
+def summary_row(label, name, summary):
+    return {
+        label: name,
+        "Requests": summary["count"],
+        "p50": format_seconds(summary.get("p50")),
+        "p95": format_seconds(summary.get("p95")),
+        "p99": format_seconds(summary.get("p99")),
+        "Mean": format_seconds(summary["mean"]),
+    }
+
+def render_dashboard(store=None):
+    """
+    Render the Performance page, from the timings collected by every session of this Streamlit server.
+    """
+
+    store = store if store is not None else performance.get_store()
+
+    st.markdown("Request timings across all sessions of this server, collected by `graphlit_samples_core.tracing`.  Percentiles are accurate to within 12.5%.")
+
+    col1, col2 = st.columns([3, 1])
+
+    with col1:
+        window_label = st.selectbox("Window:", options=list(WINDOWS.keys()), index=1)
+
+    with col2:
+        st.button("Refresh")
+
+    window = WINDOWS.get(window_label, 900)
+
+    st.subheader("GraphQL operations")
+
+    operations = store.summaries("graphql", window)
+
+    if not operations:
+        st.info("No requests yet. Timings appear here once the other pages call the Graphlit API.")
+    else:
+        rows = []
+
+        for operation, summary in operations.items():
+            row = summary_row("Operation", operation, summary)
+            row["Errors"] = store.error_count(operation, window)
+            rows.append(row)
+
+        st.dataframe(rows, hide_index=True)
+
+        selected = st.multiselect("Latency trend (p95):", options=list(operations.keys()), default=list(operations.keys())[:3])
+
+        if selected:
+            chart = {}
+
+            for operation in selected:
+                for start, summary in store.histogram("graphql", operation).series(window):
+                    timestamp = datetime.datetime.fromtimestamp(start)
+                    chart.setdefault(timestamp, {})[operation] = summary["p95"] * 1000
+
+            st.line_chart([dict(time=timestamp, **values) for timestamp, values in sorted(chart.items())], x="time", y=selected, y_label="p95 (ms)")
+
+    st.subheader("Ingestion")
+
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Files / min", f"{store.ingested_files.rate(window) * 60:.2f}")
+    col2.metric("Upload KiB / s", f"{store.ingested_bytes.rate(window) / 1024:.2f}")
+    col3.metric("Files ingested", store.ingested_files.total(window))
+
+    st.subheader("Feeds")
+
+    feed_waits = store.summaries("feed_wait", window)
+
+    if not feed_waits:
+        st.info("No feeds have finished in this window.")
+    else:
+        st.dataframe([summary_row("Feeds", "Wait until done" if name == "feeds" else f"Wait until done ({name})", summary) for name, summary in feed_waits.items()], hide_index=True)
+
+    st.subheader("LLM prompts")
+
+    prompts = store.summaries("prompt", window)
+
+    if not prompts:
+        st.info("No prompts in this window.")
+    else:
+        st.dataframe([summary_row("Model", model, summary) for model, summary in prompts.items()], hide_index=True)
+
+    st.subheader("Rate limits")
+
+    limiters = ratelimit.limiters()
+
+    if not limiters:
+        st.info("No requests have been paced yet.")
+    else:
+        st.dataframe([
+            {
+                "Operations": operation_class,
+                "Rate (req/s)": f"{stats['rate']:.2f}",
+                "Requests": stats["requests"],
+                "Throttled (429)": stats["throttled"],
+                "Waited": format_seconds(stats["waited"]),
+            }
+            for operation_class, stats in ((operation_class, limiter.stats()) for operation_class, limiter in sorted(limiters.items()))
+        ], hide_index=True)
@@ -0,0 +1,131 @@
+import asyncio
+import streamlit as st
+from graphlit_samples_core import client, tracing
+
+# seconds; module level so benchmarks against the mock server can shorten them
+INITIAL_DELAY = 5
+POLL_INTERVAL = 2
+
+# feeds created, deleted or polled at once, for a feed group
+CONCURRENCY = 8
+
+async def wait_for_feed(feed_id, initial_delay=None, interval=None):
+    """
+    Wait until a feed has finished ingesting.
+
+    Polls `isFeedDone` every `interval` seconds (default `POLL_INTERVAL`), after an `initial_delay`
+    (default `INITIAL_DELAY`) to let the feed start.
+    Sleeps on the event loop, rather than blocking the thread, between polls.
+    The wait is traced as a `feed.wait` span, so feed durations show on the Performance page.
+    """
+
+    with tracing.get_tracer().span("feed.wait", **{"graphlit.feed.id": feed_id}):
+        await asyncio.sleep(initial_delay if initial_delay is not None else INITIAL_DELAY)
+
+        while not await client.is_feed_done(feed_id):
+            await asyncio.sleep(interval if interval is not None else POLL_INTERVAL)
+
+class FeedGroup:
+    """
+    Feeds created together, e.g. one per SharePoint library or folder, tracked as one.
+
+    `feed_ids` are the created feeds, by name; `errors` the error messages of the feeds which couldn't be created, by
+    name; `done` the ids of the feeds which have finished ingesting.
+    """
+
+    def __init__(self):
+        self.feed_ids = {}
+        self.errors = {}
+        self.done = set()
+
+    def ids(self):
+        return list(self.feed_ids.values())
+
+    def finished(self):
+        return len(self.done) == len(self.feed_ids)
+
+async def gather_bounded(async_funcs, concurrency=CONCURRENCY):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(async_func):
+        async with semaphore:
+            return await async_func()
+
+    return await asyncio.gather(*(run(async_func) for async_func in async_funcs))
+
+async def create_feeds(inputs, concurrency=CONCURRENCY):
+    """
+    Create feeds from `FeedInput`s by name, `concurrency` at a time, e.g. to index a whole tenant's libraries in one
+    action.
+
+    Returns:
+    The `FeedGroup`, with the feeds which couldn't be created in its `errors`.
+    """
+
+    graphlit = client.get_graphlit()
+    group = FeedGroup()
+
+    async def create(name, input):
+        try:
+            response = await graphlit.client.create_feed(input)
+
+            group.feed_ids[name] = response.create_feed.id
+        except client.graphlit_api.GraphQLClientError as e:
+            group.errors[name] = str(e)
+
+    await gather_bounded([lambda name=name, input=input: create(name, input) for name, input in inputs.items()], concurrency)
+
+    return group
+
+async def delete_feeds(feed_ids, concurrency=CONCURRENCY):
+    graphlit = client.get_graphlit()
+
+    await gather_bounded([lambda feed_id=feed_id: graphlit.client.delete_feed(feed_id) for feed_id in feed_ids], concurrency)
+
+async def wait_for_group(group, initial_delay=None, interval=None):
+    """
+    Wait until every feed of a group has finished ingesting, like `wait_for_feed`, polling the unfinished feeds
+    concurrently and adding them to `group.done` as they finish.
+    The wait is traced as a `feed.wait_group` span, shown with the feed waits on the Performance page.
+    """
+
+    with tracing.get_tracer().span("feed.wait_group", **{"graphlit.feed.count": len(group.feed_ids)}):
+        await asyncio.sleep(initial_delay if initial_delay is not None else INITIAL_DELAY)
+
+        while not group.finished():
+            pending = [feed_id for feed_id in group.ids() if feed_id not in group.done]
+
+            results = await gather_bounded([lambda feed_id=feed_id: client.is_feed_done(feed_id) for feed_id in pending])
+
+            group.done.update(feed_id for feed_id, done in zip(pending, results) if done)
+
+            if not group.finished():
+                await asyncio.sleep(interval if interval is not None else POLL_INTERVAL)
+
+def render_group(group):
+    """
+    Show how many feeds of a group have finished, refreshed every `POLL_INTERVAL` seconds without rerunning the page
+    until they all have, and the feeds which couldn't be created.
+    """
+
+    for name, error in group.errors.items():
+        st.error(f"Failed to create feed [{name}]. {error}")
+
+    if not group.feed_ids:
+        return
+
+    if group.finished():
+        st.success(f"✅ All {len(group.feed_ids)} feeds have finished ingesting.")
+    else:
+        group_progress_fragment(group)
+
+@st.fragment(run_every=POLL_INTERVAL)
+def group_progress_fragment(group):
+    if group.finished():
+        # rerun the page, e.g. to reload the knowledge graph
+        st.rerun()
+
+    done = len(group.done)
+    total = len(group.feed_ids)
+
+    st.progress(done / total, text=f"⏳ {done} of {total} feeds have finished ingesting")
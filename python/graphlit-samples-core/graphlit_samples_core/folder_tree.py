@@ -0,0 +1,149 @@
+import asyncio
+import streamlit as st
+
+# folder levels listed below each root, in one wait
+CRAWL_DEPTH = 3
+
+# folder listings queried at once
+CRAWL_CONCURRENCY = 8
+
+# folder listings queried per crawl, so a huge drive doesn't take minutes
+MAX_LISTINGS = 200
+
+class FolderTree:
+    """
+    Folders of a SharePoint library or a OneDrive, by parent folder id; the top level's parent is None.
+
+    Folders which are in `children` have been listed; the others may have subfolders which weren't listed yet.
+    """
+
+    def __init__(self):
+        self.children = {}
+        self.names = {}
+        self.parents = {}
+        self.errors = {}
+        self.truncated = False
+
+    def add(self, parent_id, folders):
+        self.children[parent_id] = [folder.folder_id for folder in folders]
+
+        for folder in folders:
+            self.names[folder.folder_id] = folder.folder_name
+            self.parents[folder.folder_id] = parent_id
+
+    def expanded(self, folder_id):
+        return folder_id in self.children
+
+    def depth(self, folder_id):
+        depth = 0
+
+        while self.parents.get(folder_id) is not None:
+            folder_id = self.parents[folder_id]
+            depth += 1
+
+        return depth
+
+    def path(self, folder_id):
+        names = []
+
+        while folder_id is not None:
+            names.append(self.names[folder_id])
+            folder_id = self.parents.get(folder_id)
+
+        return " / ".join(reversed(names))
+
+    def folders(self, parent_id=None):
+        """
+        Yields:
+        The ids of the listed folders below a folder, depth first, in listing order.
+        """
+
+        for folder_id in self.children.get(parent_id, []):
+            yield folder_id
+            yield from self.folders(folder_id)
+
+    def frontier(self):
+        """
+        Returns:
+        The listed folders whose subfolders weren't listed yet.
+        """
+
+        return [folder_id for folder_id in self.folders() if not self.expanded(folder_id)]
+
+async def crawl(list_folders, roots=(None,), depth=CRAWL_DEPTH, concurrency=CRAWL_CONCURRENCY, max_listings=MAX_LISTINGS, tree=None):
+    """
+    List the folders `depth` levels below each root (None for the top level) into a `FolderTree`.
+
+    `list_folders(folder_id)` is an async function which returns the subfolders of a folder, and an error message,
+    like the sample clients' `query_*_folders`. Each folder's subfolders are listed as soon as the folder is, rather
+    than a level at a time, `concurrency` listings at once, so picking a deep folder takes one wait instead of one per
+    level. Listings go through the `listings` cache, so crawling again on a rerun, or below a folder listed before,
+    only queries what wasn't listed yet.
+
+    Each listing reserves one of `max_listings` before it's scheduled, so a wide level can't overshoot the budget
+    while its listings wait for the semaphore.
+
+    Returns:
+    The tree, with the folders whose listing failed in `errors`, and `truncated` if it stopped at `max_listings`.
+    """
+
+    tree = tree if tree is not None else FolderTree()
+    semaphore = asyncio.Semaphore(concurrency)
+    budget = [max_listings]
+
+    async def expand(folder_id, level):
+        if not tree.expanded(folder_id):
+            if budget[0] <= 0:
+                tree.truncated = True
+                return
+
+            # reserved before awaiting, so concurrent expansions see it
+            budget[0] -= 1
+
+            async with semaphore:
+                folders, error = await list_folders(folder_id)
+
+            if error is not None:
+                tree.errors[folder_id] = error
+                return
+
+            tree.add(folder_id, folders)
+
+        if level + 1 < depth:
+            await asyncio.gather(*(expand(child_id, level + 1) for child_id in tree.children[folder_id]))
+
+    await asyncio.gather(*(expand(root, 0) for root in roots))
+
+    return tree
+
+def select_folder(tree, label, key, extra_options=()):
+    """
+    Show the listed folders as an indented tree to pick from; folders with subfolders which weren't listed yet are
+    marked with ▸.
+
+    Returns:
+    The picked folder id, or one of `extra_options` (e.g. going back), or None.
+    """
+
+    def format_folder(option):
+        if option not in tree.names:
+            return option
+
+        return " " * tree.depth(option) + tree.names[option] + ("" if tree.expanded(option) else " ▸")
+
+    return st.selectbox(label, list(tree.folders()) + list(extra_options), format_func=format_folder, placeholder="Choose a folder", index=None, key=key)
+
+def select_expansion(tree, key):
+    """
+    Show the folders whose subfolders weren't listed yet, to list `CRAWL_DEPTH` more levels below one of them.
+
+    Returns:
+    The folder id to list below, or None.
+    """
+
+    frontier = tree.frontier()
+
+    if not frontier:
+        return None
+
+    return st.selectbox("Show deeper folders of:", frontier, format_func=tree.path, placeholder="Choose a folder to expand", index=None, key=key)
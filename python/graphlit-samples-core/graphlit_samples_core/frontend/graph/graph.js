@@ -0,0 +1,86 @@
+// Draws a knowledge graph with vis-network, from the nodes and edges sent by `graph.display_graph`.
+//
+// Implements the Streamlit component protocol directly (componentReady, render, setFrameHeight and
+// setComponentValue), so the component needs no build step.
+(function () {
+    var nodes = new vis.DataSet();
+    var edges = new vis.DataSet();
+    var network = null;
+    var fingerprint = null;
+    var reported = undefined;
+
+    function send(type, data) {
+        window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type: type }, data), "*");
+    }
+
+    function edgeId(edge) {
+        return edge.from + "\u0000" + edge.to + "\u0000" + (edge.title || "");
+    }
+
+    // update the data sets in place, so nodes which are still there keep their position
+    function update(dataSet, items) {
+        var ids = {};
+
+        items.forEach(function (item) {
+            ids[item.id] = true;
+        });
+
+        dataSet.remove(dataSet.getIds().filter(function (id) {
+            return !ids[id];
+        }));
+
+        dataSet.update(items);
+    }
+
+    function render(args) {
+        var container = document.getElementById("graph");
+
+        container.style.height = args.height + "px";
+
+        var data = {
+            nodes: args.data.nodes,
+            edges: args.data.edges.map(function (edge) {
+                return Object.assign({ id: edgeId(edge) }, edge);
+            })
+        };
+
+        if (args.base !== null && args.base !== undefined) {
+            // only the nodes and edges added since the graph `base`, which has to be the one drawn
+            if (fingerprint === args.base) {
+                fingerprint = args.fingerprint;
+
+                nodes.update(data.nodes);
+                edges.update(data.edges);
+            } else if (fingerprint !== args.fingerprint) {
+                // e.g. a new frame: report it, so the whole graph is sent
+                fingerprint = null;
+            }
+        } else if (args.fingerprint !== fingerprint) {
+            fingerprint = args.fingerprint;
+
+            update(nodes, data.nodes);
+            update(edges, data.edges);
+        }
+
+        if (network === null) {
+            network = new vis.Network(container, { nodes: nodes, edges: edges }, args.options);
+        }
+
+        send("streamlit:setFrameHeight", { height: container.offsetHeight });
+
+        // the graph drawn, so that the next update can send only what was added to it
+        if (args.report && fingerprint !== reported) {
+            reported = fingerprint;
+
+            send("streamlit:setComponentValue", { value: fingerprint, dataType: "json" });
+        }
+    }
+
+    window.addEventListener("message", function (event) {
+        if (event.data && event.data.type === "streamlit:render") {
+            render(event.data.args);
+        }
+    });
+
+    send("streamlit:componentReady", { apiVersion: 1 });
+})();
@@ -0,0 +1,440 @@
+import streamlit.components.v1 as components
+import hashlib
+import os
+import json
+import threading
+from collections import OrderedDict
+from typing import Optional, Union
+from graphlit_api import (
+    ContentTypes,
+    EntityTypes,
+    FileTypes,
+    PromptConversationPromptConversationGraph,
+    QueryContentsGraphContentsGraph,
+)
+from graphlit_samples_core.columnar import ColumnarGraph
+from graphlit_samples_core.lazy import lazy_import
+
+# only loaded when a graph is rendered
+pyvis_network = lazy_import("pyvis.network")
+
+def select_emoji(entity_type):
+    # Emoji mappings for observable types
+    observable_emoji_map = {
+        "CONTENT": "📄",  # Page facing up emoji for generic content
+        "LABEL": "🏷️",   # Label emoji for categories or tags
+        "PERSON": "🧑",  # Person emoji for individuals
+        "ORGANIZATION": "🏢",  # Office building emoji for organizations
+        "PLACE": "🌍",  # Globe showing Europe-Africa for places
+        "PRODUCT": "🛍️",  # Shopping bags emoji for products
+        "SOFTWARE": "💻",  # Laptop emoji for software
+        "REPO": "🗂️",  # Card index dividers emoji for repositories
+        "EVENT": "🎉",  # Party popper emoji for events
+    }
+
+    # Return the emoji corresponding to the entity type
+    return observable_emoji_map.get(entity_type, "📄")  # Default to page facing up emoji if entity type is unknown
+
+def lookup_node_shape(entity_type, content_type, file_type):
+    entity_icon_map = {
+        "CONTENT": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf15c", "color": "#aec7e8"}},  # file-text
+        "LABEL": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf02b", "color": "#ffbb78"}},   # tag (luggage tag-like)
+        "PERSON": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf007", "color": "#98df8a"}},  # user
+        "ORGANIZATION": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf1ad", "color": "#ff9896"}},  # building
+        "PLACE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf3c5", "color": "#c5b0d5"}},  # globe-americas
+        "PRODUCT": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf1b2", "color": "#c49c94"}},  # cube
+        "SOFTWARE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf085", "color": "#f7b6d2"}},  # cog
+        "REPO": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf1c0", "color": "#c7c7c7"}},  # database
+        "EVENT": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf073", "color": "#dbdb8d"}},  # calendar
+    }
+
+    content_icon_map = {
+        "FILE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf15c", "color": "#aec7e8"}},  # file
+        "PAGE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf0ac", "color": "#aec7e8"}},  # globe
+        "MESSAGE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf075", "color": "#aec7e8"}},  # comment
+        "TEXT": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf15c", "color": "#aec7e8"}},  # file-text
+        "POST": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf1ea", "color": "#aec7e8"}},  # newspaper
+        "EMAIL": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf0e0", "color": "#aec7e8"}},  # envelope
+        "EVENT": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf073", "color": "#aec7e8"}},  # calendar
+        "ISSUE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf188", "color": "#aec7e8"}},  # bug
+    }
+
+    file_icon_map = {
+        "VIDEO": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf03d", "color": "#aec7e8"}},  # video-camera
+        "AUDIO": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf028", "color": "#aec7e8"}},  # volume-up
+        "IMAGE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf03e", "color": "#aec7e8"}},  # picture-o (image)
+        "DOCUMENT": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf15b", "color": "#aec7e8"}},  # file-text-o
+        "EMAIL": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf0e0", "color": "#aec7e8"}},  # envelope
+        "CODE": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf121", "color": "#aec7e8"}},  # code
+        "DATA": {"shape": "icon", "icon": {"face": "FontAwesome", "code": "\uf1c0", "color": "#aec7e8"}},  # database
+    }
+
+    if file_type is not None:
+        return file_icon_map.get(file_type, content_icon_map.get("FILE"))
+    elif content_type is not None:
+        return content_icon_map.get(content_type, content_icon_map.get("FILE"))
+    else:
+        return entity_icon_map.get(entity_type, {"shape": "dot"})  # Default to a simple dot shape if the entity type is unknown
+
+def lookup_node_color(entity_type):
+    entity_color_map = {
+        "CONTENT": "#aec7e8",  # Soft blue
+        "LABEL": "#ffbb78",   # Soft orange
+        "PERSON": "#98df8a",  # Pale green
+        "ORGANIZATION": "#ff9896",  # Soft red
+        "PLACE": "#c5b0d5",  # Soft purple
+        "PRODUCT": "#c49c94",  # Soft brown
+        "SOFTWARE": "#f7b6d2",  # Light pink
+        "REPO": "#c7c7c7",  # Light gray
+        "EVENT": "#dbdb8d",  # Soft yellow
+    }
+
+    return entity_color_map.get(entity_type, "#ffffff")  # Default to white if entity type is unknown
+
+def parse_metadata(metadata):
+    if metadata is None:
+        return None, None
+    
+    o = json.loads(metadata)
+
+    return ContentTypes[o["type"]] if "type" in o else None, FileTypes[o["fileType"]] if "fileType" in o else None
+
+def pretty_print_json(dictionary):
+    return '\n'.join(f"{key}: {value}" for key, value in dictionary.items())
+
+def parse_title(metadata):
+    if metadata is None:
+        return None
+    
+    o = json.loads(metadata)
+
+    email = o["email"] if "email" in o else None
+    document = o["document"] if "document" in o else None
+    audio = o["audio"] if "audio" in o else None
+    video = o["video"] if "video" in o else None
+
+    if document is not None:
+        title = pretty_print_json(document)
+    elif video is not None:
+        title = pretty_print_json(video)
+    elif audio is not None:
+        title = pretty_print_json(audio)
+    elif email is not None:
+        title = pretty_print_json(email)
+    else:
+        title = pretty_print_json(o)
+
+    return title
+
+def parse_label(metadata):
+    if metadata is None:
+        return None
+    
+    o = json.loads(metadata)
+
+    file_name = o["fileName"] if "fileName" in o else None
+
+    label = None
+
+    email = o["email"] if "email" in o else None
+    document = o["document"] if "document" in o else None
+    audio = o["audio"] if "audio" in o else None
+    video = o["video"] if "video" in o else None
+
+    if document is not None and "title" in document:
+        label = document["title"]
+    elif video is not None and "title" in video:
+        label = video["title"]
+    elif audio is not None and "title" in audio:
+        label = audio["title"]
+
+    return label if label is not None else file_name
+
+def format_relation(relation: str):
+    if relation == "observed-by":
+        return None
+    
+    return relation.replace("-", " ")
+
+HIGHLIGHT_COLOR = "#d62728"
+
+def compact_graph(graph: Union[PromptConversationPromptConversationGraph, QueryContentsGraphContentsGraph, ColumnarGraph]):
+    """
+    Convert a graph returned by the API, or a `ColumnarGraph`, into plain lists, with the node metadata already
+    parsed, so it can be kept in session state (e.g. with the chat message it belongs to) and rendered again without
+    the API models.
+
+    Returns:
+    A dict of `nodes`, as [id, label, entity type, content type, file type, title] lists, and `edges`,
+    as [from, to, relation] lists. Rendering also accepts a `highlight` list of node ids.
+    """
+
+    if isinstance(graph, ColumnarGraph):
+        return graph.compact()
+
+    nodes = []
+
+    for node in graph.nodes or []:
+        content_type = None
+        file_type = None
+        label = None
+        title = None
+
+        if node.type == EntityTypes.CONTENT:
+            content_type, file_type = parse_metadata(node.metadata)
+            label = parse_label(node.metadata)
+            title = parse_title(node.metadata)
+
+        nodes.append([
+            node.id,
+            label if label is not None else node.name,
+            node.type.name,
+            content_type.name if content_type is not None else None,
+            file_type.name if file_type is not None else None,
+            title if title is not None else f'{node.type.name} [{node.id}]',
+        ])
+
+    edges = [[edge.from_, edge.to, edge.relation] for edge in graph.edges or []]
+
+    return {"nodes": nodes, "edges": edges}
+
+def graph_fingerprint(compact):
+    return hashlib.sha1(json.dumps(compact, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+def vis_data(compact, complete=True):
+    """
+    Returns:
+    The vis-network nodes and edges of a compact graph, with the shapes, icons and colors of their entity types.
+    Edge endpoints which aren't among the nodes are added as plain dots, unless the graph isn't `complete`, e.g. the
+    nodes and edges added to a graph which is drawn already.
+    """
+
+    # e.g. search matches
+    highlight = set(compact.get("highlight") or [])
+
+    nodes = []
+    node_ids = set()
+
+    for node_id, label, entity_type, content_type, file_type, title in compact["nodes"]:
+        shape = lookup_node_shape(entity_type, content_type, file_type)
+
+        node = {"id": node_id, "label": label, "title": title, "shape": shape["shape"], "color": lookup_node_color(entity_type)}
+
+        # unknown entity types are drawn as dots, without an icon
+        if "icon" in shape:
+            node["icon"] = shape["icon"]
+
+        if node_id in highlight:
+            node["color"] = HIGHLIGHT_COLOR
+            node["font"] = {"size": 20, "color": HIGHLIGHT_COLOR}
+
+            if "icon" in node:
+                node["icon"] = dict(node["icon"], color=HIGHLIGHT_COLOR, size=70)
+
+        nodes.append(node)
+        node_ids.add(node_id)
+
+    edges = []
+
+    for from_, to, relation in compact["edges"]:
+        # ensure start and end vertex exist in graph
+        for endpoint in (from_, to):
+            if complete and endpoint not in node_ids:
+                nodes.append({"id": endpoint, "label": endpoint, "shape": "dot", "color": "#97c2fc"})
+                node_ids.add(endpoint)
+
+        edge = {"from": from_, "to": to, "width": 3 if relation != "observed-by" else 1, "arrowStrikethrough": False, "arrows": "middle"}
+
+        label = format_relation(relation)
+
+        if label is not None:
+            edge["label"] = label
+            edge["title"] = label
+
+        edges.append(edge)
+
+    return {"nodes": nodes, "edges": edges}
+
+def create_pyvis_graph(graph: Union[PromptConversationPromptConversationGraph, QueryContentsGraphContentsGraph, ColumnarGraph, dict]):
+    compact = graph if isinstance(graph, dict) else compact_graph(graph)
+
+    data = vis_data(compact)
+
+    g = create_pyvis_network()
+
+    for node in data["nodes"]:
+        g.add_node(**{("n_id" if key == "id" else key): value for key, value in node.items()})
+
+    for edge in data["edges"]:
+        g.add_edge(**{("source" if key == "from" else key): value for key, value in edge.items()})
+
+    return g
+
+def create_pyvis_conversation_graph(graph: Optional[PromptConversationPromptConversationGraph]):
+    return create_pyvis_graph(graph)
+
+def create_pyvis_contents_graph(graph: Optional[Union[QueryContentsGraphContentsGraph, ColumnarGraph]]):
+    return create_pyvis_graph(graph)
+
+def create_pyvis_network():
+    g = pyvis_network.Network(
+        notebook=False,
+        directed=True,
+        cdn_resources="in_line",
+        height="900px",
+        width="100%",
+    )
+
+    g.set_options(f"var options = {json.dumps(GRAPH_OPTIONS)}")
+
+    return g
+
+GRAPH_OPTIONS = {
+    "physics": {
+        "forceAtlas2Based": {
+            "gravitationalConstant": -50,
+            "centralGravity": 0.01,
+            "springLength": 100,
+            "springConstant": 0.08
+        },
+        "maxVelocity": 50,
+        "solver": "forceAtlas2Based",
+        "timestep": 0.35,
+        "stabilization": {
+            "iterations": 100
+        }
+    }
+}
+
+GRAPH_HEIGHT = 900
+
+_pyvis_template = None
+_pyvis_template_lock = threading.Lock()
+
+def pyvis_template():
+    """
+    Returns:
+    The pyvis page template, compiled once per process; pyvis compiles it again for every `Network`.
+    """
+
+    global _pyvis_template
+
+    with _pyvis_template_lock:
+        if _pyvis_template is None:
+            from jinja2 import Environment, FileSystemLoader
+
+            network = create_pyvis_network()
+
+            _pyvis_template = Environment(loader=FileSystemLoader(network.template_dir)).get_template(network.path)
+
+        return _pyvis_template
+
+def generate_graph_html(g):
+    """
+    Returns:
+    The standalone HTML page of a pyvis network, rendered in memory with the compiled template, the same as
+    `g.generate_html`.
+    """
+
+    nodes, edges, heading, height, width, options = g.get_network_data()
+
+    if isinstance(g.options, dict):
+        physics_enabled = g.options.get("physics", {}).get("enabled", True)
+    else:
+        physics_enabled = g.options.physics.enabled
+
+    graph_html = pyvis_template().render(
+        height=height,
+        width=width,
+        nodes=nodes,
+        edges=edges,
+        heading=heading,
+        options=options,
+        physics_enabled=physics_enabled,
+        use_DOT=g.use_DOT,
+        dot_lang=g.dot_lang,
+        widget=g.widget,
+        bgcolor=g.bgcolor,
+        conf=g.conf,
+        # links in tooltips need a tooltip which doesn't follow the mouse
+        tooltip_link=any("href" in (node.get("title") or "") for node in nodes),
+        neighborhood_highlight=g.neighborhood_highlight,
+        select_menu=g.select_menu,
+        filter_menu=g.filter_menu,
+        notebook=False,
+        cdn_resources=g.cdn_resources,
+    )
+
+    # Inject FontAwesome CSS
+    font_awesome_link = '<script src="https://kit.fontawesome.com/2c74303849.js" crossorigin="anonymous"></script>'
+    graph_html = graph_html.replace('<head>', f'<head>{font_awesome_link}', 1)
+
+    return graph_html
+
+def pyvis_fingerprint(g):
+    return hashlib.sha1(json.dumps([g.nodes, g.edges], sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+def display_pyvis_graph(g):
+    components.html(cached_graph_html(pyvis_fingerprint(g), lambda: generate_graph_html(g)), height=GRAPH_HEIGHT, scrolling=False)
+
+# rendered graphs, by fingerprint; each is about as large as the inlined vis-network library
+GRAPH_HTML_CACHE_SIZE = 32
+
+_graph_html = OrderedDict()
+_graph_html_lock = threading.Lock()
+
+def cached_graph_html(key, render):
+    """
+    Returns:
+    The HTML rendered by `render`, memoized by `key` (a graph fingerprint) across sessions, so a graph is only
+    rendered once while it's in the cache.
+    """
+
+    with _graph_html_lock:
+        html = _graph_html.get(key)
+
+        if html is not None:
+            _graph_html.move_to_end(key)
+            return html
+
+    html = render()
+
+    with _graph_html_lock:
+        _graph_html[key] = html
+
+        while len(_graph_html) > GRAPH_HTML_CACHE_SIZE:
+            _graph_html.popitem(last=False)
+
+    return html
+
+def graph_html(compact):
+    """
+    Returns:
+    The standalone HTML of a compact graph, memoized by fingerprint across sessions.
+    """
+
+    return cached_graph_html(graph_fingerprint(compact), lambda: generate_graph_html(create_pyvis_graph(compact)))
+
+# vis-network and the page which draws the graph are static files, which the browser caches, so each render only
+# sends the nodes and edges
+_graph_component = components.declare_component("knowledge_graph", path=os.path.join(os.path.dirname(__file__), "frontend", "graph"))
+
+def display_graph(compact, key=None):
+    """
+    Draw a compact graph with the knowledge graph component. Redrawing with the same `key` updates the graph in
+    place, so nodes which are still there keep their position.
+    """
+
+    _graph_component(data=vis_data(compact), fingerprint=graph_fingerprint(compact), options=GRAPH_OPTIONS, height=GRAPH_HEIGHT, key=key, default=None)
+
+def update_graph(compact, fingerprint, base=None, key=None):
+    """
+    Draw a graph which only grows, e.g. while a feed syncs, sending only what was added to it: `compact` has the
+    nodes and edges added since the graph `base`, or is the whole graph if `base` is None.
+
+    Returns:
+    The fingerprint of the graph the component has drawn, to pass as `base` next time, or None until it has drawn one
+    (e.g. a new browser tab), when the whole graph has to be sent.
+    """
+
+    return _graph_component(data=vis_data(compact, complete=base is None), fingerprint=fingerprint, base=base, report=True, options=GRAPH_OPTIONS, height=GRAPH_HEIGHT, key=key, default=None)
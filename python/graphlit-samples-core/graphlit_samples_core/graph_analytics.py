@@ -0,0 +1,303 @@
+import threading
+from collections import OrderedDict
+import streamlit as st
+from graphlit_samples_core.lazy import lazy_import
+
+# only loaded when a graph is analyzed
+np = lazy_import("numpy")
+
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOLERANCE = 1e-6
+PAGERANK_ITERATIONS = 100
+
+LABEL_PROPAGATION_ITERATIONS = 20
+
+# analyzed graphs, by snapshot
+CACHE_SIZE = 8
+
+# entities listed per type
+TOP_ENTITIES = 10
+
+class GraphAnalytics:
+    """
+    Centrality, communities and shortest paths of a `ColumnarGraph`, computed with vectorized NumPy operations over
+    its edge arrays: sparse matrix-vector products are `np.bincount` with weights, and adjacency lists are a CSR
+    layout (`offsets` into `neighbors`).
+
+    Edges are treated as undirected, since entities are linked to contents by `observed-by` edges in one direction.
+
+    Only the results are kept, not the graph, which may grow afterwards: node numbers refer to the graph's first
+    `node_count` nodes, and labels and relation names are looked up in the graph.
+    """
+
+    def __init__(self, graph):
+        n = self.node_count = graph.node_count
+
+        self.types = graph.types.copy()
+
+        # both directions of each edge, sorted by node, as CSR
+        sources = np.concatenate([graph.sources, graph.targets]).astype(np.int64)
+        targets = np.concatenate([graph.targets, graph.sources]).astype(np.int64)
+
+        order = np.argsort(sources, kind="stable")
+
+        self.neighbors = targets[order]
+        self.neighbor_relations = np.concatenate([graph.relations, graph.relations])[order]
+        self.offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=self.offsets[1:])
+
+        self.degree = np.diff(self.offsets)
+        self.pagerank = self.compute_pagerank(sources, targets)
+        self.communities = self.compute_communities(sources, targets)
+
+    def compute_pagerank(self, sources, targets):
+        n = self.node_count
+
+        if n == 0:
+            return np.empty(0)
+
+        rank = np.full(n, 1.0 / n)
+        out_degree = self.degree.astype(float)
+        dangling = out_degree == 0
+
+        # each edge carries its source's rank, split over the source's edges
+        weights = 1.0 / np.maximum(out_degree, 1.0)
+
+        for _ in range(PAGERANK_ITERATIONS):
+            spread = np.bincount(targets, weights=(rank * weights)[sources], minlength=n)
+
+            updated = (1.0 - PAGERANK_DAMPING) / n + PAGERANK_DAMPING * (spread + rank[dangling].sum() / n)
+
+            delta = np.abs(updated - rank).sum()
+            rank = updated
+
+            if delta < PAGERANK_TOLERANCE:
+                break
+
+        return rank
+
+    def compute_communities(self, sources, targets):
+        """
+        Label propagation: each node repeatedly takes the most frequent label among itself and its neighbors, ties
+        going to the smallest label. Half of the nodes are updated at a time, since updating all at once oscillates
+        on bipartite graphs such as contents and their entities.
+
+        Returns:
+        The community number of each node, numbered by size, largest first.
+        """
+
+        n = self.node_count
+
+        labels = np.arange(n, dtype=np.int64)
+
+        if n == 0:
+            return labels
+
+        # every node votes for its own label too
+        voters = np.concatenate([sources, np.arange(n)])
+        voted = np.concatenate([targets, np.arange(n)])
+
+        halves = np.random.default_rng(0).random(n) < 0.5
+
+        for iteration in range(LABEL_PROPAGATION_ITERATIONS):
+            changed = False
+
+            for half in (halves, ~halves):
+                # count the labels around each node
+                keys, counts = np.unique(voted * n + labels[voters], return_counts=True)
+                nodes = keys // n
+                candidates = keys % n
+
+                # per node, the most frequent label, then the smallest
+                order = np.lexsort((candidates, -counts, nodes))
+                first = np.ones(len(order), dtype=bool)
+                first[1:] = nodes[order][1:] != nodes[order][:-1]
+
+                best = np.empty(n, dtype=np.int64)
+                best[nodes[order][first]] = candidates[order][first]
+
+                update = half & (best != labels)
+
+                if update.any():
+                    labels[update] = best[update]
+                    changed = True
+
+            if not changed:
+                break
+
+        # renumber by community size, largest first
+        unique, inverse, sizes = np.unique(labels, return_inverse=True, return_counts=True)
+        rank = np.empty(len(unique), dtype=np.int64)
+        rank[np.argsort(-sizes, kind="stable")] = np.arange(len(unique))
+
+        return rank[inverse]
+
+    def top_entities(self, entity_type, limit=TOP_ENTITIES, by="pagerank"):
+        """
+        Returns:
+        The node numbers of the most central entities of a type, e.g. `PERSON`, most central first.
+        """
+
+        from graphlit_samples_core.columnar import ENTITY_TYPES
+
+        if entity_type not in ENTITY_TYPES:
+            return np.empty(0, dtype=np.int64)
+
+        nodes = np.flatnonzero(self.types == ENTITY_TYPES.index(entity_type))
+        scores = (self.pagerank if by == "pagerank" else self.degree)[nodes]
+
+        return nodes[np.argsort(-scores, kind="stable")[:limit]]
+
+    def community_sizes(self):
+        return np.bincount(self.communities)
+
+    def shortest_path(self, source, target):
+        """
+        Breadth-first search from `source`, one frontier at a time.
+
+        Returns:
+        The node numbers of a shortest path from `source` to `target`, or None if they aren't connected.
+        """
+
+        n = self.node_count
+
+        parent = np.full(n, -1, dtype=np.int64)
+        parent[source] = source
+
+        frontier = np.array([source], dtype=np.int64)
+
+        while len(frontier) > 0 and parent[target] < 0:
+            # the neighbors of all frontier nodes, with the frontier node each was reached from
+            starts = self.offsets[frontier]
+            counts = self.offsets[frontier + 1] - starts
+
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            reached = self.neighbors[positions]
+            reached_from = np.repeat(frontier, counts)
+
+            unvisited = parent[reached] < 0
+            reached = reached[unvisited]
+            reached_from = reached_from[unvisited]
+
+            reached, first = np.unique(reached, return_index=True)
+            parent[reached] = reached_from[first]
+
+            frontier = reached
+
+        if parent[target] < 0:
+            return None
+
+        path = [target]
+
+        while path[-1] != source:
+            path.append(int(parent[path[-1]]))
+
+        return path[::-1]
+
+    def relation(self, source, target):
+        """
+        Returns:
+        The code of the relation between two adjacent nodes, into the graph's `relation_names`, or -1.
+        """
+
+        start, end = self.offsets[source], self.offsets[source + 1]
+        match = np.flatnonzero(self.neighbors[start:end] == target)
+
+        return int(self.neighbor_relations[start + match[0]]) if len(match) > 0 else -1
+
+_analytics = OrderedDict()
+_analytics_lock = threading.Lock()
+
+def analyze(graph):
+    """
+    Returns:
+    The `GraphAnalytics` of a `ColumnarGraph`, memoized by the graph's snapshot, so reruns don't compute them again,
+    and a graph which grew since, e.g. in live mode, is analyzed again.
+    """
+
+    key = graph.snapshot()
+
+    with _analytics_lock:
+        analytics = _analytics.get(key)
+
+        if analytics is not None:
+            _analytics.move_to_end(key)
+            return analytics
+
+    analytics = GraphAnalytics(graph)
+
+    with _analytics_lock:
+        _analytics[key] = analytics
+
+        while len(_analytics) > CACHE_SIZE:
+            _analytics.popitem(last=False)
+
+    return analytics
+
+def render(graph):
+    """
+    Show the most connected entities, the communities and a path finder for a loaded `ColumnarGraph`.
+    """
+
+    if graph.node_count == 0:
+        return
+
+    analytics = analyze(graph)
+
+    most_connected, communities, paths = st.tabs(["Most connected", "Communities", "Paths"])
+
+    with most_connected:
+        columns = st.columns(2)
+
+        for column, entity_type in zip(columns * 2, ["PERSON", "ORGANIZATION", "PLACE", "PRODUCT"]):
+            nodes = analytics.top_entities(entity_type)
+
+            if len(nodes) == 0:
+                continue
+
+            with column:
+                st.markdown(f"**{entity_type.title()}**")
+                st.dataframe(
+                    [{"Entity": graph.label(node), "Connections": int(analytics.degree[node]), "PageRank": float(analytics.pagerank[node])} for node in nodes.tolist()],
+                    hide_index=True,
+                    column_config={"PageRank": st.column_config.NumberColumn(format="%.5f")},
+                )
+
+    with communities:
+        sizes = analytics.community_sizes()
+
+        st.caption(f"{len(sizes)} communities, found by label propagation")
+
+        rows = []
+
+        for community in range(min(len(sizes), TOP_ENTITIES)):
+            members = np.flatnonzero(analytics.communities == community)
+            central = members[np.argsort(-analytics.pagerank[members], kind="stable")[:5]]
+
+            rows.append({"Community": community + 1, "Entities": int(sizes[community]), "Most central": ", ".join(str(graph.label(node)) for node in central.tolist())})
+
+        st.dataframe(rows, hide_index=True)
+
+    with paths:
+        # the most central entities, to pick from
+        candidates = np.argsort(-analytics.pagerank, kind="stable")[:500].tolist()
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            source = st.selectbox("From", candidates, format_func=graph.label, key="graph_path_from")
+        with col2:
+            target = st.selectbox("To", candidates, index=min(1, len(candidates) - 1), format_func=graph.label, key="graph_path_to")
+
+        if source is not None and target is not None:
+            path = analytics.shortest_path(source, target)
+
+            if path is None:
+                st.info("These entities aren't connected.")
+            else:
+                steps = [f"**{graph.label(path[0])}**"]
+
+                for previous, node in zip(path, path[1:]):
+                    steps.append(f"*{graph.relation_names[analytics.relation(previous, node)]}* → **{graph.label(node)}**")
+
+                st.markdown(" ".join(steps))
@@ -0,0 +1,232 @@
+import json
+import tempfile
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+import streamlit as st
+from graphlit_samples_core.columnar import CONTENT_TYPES, ENTITY_TYPES, FILE_TYPES
+from graphlit_samples_core.lazy import lazy_import
+
+# only loaded when a graph is exported
+np = lazy_import("numpy")
+
+# nodes or edges per chunk (and per Parquet row group)
+CHUNK_SIZE = 10000
+
+# bytes; larger exports are spooled to disk
+SPOOL_SIZE = 16 * 1024 * 1024
+
+# name, file extension and MIME type, by format
+FORMATS = {
+    "graphml": ("GraphML", ".graphml", "application/graphml+xml"),
+    "jsonl": ("JSON lines", ".jsonl", "application/x-ndjson"),
+    "parquet": ("Parquet", ".zip", "application/zip"),
+}
+
+def enum_name(names, code):
+    return names[code] if code >= 0 else None
+
+def node_records(graph, start, end):
+    """
+    Yields:
+    The nodes from `start` to `end` of a `ColumnarGraph`, as dicts.
+    """
+
+    for index in range(start, end):
+        yield {
+            "id": graph.ids[index],
+            "label": graph.label(index),
+            "entityType": enum_name(ENTITY_TYPES, int(graph.types[index])),
+            "contentType": enum_name(CONTENT_TYPES, int(graph.content_types[index])),
+            "fileType": enum_name(FILE_TYPES, int(graph.file_types[index])),
+            "metadata": graph.metadata[index],
+        }
+
+def edge_records(graph, start, end):
+    for source, target, relation in zip(graph.sources[start:end].tolist(), graph.targets[start:end].tolist(), graph.relations[start:end].tolist()):
+        yield {"from": graph.ids[source], "to": graph.ids[target], "relation": graph.relation_names[relation]}
+
+def iter_jsonl(graph, chunk_size=CHUNK_SIZE):
+    """
+    Yields:
+    The graph as JSON lines, one node or edge per line, with a `kind` of `node` or `edge`, in chunks of bytes.
+    """
+
+    for start in range(0, graph.node_count, chunk_size):
+        yield "".join(json.dumps(dict(kind="node", **record)) + "\n" for record in node_records(graph, start, min(start + chunk_size, graph.node_count))).encode("utf-8")
+
+    for start in range(0, graph.edge_count, chunk_size):
+        yield "".join(json.dumps(dict(kind="edge", **record)) + "\n" for record in edge_records(graph, start, min(start + chunk_size, graph.edge_count))).encode("utf-8")
+
+GRAPHML_KEYS = [
+    ("label", "node"),
+    ("entityType", "node"),
+    ("contentType", "node"),
+    ("fileType", "node"),
+    ("metadata", "node"),
+    ("relation", "edge"),
+]
+
+def graphml_data(record, keys):
+    return "".join(f'<data key="{key}">{escape(record[key])}</data>' for key in keys if record.get(key) is not None)
+
+def iter_graphml(graph, chunk_size=CHUNK_SIZE):
+    """
+    Yields:
+    The graph as GraphML, e.g. for Gephi, Cytoscape or NetworkX, in chunks of bytes.
+    """
+
+    header = ['<?xml version="1.0" encoding="UTF-8"?>\n<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n']
+    header.extend(f'<key id="{name}" for="{domain}" attr.name="{name}" attr.type="string"/>\n' for name, domain in GRAPHML_KEYS)
+    header.append('<graph id="G" edgedefault="directed">\n')
+
+    yield "".join(header).encode("utf-8")
+
+    node_keys = [name for name, domain in GRAPHML_KEYS if domain == "node"]
+
+    for start in range(0, graph.node_count, chunk_size):
+        yield "".join(
+            f'<node id={quoteattr(record["id"])}>{graphml_data(record, node_keys)}</node>\n'
+            for record in node_records(graph, start, min(start + chunk_size, graph.node_count))
+        ).encode("utf-8")
+
+    for start in range(0, graph.edge_count, chunk_size):
+        yield "".join(
+            f'<edge source={quoteattr(record["from"])} target={quoteattr(record["to"])}>{graphml_data(record, ["relation"])}</edge>\n'
+            for record in edge_records(graph, start, min(start + chunk_size, graph.edge_count))
+        ).encode("utf-8")
+
+    yield b"</graph>\n</graphml>\n"
+
+def enum_array(codes, names):
+    import pyarrow as pa
+
+    return pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), pa.array(list(names), type=pa.string()))
+
+def write_nodes_parquet(graph, file, chunk_size=CHUNK_SIZE):
+    """
+    Write the node table of a graph as Parquet, a row group per chunk. Nodes are numbered by row (`node`).
+
+    Requires `pyarrow`.
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with pq.ParquetWriter(file, node_schema()) as writer:
+        for start in range(0, graph.node_count, chunk_size):
+            end = min(start + chunk_size, graph.node_count)
+
+            writer.write_table(pa.table({
+                "node": pa.array(np.arange(start, end, dtype=np.int32)),
+                "id": pa.array(graph.ids.values[start:end], type=pa.string()),
+                "label": pa.array([graph.strings[code] for code in graph.labels[start:end].tolist()], type=pa.string()),
+                "entity_type": enum_array(graph.types[start:end], ENTITY_TYPES),
+                "content_type": enum_array(graph.content_types[start:end], CONTENT_TYPES),
+                "file_type": enum_array(graph.file_types[start:end], FILE_TYPES),
+                "metadata": pa.array(graph.metadata[start:end], type=pa.string()),
+            }, schema=node_schema()))
+
+def write_edges_parquet(graph, file, chunk_size=CHUNK_SIZE):
+    """
+    Write the edge table of a graph as Parquet, a row group per chunk. Edges refer to nodes by number, so the table
+    is three integer columns, with the relations dictionary encoded.
+
+    Requires `pyarrow`.
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    relation_names = list(graph.relation_names.values)
+
+    with pq.ParquetWriter(file, edge_schema()) as writer:
+        for start in range(0, graph.edge_count, chunk_size):
+            end = min(start + chunk_size, graph.edge_count)
+
+            writer.write_table(pa.table({
+                "source": pa.array(graph.sources[start:end]),
+                "target": pa.array(graph.targets[start:end]),
+                "relation": pa.DictionaryArray.from_arrays(pa.array(graph.relations[start:end]), pa.array(relation_names, type=pa.string())),
+            }, schema=edge_schema()))
+
+def node_schema():
+    import pyarrow as pa
+
+    enum = pa.dictionary(pa.int8(), pa.string())
+
+    return pa.schema([
+        ("node", pa.int32()),
+        ("id", pa.string()),
+        ("label", pa.string()),
+        ("entity_type", enum),
+        ("content_type", enum),
+        ("file_type", enum),
+        ("metadata", pa.string()),
+    ])
+
+def edge_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("source", pa.int32()),
+        ("target", pa.int32()),
+        ("relation", pa.dictionary(pa.int16(), pa.string())),
+    ])
+
+def write_export(graph, format, file, chunk_size=CHUNK_SIZE):
+    """
+    Write a graph to a binary file: `graphml`, `jsonl`, or `parquet` (a zip archive of `nodes.parquet` and
+    `edges.parquet`).
+    """
+
+    if format == "parquet":
+        # Parquet is already compressed
+        with zipfile.ZipFile(file, "w", compression=zipfile.ZIP_STORED) as archive:
+            with archive.open("nodes.parquet", "w") as nodes_file:
+                write_nodes_parquet(graph, nodes_file, chunk_size)
+
+            with archive.open("edges.parquet", "w") as edges_file:
+                write_edges_parquet(graph, edges_file, chunk_size)
+    elif format == "graphml":
+        for chunk in iter_graphml(graph, chunk_size):
+            file.write(chunk)
+    elif format == "jsonl":
+        for chunk in iter_jsonl(graph, chunk_size):
+            file.write(chunk)
+    else:
+        raise ValueError(f"Unknown export format: {format}")
+
+def export_file(graph, format, chunk_size=CHUNK_SIZE):
+    """
+    Returns:
+    A temporary file with the export, written in chunks, and spooled to disk above `SPOOL_SIZE` bytes.
+    """
+
+    file = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+
+    write_export(graph, format, file, chunk_size)
+
+    file.seek(0)
+
+    return file
+
+def render_downloads(graph, file_name="knowledge-graph"):
+    """
+    Show download buttons for the export formats. Exports are only written when a button is clicked.
+    """
+
+    if graph.node_count == 0:
+        return
+
+    columns = st.columns(len(FORMATS))
+
+    for column, (format, (name, extension, mime)) in zip(columns, FORMATS.items()):
+        with column:
+            st.download_button(
+                f"Download {name}",
+                data=lambda format=format: export_file(graph, format),
+                file_name=f"{file_name}{extension}",
+                mime=mime,
+                key=f"graph_export_{format}",
+                on_click="ignore",
+            )
@@ -0,0 +1,401 @@
+import asyncio
+import datetime
+import uuid
+from collections import deque
+import streamlit as st
+from graphlit_api import (
+    ContentFilter,
+    ContentGraphInput,
+    DateRangeFilter,
+    EntityReferenceFilter,
+    EntityTypes,
+    GraphQLClientError,
+    ObservableTypes,
+    OrderByTypes,
+    OrderDirectionTypes,
+    SearchTypes,
+)
+from graphlit_samples_core import graph, jobs
+from graphlit_samples_core.client import get_graphlit
+from graphlit_samples_core.columnar import ColumnarGraph, np
+from graphlit_samples_core.graph_search import InvertedIndex
+from graphlit_samples_core.runtime import run_async_task
+
+# contents per queryContentsGraph request
+PAGE_SIZE = 100
+
+MAX_CONTENTS = 1000
+
+# session state key of the graph being loaded
+SESSION_KEY = "knowledge_graph"
+
+# search matches shown, most connected first, with their neighbors
+SEARCH_LIMIT = 50
+
+# seconds between queries for new contents, in live mode
+LIVE_INTERVAL = 10
+
+# job name of the live mode poller
+LIVE_JOB = "knowledge_graph_live"
+
+class GraphQuery:
+    """
+    Which part of the project's knowledge graph to load: the contents of some feeds, created in a date window,
+    with only some types of observed entities, up to `max_contents` contents.
+    """
+
+    def __init__(self, observable_types=None, feed_ids=None, created_after=None, created_before=None, max_contents=MAX_CONTENTS, search=None):
+        self.observable_types = list(observable_types) if observable_types else None
+        self.feed_ids = list(feed_ids) if feed_ids else None
+        self.created_after = created_after
+        self.created_before = created_before
+        self.max_contents = max_contents
+        self.search = search
+
+    def key(self):
+        return (
+            tuple(observable_type.name for observable_type in self.observable_types or []),
+            tuple(self.feed_ids or []),
+            self.created_after,
+            self.created_before,
+            self.max_contents,
+            self.search,
+        )
+
+    def content_filter(self, offset, limit):
+        creation_date_range = None
+
+        if self.created_after is not None or self.created_before is not None:
+            creation_date_range = DateRangeFilter(from_=self.created_after, to=self.created_before)
+
+        return ContentFilter(
+            search=self.search,
+            searchType=SearchTypes.VECTOR if self.search is not None else None,
+            # oldest first, so contents created while paging are added at the end, instead of shifting the pages
+            orderBy=OrderByTypes.CREATION_DATE,
+            direction=OrderDirectionTypes.ASCENDING,
+            offset=offset,
+            limit=limit,
+            feeds=[EntityReferenceFilter(id=feed_id) for feed_id in self.feed_ids] if self.feed_ids else None,
+            creationDateRange=creation_date_range,
+        )
+
+    def graph_input(self):
+        # NOTE: required, to return the graph, even if no observable filtering
+        return ContentGraphInput(types=self.observable_types)
+
+async def count_contents(query):
+    graphlit = get_graphlit()
+
+    response = await graphlit.client.count_contents(filter=query.content_filter(None, None))
+
+    return int(response.count_contents.count or 0) if response.count_contents is not None else 0
+
+async def iterate_pages(query, offset=0, page_size=PAGE_SIZE):
+    """
+    Query the knowledge graph one page of contents at a time.
+
+    A page's graph only has the contents with observed entities (of the selected types), so its content nodes don't
+    tell how many contents the page covered. Pages are `page_size` contents apart instead, up to the number of
+    matching contents, counted along with the first page, in the same round trip.
+
+    Yields:
+    The offset after this page's contents, and the graph of this page's contents and their observed entities.
+    """
+
+    graphlit = get_graphlit()
+
+    total = None
+
+    while offset < query.max_contents and (total is None or offset < total):
+        limit = min(page_size, query.max_contents - offset)
+
+        page_query = graphlit.client.query_contents_graph(filter=query.content_filter(offset, limit), graph=query.graph_input())
+
+        if total is None:
+            total, response = await asyncio.gather(count_contents(query), page_query)
+        else:
+            response = await page_query
+
+        # after the last page, the offset of the first content created later
+        offset = min(offset + limit, max(total, offset))
+
+        page = response.contents.graph
+
+        if page is not None:
+            yield offset, page
+
+class GraphLoad:
+    """
+    A knowledge graph being loaded into this session, page by page, from `offset` on.
+
+    In live mode, `poll_pages` queues the pages of new contents in `pending`, from a job's thread, and
+    `merge_pending` merges them into the graph, from the script's.
+    """
+
+    def __init__(self, query, generation=None):
+        self.id = uuid.uuid4().hex
+        self.query = query
+        self.generation = generation
+        self.graph = ColumnarGraph()
+        self.index = InvertedIndex()
+        self.offset = 0
+        self.pages = 0
+        self.done = False
+        self.error = None
+        self.pending = deque()
+        self.live_error = None
+
+    def version(self):
+        """
+        Returns:
+        An id of the graph loaded so far, from which the nodes and edges added or upgraded since can be found
+        (`version_counts`), since the graph only grows.
+        """
+
+        return f"{self.id}:{self.graph.node_count}:{self.graph.edge_count}:{len(self.graph.upgraded)}"
+
+    def version_counts(self, version):
+        """
+        Returns:
+        The number of nodes, edges and upgraded nodes of an earlier version of this load's graph, or None if it's
+        from another load.
+        """
+
+        if not isinstance(version, str) or not version.startswith(f"{self.id}:"):
+            return None
+
+        _, node_count, edge_count, upgraded = version.split(":")
+
+        return int(node_count), int(edge_count), int(upgraded)
+
+    def matches(self, query, generation):
+        return self.query.key() == query.key() and self.generation == generation
+
+async def load_pages(load, on_page=None, page_size=PAGE_SIZE):
+    """
+    Merge the remaining pages of a load into its graph, calling `on_page(load)` after each page, so the graph can be
+    shown while it loads. A load interrupted by a rerun carries on from the last merged page.
+    """
+
+    try:
+        async for offset, page in iterate_pages(load.query, load.offset, page_size):
+            load.graph.merge(page)
+            load.index.update(load.graph)
+            load.offset = offset
+            load.pages += 1
+
+            if on_page is not None:
+                on_page(load)
+    except GraphQLClientError as e:
+        load.error = str(e)
+        return
+
+    load.done = True
+
+async def poll_pages(load):
+    """
+    Query the contents created after the loaded ones, e.g. while a feed syncs, and queue their pages in
+    `load.pending`. The last loaded page is queried again, since entities may have been extracted from its contents
+    meanwhile; merging drops the nodes and edges which are loaded already. The contents are counted again, so new
+    contents without observed entities yet don't hide the ones created after them.
+
+    Runs as a background job, started again by `live_graph` every `LIVE_INTERVAL` seconds, so it only takes a job
+    worker while it queries.
+    """
+
+    try:
+        async for offset, page in iterate_pages(load.query, max(0, load.offset - PAGE_SIZE)):
+            load.pending.append((offset, page))
+
+        load.live_error = None
+    except GraphQLClientError as e:
+        # tried again next time
+        load.live_error = str(e)
+
+def merge_pending(load):
+    """
+    Merge the pages queued by `poll_pages` into the load's graph.
+
+    Returns:
+    The number of nodes and edges added.
+    """
+
+    nodes = edges = 0
+
+    while load.pending:
+        offset, page = load.pending.popleft()
+
+        added_nodes, added_edges = load.graph.merge(page)
+        load.offset = max(load.offset, offset)
+
+        nodes += added_nodes
+        edges += added_edges
+
+    if nodes > 0:
+        load.index.update(load.graph)
+
+    return nodes, edges
+
+def get_load(query, generation=None):
+    """
+    Returns:
+    This session's load of the query, which is started over if the query, or the `generation` (e.g. the number of
+    finished ingestions), changed.
+    """
+
+    load = st.session_state.get(SESSION_KEY)
+
+    if load is None or not load.matches(query, generation):
+        load = GraphLoad(query, generation)
+        st.session_state[SESSION_KEY] = load
+
+    return load
+
+def reset():
+    st.session_state[SESSION_KEY] = None
+
+def render_filters(feed_ids=None):
+    """
+    Show the knowledge graph filters. `feed_ids` is the current feed, or the feeds of a feed group.
+
+    Returns:
+    The `GraphQuery` of the selected filters.
+    """
+
+    feed_ids = [feed_ids] if isinstance(feed_ids, str) else list(feed_ids or [])
+
+    with st.expander("Filters"):
+        observable_types = st.multiselect("Entity types", list(ObservableTypes), format_func=lambda observable_type: observable_type.name.title(), placeholder="All entity types")
+
+        dates = st.date_input("Created between", value=(), format="YYYY-MM-DD")
+
+        max_contents = st.number_input("Maximum contents", min_value=PAGE_SIZE, max_value=100 * MAX_CONTENTS, value=MAX_CONTENTS, step=PAGE_SIZE)
+
+        only_feed = len(feed_ids) > 0 and st.checkbox("Only the current feed" if len(feed_ids) == 1 else f"Only the current {len(feed_ids)} feeds", value=True)
+
+    created_after = None
+    created_before = None
+
+    if len(dates) > 0:
+        created_after = datetime.datetime.combine(dates[0], datetime.time.min)
+    if len(dates) > 1:
+        created_before = datetime.datetime.combine(dates[1], datetime.time.max)
+
+    return GraphQuery(
+        observable_types=observable_types,
+        feed_ids=feed_ids if only_feed else None,
+        created_after=created_after,
+        created_before=created_before,
+        max_contents=int(max_contents),
+    )
+
+def search_subgraph(load, search, limit=SEARCH_LIMIT):
+    """
+    Returns:
+    The number of nodes of the loaded graph matching the search, and the compact subgraph of the `limit` most
+    connected matches and their neighbors, with the matches highlighted.
+    """
+
+    matches = load.index.search(search)
+
+    if len(matches) == 0:
+        return 0, None
+
+    top = matches[np.argsort(-load.graph.degrees()[matches], kind="stable")[:limit]]
+
+    return len(matches), load.graph.compact(load.graph.neighborhood(top), highlight=top)
+
+def render_graph(query, generation=None, live=False):
+    """
+    Load and show the knowledge graph of a query, redrawn after each page, so the first entities show up as soon as
+    the first page arrives.
+
+    Searching narrows the graph down to the matching entities and their neighbors, from the index of the loaded
+    graph, without querying Graphlit again.
+
+    In `live` mode, once loaded, a background job polls for new contents, and the graph grows as they're found.
+
+    Returns:
+    The `GraphLoad`.
+    """
+
+    load = get_load(query, generation)
+
+    search = st.text_input("Search entities", key="graph_search", placeholder="Search by name, e.g. a person, organization or file")
+
+    placeholder = st.empty()
+
+    def on_page(load):
+        with placeholder.container():
+            st.caption(f"⏳ Loading knowledge graph... {load.graph.node_count} entities and {load.graph.edge_count} relations so far")
+
+            # a key per page, since a key can only be used once per run
+            graph.display_graph(load.graph.compact(), key=f"graph_view_page_{load.pages}")
+
+    if not load.done and load.error is None:
+        if load.pages > 0:
+            on_page(load)
+
+        run_async_task(load_pages, load, on_page)
+
+    if not live or not load.done:
+        jobs.forget(LIVE_JOB)
+
+    with placeholder.container():
+        if load.error is not None:
+            st.error(f"Failed to load knowledge graph. {load.error}")
+        elif load.graph.node_count == 0:
+            st.error('No knowledge graph was created.')
+        elif search.strip():
+            count, compact = search_subgraph(load, search)
+
+            if compact is None:
+                st.info(f"No entities match '{search}'.")
+            else:
+                st.caption(f"{count} entities match '{search}'" + (f", showing the {SEARCH_LIMIT} most connected" if count > SEARCH_LIMIT else ""))
+
+                graph.display_graph(compact, key="graph_view")
+        elif live:
+            live_graph(load)
+        else:
+            st.caption(f"{load.graph.node_count} entities and {load.graph.edge_count} relations, from {load.pages} pages")
+
+            graph.display_graph(load.graph.compact(), key="graph_view")
+
+    return load
+
+@st.fragment(run_every=LIVE_INTERVAL)
+def live_graph(load):
+    """
+    Show the loaded graph, and add the contents and entities found by `poll_pages` to it every `LIVE_INTERVAL`
+    seconds, without rerunning the page. Only the nodes and edges added since the graph the browser has drawn are
+    sent, so the graph grows in place.
+    """
+
+    added_nodes, added_edges = merge_pending(load)
+
+    poller = jobs.get(LIVE_JOB)
+
+    # the next query, in the background, picked up by the next run
+    if poller is None or poller.done() or poller.args[0] is not load:
+        jobs.restart(LIVE_JOB, poll_pages, load)
+
+    # the version of the graph the browser has drawn, reported by the component
+    base = st.session_state.get("graph_view_live")
+    shown = load.version_counts(base)
+
+    if shown is None:
+        compact, base = load.graph.compact(), None
+    else:
+        compact = load.graph.compact_since(*shown)
+
+    st.caption(
+        f"🟢 Live: {load.graph.node_count} entities and {load.graph.edge_count} relations"
+        + (f", {added_nodes} entities and {added_edges} relations just added" if added_nodes or added_edges else "")
+    )
+
+    if load.live_error is not None:
+        st.warning(f"Failed to check for new contents, trying again. {load.live_error}")
+
+    graph.update_graph(compact, load.version(), base=base, key="graph_view_live")
@@ -0,0 +1,95 @@
+import bisect
+import json
+import re
+from array import array
+from graphlit_samples_core.lazy import lazy_import
+
+# only loaded when a graph is searched
+np = lazy_import("numpy")
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+def tokenize(text):
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+class InvertedIndex:
+    """
+    Token to node numbers of a `ColumnarGraph`, over the node labels and the file names of contents, for searching
+    the loaded graph without querying Graphlit again.
+
+    `update` indexes the nodes added or relabeled since the last update, so it's cheap to call after each merged page.
+    Query tokens match as prefixes, so results narrow down as the user types.
+
+    Only untyped nodes, i.e. edge endpoints, get relabeled, once their typed record is merged; their tokens are kept
+    until then, so a relabeled node no longer matches its old label.
+    """
+
+    def __init__(self):
+        self.postings = {}
+        self.vocabulary = []
+        self.sorted = True
+        self.indexed = 0
+        self.upgraded = 0
+        self.untyped_tokens = {}
+
+    def update(self, graph):
+        # nodes indexed before they got their label, then the nodes added since
+        relabeled = [index for index in graph.upgraded[self.upgraded:] if index < self.indexed]
+
+        for index in relabeled:
+            for token in self.untyped_tokens.pop(index, ()):
+                self.postings[token].remove(index)
+
+        for index in relabeled + list(range(self.indexed, graph.node_count)):
+            texts = [graph.label(index)]
+
+            if graph.metadata[index] is not None:
+                texts.append(json.loads(graph.metadata[index]).get("fileName"))
+
+            tokens = {token for text in texts for token in tokenize(text)}
+
+            if graph.types[index] < 0:
+                self.untyped_tokens[index] = tokens
+
+            for token in tokens:
+                postings = self.postings.get(token)
+
+                if postings is None:
+                    postings = self.postings[token] = array("i")
+                    self.vocabulary.append(token)
+                    self.sorted = False
+
+                postings.append(index)
+
+        self.indexed = graph.node_count
+        self.upgraded = len(graph.upgraded)
+
+    def matching_tokens(self, prefix):
+        if not self.sorted:
+            self.vocabulary.sort()
+            self.sorted = True
+
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+
+        return self.vocabulary[start:end]
+
+    def search(self, query):
+        """
+        Returns:
+        The node numbers matching every token of the query, as a sorted array.
+        """
+
+        result = None
+
+        for token in tokenize(query):
+            postings = [np.frombuffer(self.postings[match], dtype=np.int32) for match in self.matching_tokens(token)]
+
+            matches = np.unique(np.concatenate(postings)) if postings else np.empty(0, dtype=np.int32)
+
+            result = matches if result is None else np.intersect1d(result, matches, assume_unique=True)
+
+            if len(result) == 0:
+                break
+
+        return result if result is not None else np.empty(0, dtype=np.int32)
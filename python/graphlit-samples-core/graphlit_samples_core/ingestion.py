@@ -0,0 +1,250 @@
+import asyncio
+import base64
+import os
+import time
+import streamlit as st
+from graphlit_api import EntityReferenceInput, GraphQLClientError
+from graphlit_samples_core import client, staging
+from graphlit_samples_core.client import get_graphlit
+from graphlit_samples_core.runtime import run_async_task
+
+def encode_file(uploaded_file):
+    """
+    Prepare a Streamlit uploaded file for `ingest_encoded_file`.
+
+    Returns:
+    The content name (file name without extension), the MIME type and the Base64 encoded file content.
+    """
+
+    # Read the file content
+    file_content = uploaded_file.getvalue()
+
+    base64_content = base64.b64encode(file_content).decode('utf-8')
+
+    # Split the file name into the name and extension
+    content_name, _ = os.path.splitext(uploaded_file.name)
+
+    return content_name, uploaded_file.type, base64_content
+
+async def ingest_encoded_file(name, mime_type, data, workflow_id=None, is_synchronous=True):
+    graphlit = get_graphlit()
+
+    try:
+        response = await graphlit.client.ingest_encoded_file(
+            name,
+            data,
+            mime_type,
+            is_synchronous=is_synchronous,
+            workflow=EntityReferenceInput(
+                id=workflow_id
+            ) if workflow_id is not None else None
+        )
+
+        return response.ingest_encoded_file.id, None
+    except GraphQLClientError as e:
+        return None, str(e)
+
+async def ingest_uri(uri, workflow_id=None, name=None, is_synchronous=True):
+    graphlit = get_graphlit()
+
+    try:
+        response = await graphlit.client.ingest_uri(
+            uri,
+            name=name,
+            is_synchronous=is_synchronous,
+            workflow=EntityReferenceInput(
+                id=workflow_id
+            ) if workflow_id is not None else None
+        )
+
+        return response.ingest_uri.id, None
+    except GraphQLClientError as e:
+        return None, str(e)
+
+async def ingest_file(uploaded_file, workflow_id=None, is_synchronous=True):
+    """
+    Ingest a Streamlit uploaded file.
+
+    Files above `staging.threshold()` are uploaded to the configured blob store in resumable chunks and ingested by
+    URI, which avoids the 33% Base64 overhead and a single huge GraphQL request, and deleted from the store once
+    ingested. Smaller files, or all files when no blob store is configured, are ingested Base64 encoded.
+
+    With `is_synchronous=False`, returns as soon as the content is created, before it's prepared and extracted;
+    see `submit_files`.
+
+    Returns:
+    The content id and None, or None and an error message.
+    """
+
+    store = staging.get_store()
+
+    if store is None or len(uploaded_file.getvalue()) <= staging.threshold():
+        return await ingest_encoded_file(*encode_file(uploaded_file), workflow_id, is_synchronous)
+
+    content_name, _ = os.path.splitext(uploaded_file.name)
+
+    try:
+        key, uri = await staging.stage_file(store, uploaded_file)
+    except Exception as e:
+        return None, f"Failed to stage file. {e}"
+
+    content_id, error_message = await ingest_uri(uri, workflow_id, name=content_name, is_synchronous=is_synchronous)
+
+    if is_synchronous or content_id is None:
+        # Graphlit has read the staged file, or won't
+        await staging.delete_staged(store, key)
+    else:
+        # deleted by poll_jobs once the content is done
+        get_staged_files()[content_id] = key
+
+    return content_id, error_message
+
+# session state key of this session's ingestion jobs, by content id
+JOBS_KEY = "ingestion_jobs"
+
+# session state key of the staged files of contents which are still ingesting, by content id
+STAGED_KEY = "staged_files"
+
+INGESTING = "ingesting"
+FINISHED = "finished"
+FAILED = "failed"
+
+# seconds between isContentDone polls
+POLL_INTERVAL = 2
+
+def get_jobs():
+    """
+    The job table of this session: a dict of jobs by content id (or file name, if the file couldn't be submitted),
+    each with the file `name`, `content_id`, `state`, `error`, `submitted` time and ingestion `duration`.
+    """
+
+    if JOBS_KEY not in st.session_state:
+        st.session_state[JOBS_KEY] = {}
+
+    return st.session_state[JOBS_KEY]
+
+def get_staged_files():
+    if STAGED_KEY not in st.session_state:
+        st.session_state[STAGED_KEY] = {}
+
+    return st.session_state[STAGED_KEY]
+
+def clear_jobs():
+    st.session_state[JOBS_KEY] = {}
+
+def finished_content_ids():
+    return [job["content_id"] for job in get_jobs().values() if job["state"] == FINISHED]
+
+def pending_content_ids():
+    return [job["content_id"] for job in get_jobs().values() if job["state"] == INGESTING]
+
+async def submit_files(uploaded_files, workflow_id=None):
+    """
+    Ingest uploaded files without waiting for them to be processed, and track them in the job table.
+
+    The files are submitted concurrently, and `poll_jobs` tracks their completion, so the page doesn't block for the
+    whole preparation and extraction pipeline, and finished files can be used while others are still processing.
+
+    Returns:
+    The jobs of the submitted files.
+    """
+
+    results = await asyncio.gather(*[ingest_file(uploaded_file, workflow_id, is_synchronous=False) for uploaded_file in uploaded_files])
+
+    jobs = get_jobs()
+    submitted = []
+
+    for uploaded_file, (content_id, error_message) in zip(uploaded_files, results):
+        job = {
+            "name": uploaded_file.name,
+            "content_id": content_id,
+            "state": INGESTING if error_message is None else FAILED,
+            "error": error_message,
+            "submitted": time.time(),
+            "duration": None,
+        }
+
+        jobs[content_id if content_id is not None else uploaded_file.name] = job
+        submitted.append(job)
+
+    return submitted
+
+async def poll_jobs():
+    """
+    Check which of this session's ingesting contents are done.
+
+    The `isContentDone` queries are issued concurrently, so `batching` sends them in one round trip.
+
+    Returns:
+    The number of contents still ingesting.
+    """
+
+    jobs = get_jobs()
+    content_ids = pending_content_ids()
+
+    results = await asyncio.gather(*[client.is_content_done(content_id) for content_id in content_ids], return_exceptions=True)
+
+    for content_id, result in zip(content_ids, results):
+        job = jobs[content_id]
+
+        if isinstance(result, Exception):
+            # e.g. the content was deleted, or its ingestion errored
+            job["state"] = FAILED
+            job["error"] = str(result)
+        elif result:
+            job["state"] = FINISHED
+            job["duration"] = time.time() - job["submitted"]
+
+    staged_files = get_staged_files()
+    store = staging.get_store()
+
+    # Graphlit has read the staged files of the contents which are done
+    for content_id in [content_id for content_id in staged_files if jobs.get(content_id, {}).get("state") != INGESTING]:
+        key = staged_files.pop(content_id)
+
+        if store is not None:
+            await staging.delete_staged(store, key)
+
+    return sum(1 for job in jobs.values() if job["state"] == INGESTING)
+
+def job_rows():
+    rows = []
+
+    for job in get_jobs().values():
+        if job["state"] == FINISHED:
+            status = f"✅ Finished in {job['duration']:.0f} s"
+        elif job["state"] == FAILED:
+            status = f"❌ {job['error']}"
+        else:
+            status = f"⏳ Ingesting for {time.time() - job['submitted']:.0f} s"
+
+        rows.append({"File": job["name"], "Status": status})
+
+    return rows
+
+def render_jobs():
+    """
+    Show this session's ingestion jobs, with the unfinished ones polled every `POLL_INTERVAL` seconds.
+
+    The table refreshes on its own, without rerunning the page; when a file finishes, the page reruns, so content
+    which depends on it, e.g. a chat input or a graph, picks it up.
+    """
+
+    if get_jobs():
+        jobs_fragment()
+
+@st.fragment(run_every=POLL_INTERVAL)
+def jobs_fragment():
+    finished = len(finished_content_ids())
+
+    if pending_content_ids():
+        run_async_task(poll_jobs)
+
+    jobs = get_jobs()
+    done = sum(1 for job in jobs.values() if job["state"] != INGESTING)
+
+    st.progress(done / len(jobs), text=f"{done} of {len(jobs)} files processed")
+    st.dataframe(job_rows(), hide_index=True)
+
+    if len(finished_content_ids()) != finished:
+        st.rerun()
@@ -0,0 +1,296 @@
+import asyncio
+import threading
+import time
+import uuid
+import streamlit as st
+from graphlit_samples_core import runtime
+
+# job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# session state key of this session's job ids, by job name
+SESSION_KEY = "jobs"
+
+# seconds between progress refreshes
+POLL_INTERVAL = 1
+
+class Job:
+    """
+    A long operation, e.g. summarizing or extracting, running in the background.
+
+    `result` is the return value of the function once `status` is `DONE`; `error` is the exception message if it
+    `FAILED`.
+    """
+
+    def __init__(self, name, async_func, args):
+        self.id = str(uuid.uuid4())
+        self.name = name
+        self.async_func = async_func
+        self.args = args
+
+        self.status = QUEUED
+        self.result = None
+        self.error = None
+
+        self.submitted = time.time()
+        self.started = None
+        self.finished = None
+
+        self.loop = None
+        self.task = None
+        self.cancel_requested = False
+
+    def done(self):
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def duration(self):
+        """
+        Seconds since the job started running, until it finished.
+        """
+
+        if self.started is None:
+            return 0.0
+
+        return (self.finished if self.finished is not None else time.time()) - self.started
+
+class JobManager:
+    """
+    Runs async functions in the background, independently of Streamlit script runs.
+
+    A widget interaction reruns the page script, which abandons whatever `run_async_task` was waiting for. Jobs run on
+    their own thread and event loop instead, so they carry on across reruns, and the page picks up their result
+    by job id, instead of starting over.
+
+    Each job's thread gets the session's script run context, so the function can read and write session state as
+    usual; it shouldn't render elements, since the script run which started it may be over by the time it finishes.
+
+    At most `max_workers` jobs run at once; the others wait as `QUEUED`. Finished jobs are kept for `retention`
+    seconds.
+    """
+
+    def __init__(self, max_workers=8, retention=3600):
+        self.workers = threading.BoundedSemaphore(max_workers)
+        self.retention = retention
+        self.lock = threading.Lock()
+        self.jobs = {}
+
+    def submit(self, name, async_func, *args):
+        from streamlit.runtime.scriptrunner import add_script_run_ctx
+
+        self.prune()
+
+        job = Job(name, async_func, args)
+
+        with self.lock:
+            self.jobs[job.id] = job
+
+        thread = threading.Thread(target=self.run, args=(job,), name=f"graphlit-job-{name}", daemon=True)
+        add_script_run_ctx(thread)
+        thread.start()
+
+        return job
+
+    def run(self, job):
+        with self.workers:
+            # under the lock, so that `cancel` either finds the job queued, and it's cancelled here, or finds its task
+            with self.lock:
+                if job.cancel_requested:
+                    job.status = CANCELLED
+                    job.finished = time.time()
+                    return
+
+                loop = asyncio.new_event_loop()
+
+                job.task = loop.create_task(job.async_func(*job.args))
+                job.loop = loop
+                job.started = time.time()
+                job.status = RUNNING
+
+            status = FAILED
+
+            try:
+                job.result = loop.run_until_complete(job.task)
+                status = DONE
+            except asyncio.CancelledError:
+                status = CANCELLED
+            except Exception as e:
+                job.error = f"{type(e).__name__}: {e}"
+            finally:
+                with self.lock:
+                    # a cancel accepted while the job was finishing wins, so the job doesn't end both cancelled and done
+                    job.status = CANCELLED if job.cancel_requested else status
+                    job.finished = time.time()
+                    job.loop = None
+
+                # e.g. a batch flush the cancelled function was waiting for
+                pending = asyncio.all_tasks(loop)
+
+                for task in pending:
+                    task.cancel()
+
+                # gather needs a task to find the loop
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+                loop.run_until_complete(runtime.close_transports())
+                loop.close()
+
+    def get(self, job_id):
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a queued or running job. A running job is cancelled at its next `await`, and a job which finishes
+        meanwhile ends `CANCELLED` all the same.
+
+        Returns:
+        Whether the job was cancelled.
+        """
+
+        with self.lock:
+            job = self.jobs.get(job_id)
+
+            if job is None or job.done():
+                return False
+
+            job.cancel_requested = True
+
+            loop = job.loop
+            task = job.task
+
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # the loop closed meanwhile, and the job ends cancelled anyway
+                pass
+
+        return True
+
+    def prune(self):
+        cutoff = time.time() - self.retention
+
+        with self.lock:
+            for job_id in [job_id for job_id, job in self.jobs.items() if job.done() and job.finished < cutoff]:
+                del self.jobs[job_id]
+
+_manager = None
+_manager_lock = threading.Lock()
+
+def get_manager():
+    """
+    The process-wide job manager, shared by all Streamlit sessions.
+    """
+
+    global _manager
+
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+
+        return _manager
+
+def session_jobs():
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = {}
+
+    return st.session_state[SESSION_KEY]
+
+def start(name, async_func, *args):
+    """
+    Start a job for this session, unless the job of that name is still running with the same function and arguments,
+    e.g. when the page reruns. A running job with other arguments, e.g. a summary of another type, is cancelled and
+    replaced, so the result is always for the latest inputs. Use `restart` to run a job again with the same arguments.
+
+    Returns:
+    The `Job`.
+    """
+
+    job = get(name)
+
+    if job is not None and not job.done():
+        if job.async_func == async_func and job.args == args:
+            return job
+
+        get_manager().cancel(job.id)
+
+    job = get_manager().submit(name, async_func, *args)
+    session_jobs()[name] = job.id
+
+    return job
+
+def restart(name, async_func, *args):
+    """
+    Start a job for this session, cancelling the running job of that name, e.g. when inputs it reads from session
+    state changed.
+    """
+
+    forget(name)
+
+    return start(name, async_func, *args)
+
+def get(name):
+    """
+    Returns:
+    This session's latest job of that name, or None.
+    """
+
+    job_id = session_jobs().get(name)
+
+    return get_manager().get(job_id) if job_id is not None else None
+
+def cancel(name):
+    job_id = session_jobs().get(name)
+
+    return get_manager().cancel(job_id) if job_id is not None else False
+
+def forget(name):
+    """
+    Cancel and drop this session's job of that name, e.g. when its result no longer applies.
+    """
+
+    cancel(name)
+    session_jobs().pop(name, None)
+
+def render(name, message, render_result):
+    """
+    Show this session's job of that name: its progress and a Cancel button while it runs, refreshed every
+    `POLL_INTERVAL` seconds without rerunning the page, then `render_result(job)` once it's done.
+    """
+
+    job = get(name)
+
+    if job is None:
+        return
+
+    if not job.done():
+        progress_fragment(name, message)
+    elif job.status == FAILED:
+        st.error(job.error)
+    elif job.status == CANCELLED:
+        st.info("Cancelled.")
+    else:
+        render_result(job)
+
+@st.fragment(run_every=POLL_INTERVAL)
+def progress_fragment(name, message):
+    job = get(name)
+
+    if job is None or job.done():
+        # rerun the page, which renders the result
+        st.rerun()
+
+    col1, col2 = st.columns([4, 1])
+
+    with col1:
+        st.info(f"⏳ {message} ({time.time() - job.submitted:.0f} s)")
+
+    with col2:
+        if st.button("Cancel", key=f"cancel_job_{name}"):
+            cancel(name)
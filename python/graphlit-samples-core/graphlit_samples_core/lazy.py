@@ -0,0 +1,40 @@
+import importlib
+
+class LazyModule:
+    """
+    Stand-in for a module which is only imported on first attribute access.
+
+    Heavy dependencies (the generated Graphlit API models, pandas, plotly, pyvis) take most of a page's
+    cold start, and many pages never touch them, so helpers modules reference them through this shim.
+
+    Args:
+    name (str): The fully qualified module name, e.g. `plotly.express`.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+
+        return f"<lazy module '{self._name}' ({state})>"
+
+def lazy_import(name):
+    """
+    Return a module which is imported on first use.
+
+    Args:
+    name (str): The fully qualified module name.
+
+    Returns:
+    A `LazyModule` for the module.
+    """
+
+    return LazyModule(name)
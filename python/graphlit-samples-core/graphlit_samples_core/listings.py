@@ -0,0 +1,111 @@
+import asyncio
+import concurrent.futures
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+# seconds a listing is reused for, before it's queried again
+TTL = 300
+
+# listings kept, least recently used dropped first
+CACHE_SIZE = 256
+
+# listings prefetched at once
+PREFETCH_CONCURRENCY = 4
+
+_listings = OrderedDict()
+_inflight = {}
+_listings_lock = threading.Lock()
+
+def token_key(refresh_token):
+    # refresh tokens are credentials, so they aren't kept as keys
+    return hashlib.sha256(str(refresh_token).encode("utf-8")).hexdigest()
+
+async def cached(refresh_token, key, fetch, ttl=TTL):
+    """
+    List e.g. SharePoint libraries or folders through a process-wide cache, by refresh token (the user's account)
+    and `key`, so picking from a selectbox, which reruns the page, doesn't query Microsoft Graph again.
+
+    `fetch` is an async function which queries the listing. A listing which is being queried, e.g. by a prefetch, is
+    awaited instead of queried again, from any thread or event loop. Failures aren't cached.
+
+    Returns:
+    The result of `fetch`, at most `ttl` seconds old.
+    """
+
+    full_key = (token_key(refresh_token),) + tuple(key)
+
+    while True:
+        with _listings_lock:
+            entry = _listings.get(full_key)
+
+            if entry is not None and entry[0] > time.monotonic():
+                _listings.move_to_end(full_key)
+                return entry[1]
+
+            future = _inflight.get(full_key)
+            owner = future is None
+
+            if owner:
+                future = _inflight[full_key] = concurrent.futures.Future()
+
+        if owner:
+            break
+
+        try:
+            # shielded, so a waiter which is cancelled, e.g. with its job, doesn't cancel the query for the others
+            return await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            # the query was cancelled, e.g. with its prefetch job, so query it here instead
+            if not future.cancelled():
+                raise
+
+    try:
+        value = await fetch()
+
+        with _listings_lock:
+            _listings[full_key] = (time.monotonic() + ttl, value)
+            _listings.move_to_end(full_key)
+
+            while len(_listings) > CACHE_SIZE:
+                _listings.popitem(last=False)
+
+        future.set_result(value)
+
+        return value
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _listings_lock:
+            _inflight.pop(full_key, None)
+
+        # e.g. cancelled, or GeneratorExit when its loop was closed; the waiters query it themselves
+        if not future.done():
+            future.cancel()
+
+def invalidate(refresh_token):
+    """
+    Drop the cached listings of an account, e.g. when the user starts over.
+    """
+
+    prefix = token_key(refresh_token)
+
+    with _listings_lock:
+        for key in [key for key in _listings if key[0] == prefix]:
+            del _listings[key]
+
+async def prefetch(fetches, concurrency=PREFETCH_CONCURRENCY):
+    """
+    Run async functions which fill the cache, e.g. list the folders of every library once the libraries are listed,
+    `concurrency` at a time, so the listing the user picks next is already cached.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(fetch):
+        async with semaphore:
+            await fetch()
+
+    await asyncio.gather(*(run(fetch) for fetch in fetches))
@@ -0,0 +1,15 @@
+"""
+Offline stand-in for the Graphlit Data API, for benchmarking the samples without a Graphlit project.
+
+In-process, routing the session's Graphlit client to the mock:
+
+    from graphlit_samples_core import mock
+
+    server = mock.connect(latency=0.2, error_rate=0.05, seed=1)
+
+Standalone, for running a sample unchanged with `GRAPHLIT_API_URI=http://127.0.0.1:8765/api/v1/graphql`:
+
+    python -m graphlit_samples_core.mock --port 8765 --latency 0.2
+"""
+
+from graphlit_samples_core.mock.server import MockGraphlit, MOCK_API_URI, connect
@@ -0,0 +1,53 @@
+import argparse
+import json
+import time
+from graphlit_samples_core.mock.server import MockGraphlit
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve a mock Graphlit Data API with synthetic data.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on.")
+    parser.add_argument("--latency", type=float, default=0.0, help="Delay added to every response, in seconds.")
+    parser.add_argument("--operation-latency", default=None, help="Delays per operation as JSON, e.g. '{\"PromptConversation\": 2.0}'.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random delay, in seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests which fail.")
+    parser.add_argument("--error-status", type=int, default=500, help="HTTP status of injected failures.")
+    parser.add_argument("--error-mode", choices=["http", "graphql"], default="http", help="Fail with an HTTP status, or with a GraphQL error.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic data and error injection.")
+    parser.add_argument("--graph-size", type=int, nargs=3, default=[100, 400, 8], metavar=("CONTENTS", "OBSERVABLES", "EDGES"), help="Size of the contents graph.")
+    parser.add_argument("--feed-polls", type=int, default=1, help="isFeedDone polls answering false before a feed is done.")
+    parser.add_argument("--content-polls", type=int, default=1, help="isContentDone polls answering false before an asynchronously ingested content is done.")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Requests per second above which requests are throttled with 429.")
+    args = parser.parse_args(argv)
+
+    latency = args.latency
+
+    if args.operation_latency:
+        latency = {"*": args.latency, **json.loads(args.operation_latency)}
+
+    server = MockGraphlit(
+        latency=latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        error_mode=args.error_mode,
+        seed=args.seed,
+        graph_size=tuple(args.graph_size),
+        feed_polls=args.feed_polls,
+        content_polls=args.content_polls,
+        rate_limit=args.rate_limit,
+    )
+
+    httpd = server.serve(args.host, args.port)
+    host, port = httpd.server_address[:2]
+
+    print(f"Mock Graphlit API listening on http://{host}:{port}/api/v1/graphql")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        httpd.shutdown()
+
+if __name__ == "__main__":
+    main()
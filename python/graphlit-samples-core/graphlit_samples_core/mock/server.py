@@ -0,0 +1,476 @@
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from graphlit_samples_core.batching import BATCH_PREFIX, alias_prefix, merged_operations
+from graphlit_samples_core.mock import synthetic
+
+MOCK_API_URI = "http://graphlit.mock/api/v1/graphql"
+
+OPERATION_NAME = re.compile(r"(?:query|mutation)\s+(\w+)")
+
+def lower_first(name):
+    return name[0].lower() + name[1:]
+
+class MockGraphlit:
+    """
+    Offline stand-in for the Graphlit Data API.
+
+    Answers every operation of the generated `graphlit_api` client with synthetic data which validates against
+    its result model. The operations used by the samples return meaningful data: ingested contents keep their name
+    and MIME type, feeds finish after `feed_polls` polls, prompts are answered with citations, and the contents
+    graph and facets come from the deterministic generators in `synthetic`.
+
+    Responses depend only on `seed`, the operation and its variables, so runs are reproducible.
+
+    Args:
+    latency (float | dict): Delay, in seconds, added to every response, or a dict of delays per operation name
+        (e.g. `{"PromptConversation": 2.0}`), with `"*"` as the default.
+    jitter (float): Extra uniformly distributed delay, in seconds.
+    error_rate (float): Fraction of requests which fail.
+    error_status (int): HTTP status of injected failures. 429 responses include a `Retry-After` header.
+    error_mode (str): `"http"` to fail with `error_status`, or `"graphql"` to answer 200 with a GraphQL error.
+    seed (int): Seed for the synthetic data, jitter and error injection.
+    graph_size (tuple): Contents, observables and edges per content in the contents graph.
+    unobserved (iterable): Indexes of the contents without observed entities, which aren't in the contents graph.
+    feed_polls (int): Number of `isFeedDone` polls answering false before a feed is done.
+    content_polls (int): Number of `isContentDone` polls answering false before a content ingested asynchronously
+        (`isSynchronous: false`) is done.
+    list_size (int): Number of items in synthesized lists, e.g. folders or citations.
+    rate_limit (float): Sustained requests per second, with a burst of one second's worth, above which requests are
+        throttled with 429 and `Retry-After`; unlimited if None.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, error_status=500, error_mode="http", seed=0, graph_size=(100, 400, 8), feed_polls=1, list_size=3, rate_limit=None, content_polls=1, unobserved=()):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.error_mode = error_mode
+        self.seed = seed
+        self.graph_size = graph_size
+        self.unobserved = unobserved
+        self.feed_polls = feed_polls
+        self.content_polls = content_polls
+        self.list_size = list_size
+        self.rate_limit = rate_limit
+
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+
+        self.handlers = {
+            "IngestEncodedFile": self.ingest_encoded_file,
+            "IngestUri": self.ingest_uri,
+            "IsFeedDone": self.is_feed_done,
+            "IsContentDone": self.is_content_done,
+            "PromptConversation": self.prompt_conversation,
+            "SummarizeContents": self.summarize_contents,
+            "ExtractContents": self.extract_contents,
+            "QueryContentsGraph": self.query_contents_graph,
+            "CountContents": self.count_contents,
+            "QueryContentsFacets": self.query_contents_facets,
+        }
+
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the request statistics and the feed, content and conversation state.
+        """
+
+        with self.lock:
+            self.requests = Counter()
+            self.errors = Counter()
+            self.bytes_received = Counter()
+            self.bytes_sent = Counter()
+
+        self.reset_state()
+
+    def reset_state(self):
+        """
+        Clear the feed, content and conversation state, but keep the request statistics, e.g. between benchmark runs,
+        so feeds and contents created with the same ids again take as many polls to finish.
+        """
+
+        with self.lock:
+            self.feed_poll_counts = Counter()
+            self.content_poll_counts = Counter()
+            self.message_counts = Counter()
+            self.throttled = Counter()
+            self.tokens = self.rate_limit
+            self.tokens_updated = time.monotonic()
+
+    def stats(self):
+        with self.lock:
+            return {
+                name: {
+                    "requests": self.requests[name],
+                    "errors": self.errors[name],
+                    "bytes_received": self.bytes_received[name],
+                    "bytes_sent": self.bytes_sent[name],
+                    "throttled": self.throttled[name],
+                }
+                for name in sorted(self.requests)
+            }
+
+    def delay_for(self, operation_name):
+        latency = self.latency
+
+        if isinstance(latency, dict):
+            latency = latency.get(operation_name, latency.get("*", 0.0))
+
+        with self.lock:
+            return latency + (self.random.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+
+    def execute(self, body):
+        """
+        Answer one GraphQL request.
+
+        Args:
+        body (bytes): The JSON request body, with `query`, `operationName` and `variables`.
+
+        Returns:
+        The HTTP status, extra response headers and the JSON response body.
+        """
+
+        try:
+            request = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {}, {"errors": [{"message": "Request body is not valid JSON."}]}
+
+        operation_name = request.get("operationName")
+
+        if operation_name is None:
+            match = OPERATION_NAME.search(request.get("query") or "")
+            operation_name = match.group(1) if match is not None else "Unknown"
+
+        variables = request.get("variables") or {}
+
+        with self.lock:
+            self.requests[operation_name] += 1
+            self.bytes_received[operation_name] += len(body or b"")
+
+            wait = self.take_token()
+
+            if wait is not None:
+                self.throttled[operation_name] += 1
+
+                return 429, {"Retry-After": str(math.ceil(wait))}, {"errors": [{"message": "Too many requests."}]}
+
+            fail = self.error_rate > 0 and self.random.random() < self.error_rate
+
+            if fail:
+                self.errors[operation_name] += 1
+
+        if fail:
+            status, headers, payload = self.injected_error(operation_name)
+        elif operation_name.startswith(BATCH_PREFIX):
+            status, headers, payload = 200, {}, self.respond_batch(operation_name, variables)
+        else:
+            status, headers, payload = 200, {}, self.respond(operation_name, variables)
+
+        with self.lock:
+            self.bytes_sent[operation_name] += len(json.dumps(payload))
+
+        return status, headers, payload
+
+    def take_token(self):
+        """
+        Returns:
+        None if the request is within the rate limit, or else the seconds until it would be.
+        """
+
+        if self.rate_limit is None:
+            return None
+
+        now = time.monotonic()
+
+        self.tokens = min(self.rate_limit, self.tokens + (now - self.tokens_updated) * self.rate_limit)
+        self.tokens_updated = now
+
+        if self.tokens < 1:
+            return (1 - self.tokens) / self.rate_limit
+
+        self.tokens -= 1
+
+        return None
+
+    def injected_error(self, operation_name):
+        if self.error_mode == "graphql":
+            return 200, {}, {"data": None, "errors": [{"message": f"Injected failure in {operation_name}.", "path": [lower_first(operation_name)]}]}
+
+        headers = {"Retry-After": "1"} if self.error_status == 429 else {}
+
+        return self.error_status, headers, {"errors": [{"message": f"Injected HTTP {self.error_status}."}]}
+
+    def respond(self, operation_name, variables):
+        import graphlit_api
+
+        model = getattr(graphlit_api, operation_name, None)
+
+        if model is None:
+            return {"data": None, "errors": [{"message": f"Operation {operation_name} is not supported by the mock server."}]}
+
+        # seed from the request itself, so responses don't depend on request order
+        rng = random.Random(f"{self.seed}:{operation_name}:{json.dumps(variables, sort_keys=True)}")
+
+        data = synthetic.synthesize(model, rng, list_size=self.list_size)
+
+        handler = self.handlers.get(operation_name)
+
+        if handler is not None:
+            handler(data, variables, rng)
+        elif operation_name.startswith("DeleteAll"):
+            for item in data[lower_first(operation_name)] or []:
+                item["state"] = "DELETED"
+        elif operation_name.startswith("Create") and len(data) == 1:
+            # e.g. createWorkflow(workflow: {name: ...}) returns the name it was given
+            result = next(iter(data.values()))
+            entity = next(iter(variables.values()), None) if variables else None
+
+            if isinstance(result, dict) and isinstance(entity, dict) and "name" in entity and "name" in result:
+                result["name"] = entity["name"]
+
+        return {"data": data}
+
+    def respond_batch(self, operation_name, variables):
+        """
+        Answer a document merged by `graphlit_samples_core.batching`, one operation at a time.
+        """
+
+        data = {}
+        errors = []
+
+        for index, (name, operation_variables) in enumerate(merged_operations(operation_name, variables)):
+            prefix = alias_prefix(index)
+
+            payload = self.respond(name, operation_variables)
+
+            for key, value in (payload.get("data") or {}).items():
+                data[prefix + key] = value
+
+            for error in payload.get("errors") or []:
+                errors.append(dict(error, path=[prefix + lower_first(name)]))
+
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+    def ingest_encoded_file(self, data, variables, rng):
+        content = data["ingestEncodedFile"]
+        content["name"] = variables.get("name") or content["name"]
+        content["mimeType"] = variables.get("mimeType")
+        content["state"] = "FINISHED" if variables.get("isSynchronous") else "CREATED"
+
+    def ingest_uri(self, data, variables, rng):
+        content = data["ingestUri"]
+        uri = variables.get("uri") or ""
+        content["name"] = variables.get("name") or uri.rstrip("/").rsplit("/", 1)[-1] or content["name"]
+        content["uri"] = uri
+        content["state"] = "FINISHED" if variables.get("isSynchronous") else "CREATED"
+
+    def is_content_done(self, data, variables, rng):
+        content_id = variables.get("id")
+
+        with self.lock:
+            self.content_poll_counts[content_id] += 1
+            polls = self.content_poll_counts[content_id]
+
+        data["isContentDone"]["result"] = polls > self.content_polls
+
+    def is_feed_done(self, data, variables, rng):
+        feed_id = variables.get("id")
+
+        with self.lock:
+            self.feed_poll_counts[feed_id] += 1
+            polls = self.feed_poll_counts[feed_id]
+
+        data["isFeedDone"]["result"] = polls > self.feed_polls
+
+    def prompt_conversation(self, data, variables, rng):
+        import graphlit_api
+
+        conversation_id = variables.get("id") or synthetic.make_id(rng)
+
+        with self.lock:
+            self.message_counts[conversation_id] += 2
+            message_count = self.message_counts[conversation_id]
+
+        result = data["promptConversation"]
+        result["conversation"]["id"] = conversation_id
+        result["messageCount"] = message_count
+        result["message"]["message"] = f"{synthetic.paragraph(rng)} [0]"
+
+        # citations sit below the default optional depth, so are synthesized separately
+        citation_model = graphlit_api.PromptConversationPromptConversationMessageCitations
+
+        result["message"]["citations"] = [dict(synthetic.synthesize(citation_model, rng), index=index) for index in range(self.list_size)]
+
+        contents, observables, edges = self.graph_size
+        result["graph"] = synthetic.contents_graph_dict(max(1, contents // 10), max(1, observables // 10), edges, rng.randint(0, 1 << 30))
+
+    def summarize_contents(self, data, variables, rng):
+        items = data["summarizeContents"]
+        results = []
+
+        # one result per requested summarization
+        for index, summarization in enumerate(variables.get("summarizations") or [{}]):
+            item = dict(items[index % len(items)])
+
+            if summarization.get("type"):
+                item["type"] = summarization["type"]
+
+            item["items"] = [{"text": synthetic.paragraph(rng), "tokens": rng.randint(50, 500), "summarizationTime": "PT2S"}]
+            item["error"] = None
+
+            results.append(item)
+
+        data["summarizeContents"] = results
+
+    def extract_contents(self, data, variables, rng):
+        for item in data["extractContents"]:
+            item["value"] = json.dumps({"title": synthetic.sentence(rng, 4), "topics": [rng.choice(synthetic.WORDS) for _ in range(3)]})
+            item["error"] = None
+
+    def query_contents_graph(self, data, variables, rng):
+        contents, observables, edges = self.graph_size
+
+        content_filter = variables.get("filter") or {}
+        graph_input = variables.get("graph") or {}
+
+        data["contents"]["graph"] = synthetic.contents_graph_page(
+            synthetic.contents_graph_dict(contents, observables, edges, self.seed, self.unobserved),
+            offset=content_filter.get("offset") or 0,
+            limit=content_filter.get("limit"),
+            observable_types=graph_input.get("types"),
+        )
+
+    def count_contents(self, data, variables, rng):
+        # every content of the contents graph, including those without observed entities
+        data["countContents"]["count"] = self.graph_size[0]
+
+    def query_contents_facets(self, data, variables, rng):
+        data["contents"]["results"] = []
+        data["contents"]["facets"] = synthetic.observable_facets(seed=self.seed)
+
+    def transport(self):
+        """
+        In-process transport for the Graphlit client's `httpx.AsyncClient`.
+
+        Latency is awaited on the event loop, so concurrent requests overlap as they would against the real API.
+        """
+
+        import httpx
+
+        async def handle(request):
+            body = request.read()
+            operation_name = None
+
+            try:
+                operation_name = json.loads(body).get("operationName")
+            except ValueError:
+                pass
+
+            delay = self.delay_for(operation_name)
+
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            status, headers, payload = self.execute(body)
+
+            return httpx.Response(status, headers=headers, json=payload)
+
+        return httpx.MockTransport(handle)
+
+    def install(self, graphlit):
+        """
+        Route an existing `graphlit.Graphlit` client to this mock server, in-process.
+        """
+
+        import httpx
+
+        graphlit.client.http_client = httpx.AsyncClient(
+            headers=graphlit.client.headers,
+            transport=self.transport(),
+            timeout=graphlit.client.http_client.timeout,
+        )
+
+        return graphlit
+
+    def serve(self, host="127.0.0.1", port=0):
+        """
+        Serve the mock API over HTTP, on a background thread.
+
+        Returns:
+        The running `http.server.ThreadingHTTPServer`; its URI is `http://{host}:{port}/api/v1/graphql`.
+        """
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive, like the real API
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+
+                try:
+                    operation_name = json.loads(body).get("operationName")
+                except ValueError:
+                    operation_name = None
+
+                delay = server.delay_for(operation_name)
+
+                if delay > 0:
+                    time.sleep(delay)
+
+                status, headers, payload = server.execute(body)
+
+                data = json.dumps(payload).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        httpd = ThreadingHTTPServer((host, port), Handler)
+        httpd.daemon_threads = True
+
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+        return httpd
+
+def connect(server=None, **kwargs):
+    """
+    Create a Graphlit client backed by an in-process mock server, and store it in session state,
+    in place of `graphlit_samples_core.client.connect`.
+
+    Args:
+    server (MockGraphlit): The mock server; a new one is created from `kwargs` if omitted.
+
+    Returns:
+    The mock server.
+    """
+
+    from graphlit_samples_core import client
+
+    server = server if server is not None else MockGraphlit(**kwargs)
+
+    graphlit = client.connect("mock-organization", "mock-environment", "mock-secret", api_uri=MOCK_API_URI)
+
+    server.install(graphlit)
+
+    # install replaces the client's transport, so instrument the mock's instead
+    client.instrument(graphlit)
+
+    return server
@@ -0,0 +1,219 @@
+import datetime
+import enum
+import json
+import math
+import random
+import typing
+import uuid
+from pydantic import BaseModel
+
+OBSERVABLE_TYPES = ["PERSON", "ORGANIZATION", "PLACE", "PRODUCT", "SOFTWARE", "REPO", "EVENT", "LABEL"]
+
+WORDS = [
+    "graph", "knowledge", "entity", "content", "document", "summary", "extraction", "feed",
+    "workflow", "insight", "platform", "search", "vector", "model", "answer", "context",
+]
+
+# preferred enum values, where the first member would be misleading (e.g. CREATED for a finished ingest)
+ENUM_DEFAULTS = {
+    "EntityState": "FINISHED",
+    "ContentTypes": "FILE",
+    "FileTypes": "DOCUMENT",
+    "ConversationRoleTypes": "ASSISTANT",
+}
+
+EPOCH = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+def make_id(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def sentence(rng, words=12):
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+def paragraph(rng, sentences=4):
+    return " ".join(sentence(rng) for _ in range(sentences))
+
+def contents_graph_dict(contents=100, observables=400, edges_per_content=8, seed=0, unobserved=()):
+    """
+    Deterministic knowledge graph, in the JSON shape returned by `queryContentsGraph`.
+
+    The contents in `unobserved`, by index, have no observed entities, so aren't in the graph, as with the real API.
+    """
+
+    rng = random.Random(seed)
+    unobserved = set(unobserved)
+
+    nodes = []
+    edges = []
+
+    for i in range(contents):
+        metadata = {
+            "type": "FILE",
+            "fileType": "DOCUMENT",
+            "fileName": f"document-{i}.pdf",
+            "document": {"title": f"Document {i}", "pageCount": rng.randint(1, 200)},
+        }
+
+        if i not in unobserved:
+            nodes.append({"id": f"content-{i}", "name": f"document-{i}.pdf", "type": "CONTENT", "metadata": json.dumps(metadata)})
+
+    for i in range(observables):
+        nodes.append({"id": f"observable-{i}", "name": f"Entity {i}", "type": OBSERVABLE_TYPES[i % len(OBSERVABLE_TYPES)], "metadata": None})
+
+    for i in range(contents):
+        if i in unobserved:
+            continue
+
+        for j in rng.sample(range(observables), min(edges_per_content, observables)):
+            edges.append({"from": f"content-{i}", "to": f"observable-{j}", "relation": "observed-by"})
+
+    return {"nodes": nodes, "edges": edges}
+
+def contents_graph_page(graph, offset=0, limit=None, observable_types=None):
+    """
+    One page of a graph from `contents_graph_dict`: the contents from index `offset`, with their edges to observables
+    of the given types, and those observables. As with the real API, contents without such edges aren't in the page,
+    so a page may have fewer than `limit` contents before the last one.
+    """
+
+    if not offset and limit is None and not observable_types:
+        return graph
+
+    end = offset + limit if limit is not None else math.inf
+
+    content_nodes = [node for node in graph["nodes"] if node["type"] == "CONTENT" and offset <= int(node["id"][len("content-"):]) < end]
+
+    observable_nodes = {node["id"]: node for node in graph["nodes"] if node["type"] != "CONTENT" and (not observable_types or node["type"] in observable_types)}
+
+    content_ids = {node["id"] for node in content_nodes}
+    edges = [edge for edge in graph["edges"] if edge["from"] in content_ids and edge["to"] in observable_nodes]
+
+    observing = {edge["from"] for edge in edges}
+    observed = {edge["to"] for edge in edges}
+
+    return {"nodes": [node for node in content_nodes if node["id"] in observing] + [node for node_id, node in observable_nodes.items() if node_id in observed], "edges": edges}
+
+def contents_graph(contents=100, observables=400, edges_per_content=8, seed=0):
+    from graphlit_api import QueryContentsGraphContentsGraph
+
+    return QueryContentsGraphContentsGraph.model_validate(contents_graph_dict(contents, observables, edges_per_content, seed))
+
+def observable_facets(count=20, seed=0):
+    """
+    Deterministic observable facets, in the JSON shape returned by `queryContentsFacets`.
+    """
+
+    rng = random.Random(seed)
+
+    return [
+        {
+            "facet": "OBSERVABLE",
+            "count": rng.randint(1, 50),
+            "type": "OBJECT",
+            "value": None,
+            "range": None,
+            "observable": {
+                "type": OBSERVABLE_TYPES[i % len(OBSERVABLE_TYPES)],
+                "observable": {"id": make_id(rng), "name": f"Entity {i}"},
+            },
+        }
+        for i in range(count)
+    ]
+
+def unwrap(annotation):
+    """
+    Strip `Optional[...]` from a type annotation.
+
+    Returns:
+    The inner annotation, and whether it was optional.
+    """
+
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+
+        return args[0], True
+
+    return annotation, False
+
+def synthesize_scalar(name, annotation, rng):
+    lowered = name.lower()
+
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        preferred = ENUM_DEFAULTS.get(annotation.__name__)
+
+        return preferred if preferred in annotation.__members__ else next(iter(annotation)).value
+
+    if annotation is bool:
+        return True
+
+    if annotation is int:
+        return rng.randint(1, 1000)
+
+    if annotation is float:
+        return round(rng.random(), 4)
+
+    if annotation is str:
+        if lowered == "id" or lowered.endswith("id"):
+            return make_id(rng)
+
+        if lowered in ("text", "message", "markdown", "summary", "description", "value"):
+            return paragraph(rng)
+
+        return f"{name} {rng.randint(1, 1000)}"
+
+    # custom scalars are typed as Any by the generated client
+    if "date" in lowered or "time" in lowered:
+        return (EPOCH + datetime.timedelta(seconds=rng.randint(0, 10_000_000))).isoformat()
+
+    if "duration" in lowered:
+        return f"PT{rng.randint(1, 600)}S"
+
+    if "uri" in lowered or "url" in lowered:
+        return f"https://example.com/{make_id(rng)}"
+
+    if "count" in lowered or "size" in lowered or "tokens" in lowered:
+        return rng.randint(1, 1000)
+
+    return f"{name} {rng.randint(1, 1000)}"
+
+def is_nested(annotation):
+    return typing.get_origin(annotation) in (list, typing.List) or (isinstance(annotation, type) and issubclass(annotation, BaseModel))
+
+def synthesize(model, rng, optional_depth=2, list_size=3, depth=0):
+    """
+    Build a JSON object which validates against a generated result model.
+
+    Required fields are always filled; optional objects and lists only down to `optional_depth`, and optional
+    scalars one level further, which keeps payloads for the wide content models close to what the samples request.
+
+    Args:
+    model (type): The pydantic model of the result, e.g. `graphlit_api.IngestEncodedFile`.
+    rng (random.Random): Source of the synthetic values.
+    optional_depth (int): Nesting depth below which optional fields are left null.
+    list_size (int): Number of items in each synthesized list.
+    """
+
+    result = {}
+
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+        annotation, optional = unwrap(field.annotation)
+
+        if optional and depth >= optional_depth + (0 if is_nested(annotation) else 1):
+            result[key] = None
+            continue
+
+        result[key] = synthesize_value(name, annotation, rng, optional_depth, list_size, depth + 1)
+
+    return result
+
+def synthesize_value(name, annotation, rng, optional_depth, list_size, depth):
+    if typing.get_origin(annotation) in (list, typing.List):
+        item, _ = unwrap(typing.get_args(annotation)[0])
+
+        return [synthesize_value(name, item, rng, optional_depth, list_size, depth) for _ in range(list_size)]
+
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return synthesize(annotation, rng, optional_depth, list_size, depth)
+
+    return synthesize_scalar(name, annotation, rng)
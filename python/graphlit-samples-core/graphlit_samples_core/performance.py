@@ -0,0 +1,295 @@
+import math
+import threading
+import time
+
+# seconds; bucket upper bounds grow by 25%, from 1 ms to about an hour, so percentiles are within 12.5%
+BUCKET_BASE = 0.001
+BUCKET_GROWTH = 1.25
+BUCKET_COUNT = 68
+
+# files ingested through these operations count towards ingestion throughput
+INGEST_OPERATIONS = ("IngestEncodedFile", "IngestUri")
+
+FEED_WAIT_SPAN = "feed.wait"
+FEED_GROUP_WAIT_SPAN = "feed.wait_group"
+
+STAGING_SPAN = "staging.upload"
+
+def bucket_index(value):
+    if value <= BUCKET_BASE:
+        return 0
+
+    return min(BUCKET_COUNT - 1, int(math.ceil(math.log(value / BUCKET_BASE, BUCKET_GROWTH))))
+
+def bucket_bound(index):
+    return BUCKET_BASE * BUCKET_GROWTH ** index
+
+class RollingHistogram:
+    """
+    Latency histogram over a rolling time window, in constant memory.
+
+    The window is split into `slots` slots of `window / slots` seconds; each slot keeps fixed log-spaced bucket
+    counts, and the oldest slot is reused as time moves on.
+    """
+
+    def __init__(self, window=3600, slots=60):
+        self.slot_duration = window / slots
+        self.slots = [None] * slots
+        self.lock = threading.Lock()
+
+    def slot(self, now):
+        epoch = int(now // self.slot_duration)
+        index = epoch % len(self.slots)
+
+        slot = self.slots[index]
+
+        if slot is None or slot[0] != epoch:
+            # epoch, bucket counts, count, sum
+            slot = [epoch, [0] * BUCKET_COUNT, 0, 0.0]
+            self.slots[index] = slot
+
+        return slot
+
+    def record(self, value, now=None):
+        now = now if now is not None else time.time()
+
+        with self.lock:
+            slot = self.slot(now)
+            slot[1][bucket_index(value)] += 1
+            slot[2] += 1
+            slot[3] += value
+
+    def recent(self, window, now):
+        oldest = int((now - window) // self.slot_duration)
+        newest = int(now // self.slot_duration)
+
+        with self.lock:
+            return sorted(
+                ([slot[0], list(slot[1]), slot[2], slot[3]] for slot in self.slots if slot is not None and oldest < slot[0] <= newest),
+                key=lambda slot: slot[0],
+            )
+
+    def summary(self, window=None, now=None):
+        """
+        Returns:
+        The count, mean and p50/p95/p99 over the last `window` seconds (default: the whole window), or None if empty.
+        """
+
+        now = now if now is not None else time.time()
+        window = window if window is not None else self.slot_duration * len(self.slots)
+
+        counts = [0] * BUCKET_COUNT
+        count = 0
+        total = 0.0
+
+        for _, slot_counts, slot_count, slot_total in self.recent(window, now):
+            for i, value in enumerate(slot_counts):
+                counts[i] += value
+
+            count += slot_count
+            total += slot_total
+
+        return summarize(counts, count, total)
+
+    def series(self, window=None, now=None):
+        """
+        Returns:
+        Per-slot summaries over the last `window` seconds, as (slot start time, summary) pairs.
+        """
+
+        now = now if now is not None else time.time()
+        window = window if window is not None else self.slot_duration * len(self.slots)
+
+        return [
+            (epoch * self.slot_duration, summarize(slot_counts, slot_count, slot_total))
+            for epoch, slot_counts, slot_count, slot_total in self.recent(window, now)
+        ]
+
+class RollingCounter:
+    """
+    Sum of values over a rolling time window, in constant memory.
+    """
+
+    def __init__(self, window=3600, slots=60):
+        self.slot_duration = window / slots
+        self.slots = [None] * slots
+        self.lock = threading.Lock()
+
+    def add(self, value=1, now=None):
+        now = now if now is not None else time.time()
+        epoch = int(now // self.slot_duration)
+        index = epoch % len(self.slots)
+
+        with self.lock:
+            slot = self.slots[index]
+
+            if slot is None or slot[0] != epoch:
+                slot = [epoch, 0]
+                self.slots[index] = slot
+
+            slot[1] += value
+
+    def total(self, window=None, now=None):
+        now = now if now is not None else time.time()
+        window = window if window is not None else self.slot_duration * len(self.slots)
+
+        oldest = int((now - window) // self.slot_duration)
+        newest = int(now // self.slot_duration)
+
+        with self.lock:
+            return sum(slot[1] for slot in self.slots if slot is not None and oldest < slot[0] <= newest)
+
+    def rate(self, window=None, now=None):
+        """
+        Returns:
+        The average per second over the last `window` seconds.
+        """
+
+        window = window if window is not None else self.slot_duration * len(self.slots)
+
+        return self.total(window, now) / window
+
+def summarize(counts, count, total):
+    if count == 0:
+        return None
+
+    result = {"count": count, "mean": total / count}
+
+    for name, p in [("p50", 0.50), ("p95", 0.95), ("p99", 0.99)]:
+        rank = p * count
+        seen = 0
+
+        for i, value in enumerate(counts):
+            seen += value
+
+            if seen >= rank:
+                result[name] = bucket_bound(i)
+                break
+
+    return result
+
+class PerformanceStore:
+    """
+    Rolling per-operation timings, shared by every session of the Streamlit server.
+
+    Registered as a span exporter of the process-wide tracer, and aggregates:
+    - `graphql`: latency of each GraphQL operation.
+    - `prompt`: latency of `promptConversation`, by model.
+    - `feed_wait`: time spent waiting for feeds, and feed groups, to finish.
+    - ingestion throughput: files ingested and bytes uploaded.
+
+    Memory is bounded by the number of series (at most `max_series` per kind) times the slots per window.
+    """
+
+    def __init__(self, window=3600, slots=60, max_series=100):
+        self.window = window
+        self.slots = slots
+        self.max_series = max_series
+        self.lock = threading.Lock()
+
+        self.histograms = {"graphql": {}, "prompt": {}, "feed_wait": {}}
+        self.errors = {}
+
+        self.ingested_files = RollingCounter(window, slots)
+        self.ingested_bytes = RollingCounter(window, slots)
+
+    def histogram(self, kind, label):
+        series = self.histograms[kind]
+
+        with self.lock:
+            histogram = series.get(label)
+
+            if histogram is None:
+                if len(series) >= self.max_series:
+                    label = "other"
+                    histogram = series.get(label)
+
+                if histogram is None:
+                    histogram = RollingHistogram(self.window, self.slots)
+                    series[label] = histogram
+
+            return histogram
+
+    def error_counter(self, operation):
+        with self.lock:
+            counter = self.errors.get(operation)
+
+            if counter is None:
+                counter = RollingCounter(self.window, self.slots)
+                self.errors[operation] = counter
+
+            return counter
+
+    def export(self, span):
+        duration = span.duration
+        now = span.end_time / 1e9
+
+        if span.kind == "CLIENT":
+            self.histogram("graphql", span.name).record(duration, now)
+
+            if span.status == "ERROR":
+                self.error_counter(span.name).add(1, now)
+                return
+
+            if span.name in INGEST_OPERATIONS:
+                self.ingested_files.add(1, now)
+                self.ingested_bytes.add(span.attributes.get("http.request.body.size", 0), now)
+
+            if span.name == "PromptConversation":
+                self.histogram("prompt", span.attributes.get("gen_ai.response.model") or "unknown").record(duration, now)
+        elif span.name == FEED_WAIT_SPAN:
+            self.histogram("feed_wait", "feeds").record(duration, now)
+        elif span.name == FEED_GROUP_WAIT_SPAN:
+            self.histogram("feed_wait", "feed groups").record(duration, now)
+        elif span.name == STAGING_SPAN and span.status != "ERROR":
+            # staged files are ingested by URI, so their bytes go through the blob store
+            self.ingested_bytes.add(span.attributes.get("staging.bytes.sent", 0), now)
+
+    def summaries(self, kind, window=None):
+        """
+        Returns:
+        A summary per label, e.g. per GraphQL operation, of the series with data in the last `window` seconds.
+        """
+
+        with self.lock:
+            series = list(self.histograms[kind].items())
+
+        summaries = {}
+
+        for label, histogram in sorted(series):
+            summary = histogram.summary(window)
+
+            if summary is not None:
+                summaries[label] = summary
+
+        return summaries
+
+    def error_count(self, operation, window=None):
+        with self.lock:
+            counter = self.errors.get(operation)
+
+        return counter.total(window) if counter is not None else 0
+
+    def reset(self):
+        with self.lock:
+            self.histograms = {kind: {} for kind in self.histograms}
+            self.errors = {}
+
+        self.ingested_files = RollingCounter(self.window, self.slots)
+        self.ingested_bytes = RollingCounter(self.window, self.slots)
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_store():
+    """
+    The process-wide performance store.
+    """
+
+    global _store
+
+    with _store_lock:
+        if _store is None:
+            _store = PerformanceStore()
+
+        return _store
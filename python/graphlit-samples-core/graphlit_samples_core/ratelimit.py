@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+from graphlit_samples_core import tracing
+from graphlit_samples_core.batching import merged_operations
+from graphlit_samples_core.retry import retry_after
+
+# operation classes, most restrictive first; each has its own bucket
+INGEST = "ingest"
+LLM = "llm"
+MUTATION = "mutation"
+QUERY = "query"
+
+LLM_OPERATIONS = ("Prompt", "Summarize", "Extract", "Publish", "Suggest")
+
+# requests per second: (initial, maximum); the limiters start high enough that interactive use never waits,
+# and adapt between a floor and the maximum once the API throttles
+DEFAULT_RATES = {
+    INGEST: (10.0, 40.0),
+    LLM: (10.0, 20.0),
+    MUTATION: (20.0, 80.0),
+    QUERY: (40.0, 160.0),
+}
+
+def operation_class(operation, operation_type):
+    if operation.startswith("Ingest"):
+        return INGEST
+
+    if operation.startswith(LLM_OPERATIONS):
+        return LLM
+
+    return QUERY if operation_type == "query" else MUTATION
+
+class AdaptiveRateLimiter:
+    """
+    Token bucket whose rate adapts to throttling, by additive increase and multiplicative decrease (AIMD).
+
+    Each success raises the rate by `increase` requests per second, spread over a second's worth of requests;
+    a 429 response halves it (`decrease`), at most once per `cooldown`, so a burst of 429s from requests already in
+    flight counts once. A `Retry-After` pauses the bucket until then. The rate settles just below the rate at which
+    the API starts throttling, instead of alternating between bursts and errors.
+
+    Requests wait for a token on their event loop, so the limiter can be shared by every session's thread and loop.
+    """
+
+    def __init__(self, rate, max_rate, min_rate=0.2, increase=1.0, decrease=0.5, cooldown=1.0):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.lock = threading.Lock()
+
+        self.tokens = self.burst()
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.last_decrease = 0.0
+
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def burst(self):
+        # a second's worth of requests
+        return max(1.0, self.rate)
+
+    def try_acquire(self):
+        """
+        Take a token if one is available.
+
+        Returns:
+        0 if a token was taken, or else the seconds until one is expected.
+        """
+
+        with self.lock:
+            now = time.monotonic()
+
+            self.tokens = min(self.burst(), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            if now < self.paused_until:
+                return self.paused_until - now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.requests += 1
+                return 0
+
+            return (1 - self.tokens) / self.rate
+
+    async def acquire(self):
+        # check again after each wait, since the rate may have changed meanwhile
+        while True:
+            wait = self.try_acquire()
+
+            if wait == 0:
+                return
+
+            with self.lock:
+                self.waited += wait
+
+            await asyncio.sleep(wait)
+
+    def on_success(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttled(self, delay=None):
+        with self.lock:
+            now = time.monotonic()
+
+            self.throttled += 1
+
+            if now - self.last_decrease >= self.cooldown:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.last_decrease = now
+
+            # drop the tokens saved up for the burst which was throttled
+            self.tokens = 0.0
+
+            if delay is not None:
+                self.paused_until = max(self.paused_until, now + delay)
+
+    def stats(self):
+        with self.lock:
+            return {"rate": self.rate, "requests": self.requests, "throttled": self.throttled, "waited": self.waited}
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_limiter(operation_class):
+    """
+    The process-wide rate limiter of an operation class, shared by all Streamlit sessions.
+    """
+
+    with _limiters_lock:
+        limiter = _limiters.get(operation_class)
+
+        if limiter is None:
+            rate, max_rate = DEFAULT_RATES[operation_class]
+            limiter = AdaptiveRateLimiter(rate, max_rate)
+            _limiters[operation_class] = limiter
+
+        return limiter
+
+def limiters():
+    with _limiters_lock:
+        return dict(_limiters)
+
+def reset():
+    """
+    Drop the limiters, so they start again from their initial rates, e.g. between benchmark runs.
+    """
+
+    with _limiters_lock:
+        _limiters.clear()
+
+class RateLimitTransport:
+    """
+    httpx transport wrapper which paces requests with the limiter of their operation class, and adapts it to
+    the API's throttling responses. Each operation of a merged document takes a token from the limiter of its own
+    class, so batching doesn't bypass the limits.
+
+    Sits below `retry.RetryTransport`, so retried attempts are paced too.
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+
+    async def handle_async_request(self, request):
+        operation, operation_type, variables = tracing.graphql_request(request)
+        operation_limiters = [get_limiter(operation_class(name, operation_type)) for name, _ in merged_operations(operation, variables)]
+
+        for limiter in operation_limiters:
+            await limiter.acquire()
+
+        response = await self.transport.handle_async_request(request)
+
+        if response.status_code == 429:
+            # one throttled round trip, whatever the number of operations it carried
+            for limiter in set(operation_limiters):
+                limiter.on_throttled(retry_after(response))
+        elif response.status_code < 400:
+            for limiter in operation_limiters:
+                limiter.on_success()
+
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+def install(graphlit):
+    """
+    Pace a `graphlit.Graphlit` client's requests, see `RateLimitTransport`.
+
+    Install after `tracing.instrument` and before `retry.install`.
+    """
+
+    http_client = graphlit.client.http_client
+
+    if not tracing.has_transport(http_client, RateLimitTransport):
+        http_client._transport = RateLimitTransport(http_client._transport)
+
+    return graphlit
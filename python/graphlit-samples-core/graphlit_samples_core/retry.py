@@ -0,0 +1,309 @@
+import asyncio
+import email.utils
+import json
+import random
+import threading
+import time
+from graphlit_samples_core import tracing
+from graphlit_samples_core.batching import BATCH_PREFIX, merged_operations
+
+# error classes
+THROTTLED = "throttled"
+SERVER = "server"
+TIMEOUT = "timeout"
+NETWORK = "network"
+CONNECT = "connect"
+CLIENT = "client"
+
+# the request never reached the API, or was rejected before it ran, so any operation can be resent
+SAFE_TO_RESEND = (THROTTLED, CONNECT)
+
+# failures which count towards opening a circuit; throttling means the API is up
+OUTAGE = (SERVER, TIMEOUT, NETWORK, CONNECT)
+
+# mutations which leave the same state when repeated; LLM operations (e.g. extract, summarize, suggest) aren't,
+# since each run is billed, and a timed out run may still complete
+IDEMPOTENT_MUTATIONS = ("Delete", "Update", "Clear", "Close", "Enable", "Disable", "Add", "Remove")
+
+# mutations which are idempotent when given this variable, e.g. ingesting with an explicit content id re-ingests that content
+IDEMPOTENCY_KEYS = {"Ingest": "id"}
+
+class RetryPolicy:
+    """
+    Which failed Graphlit requests to retry, and when.
+
+    Throttled (429) and connection failures are retried for every operation. Server errors (5xx), timeouts and other
+    network errors are only retried for queries and idempotent mutations, since the API may have applied the first
+    attempt. Client errors (other 4xx) and GraphQL errors are never retried.
+
+    Args:
+    max_attempts (int): Attempts per request, including the first.
+    base_delay (float): Backoff before the first retry, in seconds; doubles on each retry, with full jitter.
+    max_delay (float): Upper bound of a single backoff, including `Retry-After`, in seconds.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=10.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.random = random.Random()
+
+    def classify(self, response=None, error=None):
+        """
+        Returns:
+        The error class of a response or transport exception, or None if the request succeeded.
+        """
+
+        import httpx
+
+        if error is not None:
+            if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+                return CONNECT
+
+            if isinstance(error, httpx.TimeoutException):
+                return TIMEOUT
+
+            if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+                return NETWORK
+
+            return CLIENT
+
+        if response.status_code == 429:
+            return THROTTLED
+
+        if response.status_code in (500, 502, 503, 504):
+            return SERVER
+
+        if response.status_code >= 400:
+            return CLIENT
+
+        return None
+
+    def is_idempotent(self, operation, operation_type, variables):
+        if operation_type == "query":
+            return True
+
+        if operation.startswith(BATCH_PREFIX):
+            # a merged document is idempotent if all its operations are
+            return all(self.is_idempotent(name, operation_type, operation_variables) for name, operation_variables in merged_operations(operation, variables))
+
+        if operation.startswith(IDEMPOTENT_MUTATIONS):
+            return True
+
+        return any(operation.startswith(prefix) and variables.get(key) is not None for prefix, key in IDEMPOTENCY_KEYS.items())
+
+    def should_retry(self, error_class, idempotent, attempt):
+        if attempt + 1 >= self.max_attempts:
+            return False
+
+        return error_class in SAFE_TO_RESEND or (error_class in OUTAGE and idempotent)
+
+    def delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+
+        return self.random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+def retry_after(response):
+    """
+    Returns:
+    The delay requested by a `Retry-After` header, in seconds, or None.
+    """
+
+    value = response.headers.get("Retry-After") if response is not None else None
+
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+class CircuitBreaker:
+    """
+    Fails requests to an endpoint fast during an outage, instead of queuing requests which are bound to fail.
+
+    Opens after `failure_threshold` consecutive requests failed with outage errors (5xx, timeouts, network errors)
+    after their retries, and rejects requests for `reset_timeout` seconds. Then lets one trial request through: the
+    circuit closes if it succeeds, and opens again if it fails, is throttled or is cancelled, so the trial's outcome
+    always decides the next state.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.lock = threading.Lock()
+
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.rejected = 0
+
+    def allow(self):
+        """
+        Returns:
+        A tuple of None if a request may be sent, or else the seconds until the circuit half-opens, and whether the
+        request is the trial of a half-open circuit.
+        """
+
+        with self.lock:
+            if self.state == "closed":
+                return None, False
+
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+
+            if self.state == "open" and remaining <= 0:
+                # let one trial request through
+                self.state = "half-open"
+                return None, True
+
+            self.rejected += 1
+
+            return max(remaining, 0.0), False
+
+    def record(self, error_class, trial=False):
+        with self.lock:
+            if error_class in OUTAGE:
+                self.failures += 1
+
+                if self.state == "half-open" or self.failures >= self.failure_threshold:
+                    self.state = "open"
+                    self.opened_at = time.monotonic()
+            elif error_class == THROTTLED:
+                # throttling means the API is up, but says nothing about the outage ending
+                if trial and self.state == "half-open":
+                    self.state = "open"
+                    self.opened_at = time.monotonic()
+            else:
+                self.state = "closed"
+                self.failures = 0
+
+    def abandon(self, trial=False):
+        """
+        A request ended without an outcome, e.g. it was cancelled; the trial's slot is released by opening again.
+        """
+
+        with self.lock:
+            if trial and self.state == "half-open":
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+def get_breaker(endpoint):
+    """
+    The process-wide circuit breaker of an endpoint, shared by all Streamlit sessions.
+    """
+
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+
+        if breaker is None:
+            breaker = CircuitBreaker()
+            _breakers[endpoint] = breaker
+
+        return breaker
+
+def circuit_open_response(request, operation, wait):
+    import httpx
+
+    body = {"errors": [{"message": f"Graphlit API is unavailable; {operation} was not sent. Retry in {wait:.0f} seconds."}]}
+
+    return httpx.Response(
+        503,
+        headers={"Content-Type": "application/json", "Retry-After": str(int(wait) + 1), "X-Circuit-Breaker": "open"},
+        content=json.dumps(body).encode("utf-8"),
+        request=request,
+    )
+
+class RetryTransport:
+    """
+    httpx transport wrapper which retries transient failures according to a `RetryPolicy`, behind a per-endpoint
+    `CircuitBreaker`.
+
+    Each attempt passes through the wrapped transport, so with tracing underneath, every attempt is recorded
+    with its `graphlit.retry.attempt`.
+    """
+
+    def __init__(self, transport, policy=None):
+        self.transport = transport
+        self.policy = policy if policy is not None else RetryPolicy()
+
+    async def handle_async_request(self, request):
+        operation, operation_type, variables = tracing.graphql_request(request)
+        idempotent = self.policy.is_idempotent(operation, operation_type, variables)
+
+        breaker = get_breaker(f"{request.url.host}{request.url.path}")
+
+        # the breaker is checked once per request, so a request's retries aren't rejected by its own trial
+        wait, trial = breaker.allow()
+
+        if wait is not None:
+            # fail fast with a 503, which the generated client raises as GraphQLClientHttpError
+            return circuit_open_response(request, operation, wait)
+
+        recorded = False
+
+        try:
+            attempt = 0
+
+            while True:
+                token = tracing.retry_attempt.set(attempt)
+
+                response = None
+                error = None
+
+                try:
+                    response = await self.transport.handle_async_request(request)
+                except Exception as e:
+                    error = e
+                finally:
+                    tracing.retry_attempt.reset(token)
+
+                error_class = self.policy.classify(response, error)
+
+                if error_class is None or not self.policy.should_retry(error_class, idempotent, attempt):
+                    # the breaker counts requests, not attempts, so a flaky endpoint doesn't open it
+                    breaker.record(error_class, trial)
+                    recorded = True
+
+                    if error is not None:
+                        raise error
+
+                    return response
+
+                delay = self.policy.delay(attempt, retry_after(response))
+
+                if response is not None:
+                    await response.aclose()
+
+                await asyncio.sleep(delay)
+
+                attempt += 1
+        finally:
+            if not recorded:
+                breaker.abandon(trial)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+def install(graphlit, policy=None):
+    """
+    Retry transient failures of a `graphlit.Graphlit` client's requests, see `RetryTransport`.
+
+    Install after `tracing.instrument`, so each attempt is traced.
+    """
+
+    http_client = graphlit.client.http_client
+
+    if not tracing.has_transport(http_client, RetryTransport):
+        http_client._transport = RetryTransport(http_client._transport, policy)
+
+    return graphlit
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+import weakref
+
+_loop_transports = weakref.WeakSet()
+
+class LoopTransport:
+    """
+    httpx transport which keeps a connection pool per event loop.
+
+    `run_async_task` and every job run on an event loop of their own, while a session has one Graphlit client.
+    A pooled keep-alive connection belongs to the loop which opened it, so reusing it from the next loop fails with
+    `RuntimeError: Event loop is closed`; each loop gets its own pool instead, closed by `close_transports`
+    before the loop is.
+
+    Args:
+    factory (callable): Creates the transport of a loop, e.g. `httpx.AsyncHTTPTransport`.
+    """
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.transports = {}
+        self.lock = threading.Lock()
+
+        _loop_transports.add(self)
+
+    def current(self):
+        loop = asyncio.get_running_loop()
+
+        with self.lock:
+            transport = self.transports.get(loop)
+
+            if transport is None:
+                # the pools of loops which closed without close_transports can't be closed anymore
+                for closed in [other for other in self.transports if other.is_closed()]:
+                    del self.transports[closed]
+
+                transport = self.transports[loop] = self.factory()
+
+            return transport
+
+    async def handle_async_request(self, request):
+        return await self.current().handle_async_request(request)
+
+    async def aclose_loop(self):
+        """
+        Close the pool of the running loop.
+        """
+
+        with self.lock:
+            transport = self.transports.pop(asyncio.get_running_loop(), None)
+
+        if transport is not None:
+            await transport.aclose()
+
+    async def aclose(self):
+        await self.aclose_loop()
+
+async def close_transports():
+    """
+    Close the connection pools of the running loop, before the loop closes.
+    """
+
+    await asyncio.gather(*(transport.aclose_loop() for transport in list(_loop_transports)))
+
+def install(graphlit):
+    """
+    Give a `graphlit.Graphlit` client a connection pool per event loop, see `LoopTransport`.
+
+    Install before the other transport wrappers, since it replaces the client's pool itself.
+    """
+
+    import httpx
+
+    http_client = graphlit.client.http_client
+
+    if isinstance(http_client._transport, httpx.AsyncHTTPTransport):
+        http_client._transport = LoopTransport(httpx.AsyncHTTPTransport)
+
+    return graphlit
+
+def run_async_task(async_func, *args):
+    """
+    Run an asynchronous function in a new event loop.
+
+    The function runs once: transient Graphlit failures are retried per request by `graphlit_samples_core.retry`,
+    whereas running the whole function again would repeat calls which aren't safe to repeat, e.g. ingestion.
+
+    Args:
+    async_func (coroutine): The asynchronous function to execute.
+    *args: Arguments to pass to the asynchronous function.
+
+    Returns:
+    The result of the asynchronous function.
+    """
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        return loop.run_until_complete(async_func(*args))
+    finally:
+        loop.run_until_complete(close_transports())
+        loop.close()
@@ -0,0 +1,307 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import urllib.parse
+from graphlit_samples_core import tracing
+
+# bytes; files above the threshold are staged and ingested by URI instead of Base64 encoded
+DEFAULT_THRESHOLD = 4 * 1024 * 1024
+
+# bytes; S3 multipart uploads need at least 5 MiB per part
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# attempts per chunk, so a dropped connection only resends that chunk
+CHUNK_ATTEMPTS = 3
+
+STAGING_SPAN = "staging.upload"
+
+def file_key(uploaded_file, chunk_size=CHUNK_SIZE, secret=None):
+    """
+    Returns:
+    A stable object key for a Streamlit uploaded file, from its content hash, so uploading the same file again
+    resumes or reuses the staged object. With a `secret`, the hash is keyed, so the key of a publicly served file
+    can't be derived from its content.
+    """
+
+    digest = hmac.new(secret, digestmod=hashlib.sha256) if secret is not None else hashlib.sha256()
+
+    for chunk in read_chunks(uploaded_file, chunk_size):
+        digest.update(chunk)
+
+    return f"{digest.hexdigest()}/{os.path.basename(uploaded_file.name)}"
+
+def read_chunks(uploaded_file, chunk_size):
+    data = memoryview(uploaded_file.getvalue())
+
+    for offset in range(0, len(data), chunk_size):
+        yield data[offset:offset + chunk_size]
+
+class LocalBlobStore:
+    """
+    Stages files in a local directory which is served over HTTP at `base_uri`, e.g. Streamlit's static
+    folder (`server.enableStaticServing`), or a directory behind a web server or tunnel.
+
+    Each upload is written to a `.part` file, with the finished chunks recorded in a manifest next to it, and renamed
+    into place once complete; an interrupted upload resumes from the first missing chunk.
+
+    The directory is readable by anyone who knows a file's URI, so keys are hashed with `secret` (random per process
+    if omitted, so uploads only resume within a process), and files are deleted once ingested.
+    """
+
+    def __init__(self, directory, base_uri, secret=None):
+        self.directory = directory
+        self.base_uri = base_uri.rstrip("/") + "/"
+        self.secret = secret.encode("utf-8") if isinstance(secret, str) else secret if secret is not None else secrets.token_bytes(32)
+
+    def path(self, key):
+        return os.path.join(self.directory, *key.split("/"))
+
+    def exists(self, key):
+        return os.path.exists(self.path(key))
+
+    def begin(self, key, size, chunk_size):
+        """
+        Returns:
+        The indexes of the chunks already uploaded.
+        """
+
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        try:
+            with open(path + ".manifest") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            manifest = None
+
+        if manifest is None or manifest.get("size") != size or manifest.get("chunk_size") != chunk_size:
+            with open(path + ".part", "wb") as f:
+                f.truncate(size)
+
+            manifest = {"size": size, "chunk_size": chunk_size, "chunks": []}
+            self.save_manifest(key, manifest)
+
+        return set(manifest["chunks"])
+
+    def save_manifest(self, key, manifest):
+        path = self.path(key) + ".manifest"
+
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f)
+
+        os.replace(path + ".tmp", path)
+
+    def upload_chunk(self, key, index, chunk_size, data):
+        path = self.path(key)
+
+        with open(path + ".part", "r+b") as f:
+            f.seek(index * chunk_size)
+            f.write(data)
+
+        with open(path + ".manifest") as f:
+            manifest = json.load(f)
+
+        manifest["chunks"] = sorted(set(manifest["chunks"]) | {index})
+        self.save_manifest(key, manifest)
+
+    def complete(self, key):
+        path = self.path(key)
+
+        os.replace(path + ".part", path)
+        os.remove(path + ".manifest")
+
+    def uri(self, key):
+        return self.base_uri + urllib.parse.quote(key)
+
+    def delete(self, key):
+        path = self.path(key)
+
+        for name in (path, path + ".part", path + ".manifest"):
+            try:
+                os.remove(name)
+            except FileNotFoundError:
+                pass
+
+        try:
+            os.rmdir(os.path.dirname(path))
+        except OSError:
+            # e.g. another file of the same content is staged
+            pass
+
+class S3BlobStore:
+    """
+    Stages files in an S3-compatible bucket (AWS S3, MinIO, Cloudflare R2), with multipart uploads; an interrupted
+    upload is found by key and resumes from the parts the bucket already has. Ingested through a presigned URL.
+
+    Requires `boto3`; credentials are read from its usual environment variables and config files.
+    """
+
+    def __init__(self, bucket, endpoint_url=None, prefix="graphlit-staging/", expires_in=3600):
+        import boto3
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.expires_in = expires_in
+        self.s3 = boto3.client("s3", endpoint_url=endpoint_url)
+
+        # the bucket is private, and presigned URLs expire, so keys needn't be secret
+        self.secret = None
+
+        # multipart upload ids by key, used from the worker threads of concurrent uploads
+        self.upload_ids = {}
+        self.lock = threading.Lock()
+
+    def exists(self, key):
+        import botocore.exceptions
+
+        try:
+            self.s3.head_object(Bucket=self.bucket, Key=self.prefix + key)
+            return True
+        except botocore.exceptions.ClientError:
+            return False
+
+    def begin(self, key, size, chunk_size):
+        uploads = self.s3.list_multipart_uploads(Bucket=self.bucket, Prefix=self.prefix + key).get("Uploads", [])
+        upload = next((upload for upload in uploads if upload["Key"] == self.prefix + key), None)
+
+        if upload is None:
+            upload_id = self.s3.create_multipart_upload(Bucket=self.bucket, Key=self.prefix + key)["UploadId"]
+
+            with self.lock:
+                self.upload_ids[key] = upload_id
+
+            return set()
+
+        with self.lock:
+            self.upload_ids[key] = upload["UploadId"]
+
+        parts = self.s3.get_paginator("list_parts").paginate(Bucket=self.bucket, Key=self.prefix + key, UploadId=upload["UploadId"])
+
+        return {part["PartNumber"] - 1 for page in parts for part in page.get("Parts", [])}
+
+    def upload_chunk(self, key, index, chunk_size, data):
+        with self.lock:
+            upload_id = self.upload_ids[key]
+
+        self.s3.upload_part(Bucket=self.bucket, Key=self.prefix + key, UploadId=upload_id, PartNumber=index + 1, Body=bytes(data))
+
+    def complete(self, key):
+        with self.lock:
+            upload_id = self.upload_ids.pop(key)
+
+        pages = self.s3.get_paginator("list_parts").paginate(Bucket=self.bucket, Key=self.prefix + key, UploadId=upload_id)
+        parts = [{"PartNumber": part["PartNumber"], "ETag": part["ETag"]} for page in pages for part in page.get("Parts", [])]
+
+        self.s3.complete_multipart_upload(Bucket=self.bucket, Key=self.prefix + key, UploadId=upload_id, MultipartUpload={"Parts": parts})
+
+    def uri(self, key):
+        return self.s3.generate_presigned_url("get_object", Params={"Bucket": self.bucket, "Key": self.prefix + key}, ExpiresIn=self.expires_in)
+
+    def delete(self, key):
+        self.s3.delete_object(Bucket=self.bucket, Key=self.prefix + key)
+
+async def stage_file(store, uploaded_file, chunk_size=CHUNK_SIZE):
+    """
+    Upload a Streamlit uploaded file to a blob store in chunks, resuming a previous attempt of the same file.
+
+    The blob store calls are blocking, so they run in a worker thread. Each chunk is retried on its own, so a dropped
+    connection resends one chunk instead of the whole file.
+
+    Returns:
+    The key of the staged file, for `delete_staged` once it's ingested, and the URI it can be ingested from.
+    """
+
+    size = len(uploaded_file.getvalue())
+
+    with tracing.get_tracer().span(STAGING_SPAN, **{"staging.bytes.total": size}) as span:
+        key = await asyncio.to_thread(file_key, uploaded_file, chunk_size, store.secret)
+
+        if not await asyncio.to_thread(store.exists, key):
+            done = await asyncio.to_thread(store.begin, key, size, chunk_size)
+
+            sent = 0
+
+            for index, chunk in enumerate(read_chunks(uploaded_file, chunk_size)):
+                if index in done:
+                    continue
+
+                for attempt in range(CHUNK_ATTEMPTS):
+                    try:
+                        await asyncio.to_thread(store.upload_chunk, key, index, chunk_size, chunk)
+                        break
+                    except Exception:
+                        if attempt + 1 == CHUNK_ATTEMPTS:
+                            raise
+
+                        await asyncio.sleep(0.5 * 2 ** attempt)
+
+                sent += len(chunk)
+
+            await asyncio.to_thread(store.complete, key)
+
+            span.attributes["staging.bytes.sent"] = sent
+            span.attributes["staging.chunks.resumed"] = len(done)
+        else:
+            span.attributes["staging.bytes.sent"] = 0
+
+        return key, await asyncio.to_thread(store.uri, key)
+
+async def delete_staged(store, key):
+    """
+    Delete a staged file once Graphlit has read it, so it isn't served or stored any longer than needed.
+
+    Best effort: a file which can't be deleted is only left behind.
+    """
+
+    try:
+        await asyncio.to_thread(store.delete, key)
+    except Exception:
+        pass
+
+_store = None
+_store_lock = threading.Lock()
+_store_configured = False
+
+def get_store():
+    """
+    The blob store configured from the environment, or None if staging is disabled:
+    `GRAPHLIT_STAGING_BUCKET` (and optionally `GRAPHLIT_STAGING_ENDPOINT`) for an S3-compatible bucket, or
+    `GRAPHLIT_STAGING_DIR` and `GRAPHLIT_STAGING_URI` for a local directory served at that URI, with
+    `GRAPHLIT_STAGING_SECRET` to resume uploads across restarts.
+    """
+
+    global _store, _store_configured
+
+    with _store_lock:
+        if not _store_configured:
+            if os.getenv("GRAPHLIT_STAGING_BUCKET"):
+                _store = S3BlobStore(os.getenv("GRAPHLIT_STAGING_BUCKET"), endpoint_url=os.getenv("GRAPHLIT_STAGING_ENDPOINT"))
+            elif os.getenv("GRAPHLIT_STAGING_DIR") and os.getenv("GRAPHLIT_STAGING_URI"):
+                _store = LocalBlobStore(os.getenv("GRAPHLIT_STAGING_DIR"), os.getenv("GRAPHLIT_STAGING_URI"), secret=os.getenv("GRAPHLIT_STAGING_SECRET"))
+
+            _store_configured = True
+
+        return _store
+
+def set_store(store):
+    """
+    Use a blob store in place of the one configured from the environment, e.g. in benchmarks.
+    """
+
+    global _store, _store_configured
+
+    with _store_lock:
+        _store = store
+        _store_configured = True
+
+def threshold():
+    """
+    Returns:
+    The size in bytes above which uploads are staged, from `GRAPHLIT_STAGING_THRESHOLD`.
+    """
+
+    return int(os.getenv("GRAPHLIT_STAGING_THRESHOLD", DEFAULT_THRESHOLD))
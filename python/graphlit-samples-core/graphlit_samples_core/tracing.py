@@ -0,0 +1,478 @@
+import contextlib
+import contextvars
+import json
+import os
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from graphlit_samples_core.batching import BATCH_PREFIX, merged_operations, split_response
+
+# seconds; upper bounds of the Prometheus latency histogram
+LATENCY_BUCKETS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0]
+
+OPERATION_TYPE = re.compile(r"^\s*(query|mutation|subscription)\b")
+
+# set by callers which retry requests, so spans and metrics can tell attempts apart
+retry_attempt = contextvars.ContextVar("graphlit_retry_attempt", default=0)
+
+current_span = contextvars.ContextVar("graphlit_current_span", default=None)
+
+class Span:
+    """
+    A timed operation, in the shape of an OpenTelemetry span.
+    """
+
+    def __init__(self, name, kind="INTERNAL", parent=None, attributes=None):
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent is not None else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent is not None else None
+        self.attributes = dict(attributes or {})
+        self.start_time = time.time_ns()
+        self.end_time = None
+        self.status = "UNSET"
+        self.status_message = None
+
+    @property
+    def duration(self):
+        """
+        Duration in seconds, or None while the span is open.
+        """
+
+        return (self.end_time - self.start_time) / 1e9 if self.end_time is not None else None
+
+    def set_error(self, message):
+        self.status = "ERROR"
+        self.status_message = message
+
+    def end(self):
+        self.end_time = time.time_ns()
+
+        if self.status == "UNSET":
+            self.status = "OK"
+
+    def to_dict(self):
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": self.start_time,
+            "endTimeUnixNano": self.end_time,
+            "attributes": self.attributes,
+            "status": {"code": self.status, "message": self.status_message},
+        }
+
+class FileSpanExporter:
+    """
+    Append finished spans to a file, one JSON object per line, for offline analysis.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def export(self, span):
+        line = json.dumps(span.to_dict())
+
+        with self.lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+
+class InMemorySpanExporter:
+    """
+    Keep the most recent finished spans in memory.
+    """
+
+    def __init__(self, max_spans=10000):
+        self.max_spans = max_spans
+        self.spans = []
+        self.lock = threading.Lock()
+
+    def export(self, span):
+        with self.lock:
+            self.spans.append(span)
+
+            if len(self.spans) > self.max_spans:
+                del self.spans[:len(self.spans) - self.max_spans]
+
+    def clear(self):
+        with self.lock:
+            self.spans = []
+
+class Metrics:
+    """
+    Per-operation request counters and latency histograms, rendered in the Prometheus text format.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = list(buckets)
+        self.lock = threading.Lock()
+        self.requests = {}
+        self.errors = {}
+        self.retries = {}
+        self.bytes = {}
+        self.durations = {}
+
+    def observe(self, operation, status, duration, request_bytes, response_bytes, error=None, attempt=0):
+        with self.lock:
+            key = (operation, str(status))
+            self.requests[key] = self.requests.get(key, 0) + 1
+
+            if error is not None:
+                key = (operation, error)
+                self.errors[key] = self.errors.get(key, 0) + 1
+
+            if attempt > 0:
+                self.retries[operation] = self.retries.get(operation, 0) + 1
+
+            for direction, size in [("request", request_bytes), ("response", response_bytes)]:
+                key = (operation, direction)
+                self.bytes[key] = self.bytes.get(key, 0) + size
+
+            counts, total, count = self.durations.get(operation, ([0] * len(self.buckets), 0.0, 0))
+
+            for i, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    counts[i] += 1
+
+            self.durations[operation] = (counts, total + duration, count + 1)
+
+    def render(self):
+        lines = []
+
+        with self.lock:
+            lines.append("# HELP graphlit_requests_total Graphlit API requests, by operation and HTTP status.")
+            lines.append("# TYPE graphlit_requests_total counter")
+            for (operation, status), value in sorted(self.requests.items()):
+                lines.append(f'graphlit_requests_total{{operation="{operation}",status="{status}"}} {value}')
+
+            lines.append("# HELP graphlit_request_errors_total Failed Graphlit API requests, by operation and error type.")
+            lines.append("# TYPE graphlit_request_errors_total counter")
+            for (operation, error), value in sorted(self.errors.items()):
+                lines.append(f'graphlit_request_errors_total{{operation="{operation}",error="{error}"}} {value}')
+
+            lines.append("# HELP graphlit_request_retries_total Retried Graphlit API requests, by operation.")
+            lines.append("# TYPE graphlit_request_retries_total counter")
+            for operation, value in sorted(self.retries.items()):
+                lines.append(f'graphlit_request_retries_total{{operation="{operation}"}} {value}')
+
+            lines.append("# HELP graphlit_request_bytes_total Graphlit API payload bytes, by operation and direction.")
+            lines.append("# TYPE graphlit_request_bytes_total counter")
+            for (operation, direction), value in sorted(self.bytes.items()):
+                lines.append(f'graphlit_request_bytes_total{{operation="{operation}",direction="{direction}"}} {value}')
+
+            lines.append("# HELP graphlit_request_duration_seconds Graphlit API request latency, by operation.")
+            lines.append("# TYPE graphlit_request_duration_seconds histogram")
+            for operation, (counts, total, count) in sorted(self.durations.items()):
+                for bound, value in zip(self.buckets, counts):
+                    lines.append(f'graphlit_request_duration_seconds_bucket{{operation="{operation}",le="{bound:g}"}} {value}')
+                lines.append(f'graphlit_request_duration_seconds_bucket{{operation="{operation}",le="+Inf"}} {count}')
+                lines.append(f'graphlit_request_duration_seconds_sum{{operation="{operation}"}} {total}')
+                lines.append(f'graphlit_request_duration_seconds_count{{operation="{operation}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+class Tracer:
+    """
+    Records a span and metrics for every Graphlit API request, and passes finished spans to the exporters.
+    """
+
+    def __init__(self, exporters=None):
+        self.exporters = list(exporters or [])
+        self.metrics = Metrics()
+
+    def add_exporter(self, exporter):
+        self.exporters.append(exporter)
+
+    def remove_exporter(self, exporter):
+        self.exporters.remove(exporter)
+
+    @contextlib.contextmanager
+    def span(self, name, kind="INTERNAL", **attributes):
+        """
+        Open a span, which becomes the parent of the spans started inside it, e.g. one per page handler.
+        """
+
+        span = Span(name, kind=kind, parent=current_span.get(), attributes=attributes)
+        token = current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.set_error(f"{type(e).__name__}: {e}")
+            raise
+        finally:
+            current_span.reset(token)
+            self.finish(span)
+
+    def finish(self, span):
+        span.end()
+
+        for exporter in self.exporters:
+            exporter.export(span)
+
+def parse_request(content):
+    """
+    Returns:
+    The GraphQL operation name, type and variables of a request body.
+    """
+
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return "unknown", None, {}
+
+    match = OPERATION_TYPE.match(body.get("query") or "")
+
+    return body.get("operationName") or "anonymous", match.group(1) if match is not None else None, body.get("variables") or {}
+
+def graphql_request(request):
+    """
+    Parse an `httpx.Request` with `parse_request`, once for all the transports it passes through.
+    """
+
+    info = request.extensions.get("graphql")
+
+    if info is None:
+        info = parse_request(request.content)
+        request.extensions["graphql"] = info
+
+    return info
+
+def response_error(status_code, content):
+    """
+    Returns:
+    The error type of a response, or None if it succeeded.
+    """
+
+    if status_code >= 400:
+        return f"http_{status_code}"
+
+    # only parse bodies which may carry errors; graph responses can be megabytes
+    if b'"errors"' not in content:
+        return None
+
+    try:
+        body = json.loads(content)
+    except ValueError:
+        return "invalid_response"
+
+    if isinstance(body, dict) and body.get("errors"):
+        return "graphql"
+
+    return None
+
+def prompt_attributes(content):
+    try:
+        message = json.loads(content)["data"]["promptConversation"]["message"]
+    except (ValueError, KeyError, TypeError):
+        return {}
+
+    return {
+        "gen_ai.system": message.get("modelService"),
+        "gen_ai.response.model": message.get("model"),
+    }
+
+# attributes read from successful responses, by operation
+RESPONSE_ATTRIBUTES = {
+    "PromptConversation": prompt_attributes,
+}
+
+class TracingTransport:
+    """
+    httpx transport wrapper which records every request to the Graphlit API with a `Tracer`.
+
+    A document merged by `batching` is recorded as an internal span, with a client span and metrics per merged
+    operation, so per-operation latencies, errors and retries don't depend on which requests happened to be merged.
+    Its request and response sizes are split evenly between the operations.
+    """
+
+    def __init__(self, transport, tracer):
+        self.transport = transport
+        self.tracer = tracer
+
+    async def handle_async_request(self, request):
+        content = request.content
+        operation, operation_type, variables = graphql_request(request)
+        attempt = retry_attempt.get()
+
+        names = [name for name, _ in merged_operations(operation, variables)]
+        batched = operation.startswith(BATCH_PREFIX)
+
+        span = Span(operation, kind="INTERNAL" if batched else "CLIENT", parent=current_span.get(), attributes={
+            "graphql.operation.name": operation,
+            "graphql.operation.type": operation_type,
+            "http.request.body.size": len(content),
+            "graphlit.retry.attempt": attempt,
+        })
+
+        spans = [span]
+
+        if batched:
+            spans = [
+                Span(name, kind="CLIENT", parent=span, attributes={
+                    "graphql.operation.name": name,
+                    "graphql.operation.type": operation_type,
+                    "http.request.body.size": len(content) // len(names),
+                    "graphlit.retry.attempt": attempt,
+                    "graphlit.batch.size": len(names),
+                })
+                for name in names
+            ]
+
+        start = time.perf_counter()
+
+        try:
+            response = await self.transport.handle_async_request(request)
+
+            # read the body here, so its size and any GraphQL errors are known; the client reads it anyway
+            response_content = await response.aread()
+        except Exception as e:
+            error = type(e).__name__
+            duration = time.perf_counter() - start
+
+            for name, operation_span in zip(names, spans):
+                operation_span.attributes["error.type"] = error
+                operation_span.set_error(str(e))
+
+                self.tracer.metrics.observe(name, "error", duration, len(content) // len(names), 0, error=error, attempt=attempt)
+                self.tracer.finish(operation_span)
+
+            if batched:
+                span.set_error(str(e))
+                self.tracer.finish(span)
+            raise
+
+        duration = time.perf_counter() - start
+        error = response_error(response.status_code, response_content)
+
+        # a GraphQL error of a merged document may only concern some of its operations
+        errors = [error] * len(names)
+
+        if batched and error == "graphql":
+            body = json.loads(response_content)
+            errors = ["graphql" if split_response(body.get("data"), body.get("errors"), index).get("errors") else None for index in range(len(names))]
+
+        for name, operation_span, operation_error in zip(names, spans, errors):
+            operation_span.attributes["http.response.status_code"] = response.status_code
+            operation_span.attributes["http.response.body.size"] = len(response_content) // len(names)
+
+            if operation_error is not None:
+                operation_span.attributes["error.type"] = operation_error
+                operation_span.set_error(operation_error)
+            elif not batched and name in RESPONSE_ATTRIBUTES:
+                operation_span.attributes.update(RESPONSE_ATTRIBUTES[name](response_content))
+
+            self.tracer.metrics.observe(
+                name, response.status_code, duration, len(content) // len(names), len(response_content) // len(names), error=operation_error, attempt=attempt
+            )
+            self.tracer.finish(operation_span)
+
+        if batched:
+            span.attributes["http.response.status_code"] = response.status_code
+            span.attributes["http.response.body.size"] = len(response_content)
+
+            if error is not None:
+                span.set_error(error)
+
+            self.tracer.finish(span)
+
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+def serve_prometheus(tracer, host="0.0.0.0", port=9464):
+    """
+    Serve the tracer's metrics at `/metrics`, on a background thread.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip("/") != "/metrics":
+                self.send_error(404)
+                return
+
+            data = tracer.metrics.render().encode("utf-8")
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    httpd = ThreadingHTTPServer((host, port), Handler)
+    httpd.daemon_threads = True
+
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+
+    return httpd
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+def get_tracer():
+    """
+    The process-wide tracer, shared by all Streamlit sessions.
+
+    Spans are always exported to the performance store read by the Performance page.
+    Configured from the environment on first use:
+    `GRAPHLIT_TRACE_FILE` appends spans as JSON lines to a file, and
+    `GRAPHLIT_METRICS_PORT` serves Prometheus metrics on that port.
+    """
+
+    global _tracer
+
+    with _tracer_lock:
+        if _tracer is None:
+            from graphlit_samples_core import performance
+
+            tracer = Tracer([performance.get_store()])
+
+            if os.getenv("GRAPHLIT_TRACE_FILE"):
+                tracer.add_exporter(FileSpanExporter(os.getenv("GRAPHLIT_TRACE_FILE")))
+
+            if os.getenv("GRAPHLIT_METRICS_PORT"):
+                serve_prometheus(tracer, port=int(os.getenv("GRAPHLIT_METRICS_PORT")))
+
+            _tracer = tracer
+
+        return _tracer
+
+def has_transport(http_client, transport_class):
+    """
+    Whether an `httpx.AsyncClient`'s transport chain already includes a wrapper, e.g. `TracingTransport`.
+    """
+
+    # httpx has no public API to wrap the transport of an existing client
+    transport = http_client._transport
+
+    while transport is not None:
+        if isinstance(transport, transport_class):
+            return True
+
+        transport = getattr(transport, "transport", None)
+
+    return False
+
+def instrument(graphlit, tracer=None):
+    """
+    Record every request made by a `graphlit.Graphlit` client.
+    """
+
+    tracer = tracer if tracer is not None else get_tracer()
+
+    http_client = graphlit.client.http_client
+
+    if not has_transport(http_client, TracingTransport):
+        http_client._transport = TracingTransport(http_client._transport, tracer)
+
+    return graphlit
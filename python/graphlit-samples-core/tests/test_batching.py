@@ -0,0 +1,71 @@
+import asyncio
+import json
+import httpx
+import streamlit as st
+from graphlit_samples_core import batching, mock, ratelimit, tracing
+from graphlit_samples_core.runtime import run_async_task
+
+class ScriptedTransport:
+    """
+    Answers every request with the given JSON body.
+    """
+
+    def __init__(self, body):
+        self.body = body
+
+    async def handle_async_request(self, request):
+        return httpx.Response(200, json=self.body, request=request)
+
+def merged_request():
+    query, operation_name, variables = batching.merge_operations("query", [
+        ("GetFeed", "$id: ID!", " feed(id: $id) { id } ", {"id": "feed-1"}),
+        ("GetContent", "$id: ID!", " content(id: $id) { id } ", {"id": "content-1"}),
+    ])
+
+    body = {"operationName": operation_name, "query": query, "variables": variables}
+
+    return httpx.Request("POST", "https://batching/api/v1/graphql", content=json.dumps(body).encode("utf-8"))
+
+def test_ingestion_is_not_merged():
+    server = mock.connect()
+    graphlit = st.session_state["graphlit"]
+
+    async def gather():
+        await asyncio.gather(
+            graphlit.client.ingest_uri(uri="https://example.com/a.pdf"),
+            graphlit.client.ingest_uri(uri="https://example.com/b.pdf"),
+            graphlit.client.delete_feed("feed-1"),
+            graphlit.client.delete_feed("feed-2"),
+        )
+
+    run_async_task(gather)
+
+    assert server.requests == {"IngestUri": 2, "Batch_DeleteFeed_DeleteFeed": 1}
+
+def test_merged_operations_are_traced_separately():
+    exporter = tracing.InMemorySpanExporter()
+    transport = tracing.TracingTransport(ScriptedTransport({
+        "data": {"b0_feed": {"id": "feed-1"}, "b1_content": None},
+        "errors": [{"message": "Content not found.", "path": ["b1_content"]}],
+    }), tracing.Tracer([exporter]))
+
+    asyncio.run(transport.handle_async_request(merged_request()))
+
+    spans = {span.name: span for span in exporter.spans}
+
+    assert spans["Batch_GetFeed_GetContent"].kind == "INTERNAL"
+    assert spans["GetFeed"].kind == spans["GetContent"].kind == "CLIENT"
+    assert spans["GetFeed"].parent_span_id == spans["GetContent"].parent_span_id == spans["Batch_GetFeed_GetContent"].span_id
+
+    # only the operation the error is about failed
+    assert spans["GetFeed"].status == "OK"
+    assert spans["GetContent"].status == "ERROR"
+    assert set(transport.tracer.metrics.durations) == {"GetFeed", "GetContent"}
+
+def test_merged_operations_take_a_token_each():
+    limiter = ratelimit.get_limiter(ratelimit.QUERY)
+    requests = limiter.requests
+
+    asyncio.run(ratelimit.RateLimitTransport(ScriptedTransport({"data": {}})).handle_async_request(merged_request()))
+
+    assert limiter.requests == requests + 2
@@ -0,0 +1,77 @@
+import json
+from graphlit_api import QueryContentsGraphContentsGraph
+from graphlit_samples_core.columnar import ENTITY_TYPES, ColumnarGraph
+from graphlit_samples_core.graph_search import InvertedIndex
+
+def contents_graph(nodes, edges=()):
+    return QueryContentsGraphContentsGraph.model_validate({"nodes": list(nodes), "edges": list(edges)})
+
+def test_null_file_name_falls_back_to_the_node_name():
+    graph = ColumnarGraph.from_graph(contents_graph([
+        {"id": "content-0", "name": "report.pdf", "type": "CONTENT", "metadata": json.dumps({"type": "FILE", "fileName": None})},
+    ]))
+
+    assert graph.label(0) == "report.pdf"
+
+def test_endpoint_is_upgraded_by_its_typed_record():
+    graph = ColumnarGraph()
+    index = InvertedIndex()
+
+    # the person is only an edge endpoint on the first page
+    graph.merge(contents_graph(
+        [{"id": "content-0", "name": "report.pdf", "type": "CONTENT", "metadata": None}],
+        [{"from": "content-0", "to": "person-0", "relation": "observed-by"}],
+    ))
+    index.update(graph)
+
+    person = graph.ids.code("person-0")
+    version = graph.version
+
+    assert graph.types[person] == -1
+
+    graph.merge(contents_graph([{"id": "person-0", "name": "Ada Lovelace", "type": "PERSON", "metadata": None}]))
+    index.update(graph)
+
+    assert graph.node_count == 2
+    assert graph.types[person] == ENTITY_TYPES.index("PERSON")
+    assert graph.label(person) == "Ada Lovelace"
+    assert graph.version > version
+    assert index.search("lovelace").tolist() == [person]
+
+def test_relabeled_endpoint_no_longer_matches_its_node_id():
+    graph = ColumnarGraph()
+    index = InvertedIndex()
+
+    graph.merge(contents_graph([], [{"from": "content-0", "to": "person-0", "relation": "observed-by"}]))
+    index.update(graph)
+
+    person = graph.ids.code("person-0")
+
+    assert person in index.search("person").tolist()
+
+    graph.merge(contents_graph([{"id": "person-0", "name": "Ada Lovelace", "type": "PERSON", "metadata": None}]))
+    index.update(graph)
+
+    assert person not in index.search("person").tolist()
+    assert index.search("ada").tolist() == [person]
+
+def test_compact_since_resends_upgraded_endpoints():
+    graph = ColumnarGraph()
+
+    graph.merge(contents_graph(
+        [{"id": "content-0", "name": "report.pdf", "type": "CONTENT", "metadata": None}],
+        [{"from": "content-0", "to": "person-0", "relation": "observed-by"}],
+    ))
+
+    counts = graph.node_count, graph.edge_count, len(graph.upgraded)
+
+    graph.merge(contents_graph(
+        [{"id": "person-0", "name": "Ada Lovelace", "type": "PERSON", "metadata": None}],
+        [{"from": "content-0", "to": "place-0", "relation": "observed-by"}],
+    ))
+
+    compact = graph.compact_since(*counts)
+
+    assert [node[0] for node in compact["nodes"]] == ["person-0", "place-0"]
+    assert compact["nodes"][0][1:3] == ["Ada Lovelace", "PERSON"]
+    assert compact["edges"] == [["content-0", "place-0", "observed-by"]]
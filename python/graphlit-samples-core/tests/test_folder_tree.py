@@ -0,0 +1,23 @@
+import asyncio
+from graphlit_samples_core import folder_tree
+
+class Folder:
+    def __init__(self, folder_id):
+        self.folder_id = folder_id
+        self.folder_name = folder_id
+
+def test_crawl_stays_within_its_listing_budget():
+    listed = []
+
+    async def list_folders(folder_id):
+        listed.append(folder_id)
+        await asyncio.sleep(0)
+
+        # a wide drive: 50 folders on each level
+        return [Folder(f"{folder_id or 'root'}/{index}") for index in range(50)], None
+
+    tree = asyncio.run(folder_tree.crawl(list_folders, depth=3, concurrency=8, max_listings=10))
+
+    assert len(listed) == 10
+    assert tree.truncated
+    assert len(tree.children) == 10
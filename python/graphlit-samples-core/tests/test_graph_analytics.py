@@ -0,0 +1,33 @@
+from graphlit_samples_core import graph_analytics
+from graphlit_samples_core.columnar import ColumnarGraph
+from graphlit_samples_core.mock import synthetic
+from graphlit_api import QueryContentsGraphContentsGraph
+
+def test_analyze_after_the_graph_grows():
+    graph_dict = synthetic.contents_graph_dict(contents=40, observables=100, edges_per_content=4)
+
+    graph = ColumnarGraph()
+    graph.merge(QueryContentsGraphContentsGraph.model_validate(synthetic.contents_graph_page(graph_dict, 0, 20)))
+
+    before = graph_analytics.analyze(graph)
+
+    assert graph_analytics.analyze(graph) is before
+
+    # e.g. a page merged in live mode
+    graph.merge(QueryContentsGraphContentsGraph.model_validate(synthetic.contents_graph_page(graph_dict, 20, 20)))
+
+    after = graph_analytics.analyze(graph)
+
+    assert after is not before
+    assert len(after.pagerank) == len(after.communities) == graph.node_count
+
+    # the cached results don't keep the graph
+    assert not hasattr(before, "graph")
+    assert len(before.pagerank) == before.node_count < graph.node_count
+
+    for analytics in (before, after):
+        people = analytics.top_entities("PERSON")
+        path = analytics.shortest_path(int(people[0]), int(people[-1]))
+
+        if path is not None:
+            assert graph.relation_names[analytics.relation(path[0], path[1])] == "observed-by"
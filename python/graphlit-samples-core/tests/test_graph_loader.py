@@ -0,0 +1,38 @@
+from graphlit_samples_core import graph_loader, mock
+from graphlit_samples_core.runtime import run_async_task
+
+def content_count(load):
+    return sum(1 for index in range(load.graph.node_count) if load.graph.node_id(index).startswith("content-"))
+
+def test_pages_past_contents_without_observed_entities():
+    # the second page has no observed entities, so its graph has no contents
+    server = mock.connect(graph_size=(250, 400, 8), unobserved=range(100, 200))
+
+    load = graph_loader.GraphLoad(graph_loader.GraphQuery())
+    run_async_task(graph_loader.load_pages, load)
+
+    assert load.done
+    assert load.offset == 250
+    assert content_count(load) == 150
+
+    # the contents are counted in the first page's round trip
+    assert sum(server.requests.values()) == 3
+
+def test_live_pages_past_new_contents_without_observed_entities():
+    server = mock.connect(graph_size=(100, 400, 8))
+
+    load = graph_loader.GraphLoad(graph_loader.GraphQuery())
+    run_async_task(graph_loader.load_pages, load)
+
+    assert content_count(load) == 100
+
+    # new contents arrive, of which the first page's worth have no observed entities yet
+    server.graph_size = (300, 400, 8)
+    server.unobserved = range(100, 200)
+
+    run_async_task(graph_loader.poll_pages, load)
+    graph_loader.merge_pending(load)
+
+    assert load.live_error is None
+    assert load.offset == 300
+    assert content_count(load) == 200
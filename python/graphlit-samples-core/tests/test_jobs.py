@@ -0,0 +1,67 @@
+import asyncio
+import time
+from graphlit_samples_core import jobs
+
+def wait(job, timeout=5.0):
+    deadline = time.monotonic() + timeout
+
+    while not job.done() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+def test_job_cancelled_while_finishing_ends_cancelled():
+    manager = jobs.JobManager()
+    cancelled = []
+
+    async def finish():
+        # the cancel arrives after the job started, and the function returns before its next await
+        cancelled.append(manager.cancel(next(job.id for job in manager.jobs.values() if job.name == "finish")))
+
+        return "result"
+
+    job = manager.submit("finish", finish)
+    wait(job)
+
+    assert cancelled == [True]
+    assert job.status == jobs.CANCELLED
+    assert not manager.cancel(job.id)
+
+def test_job_cancelled_before_it_runs():
+    manager = jobs.JobManager(max_workers=1)
+
+    async def sleep():
+        await asyncio.sleep(0.05)
+
+    first = manager.submit("first", sleep)
+    second = manager.submit("second", sleep)
+
+    assert manager.cancel(second.id)
+
+    wait(first)
+    wait(second)
+
+    assert first.status == jobs.DONE
+    assert second.status == jobs.CANCELLED
+    assert second.started is None
+
+def test_start_with_other_arguments_replaces_the_running_job():
+    release = []
+
+    async def summarize(summary_type):
+        while not release:
+            await asyncio.sleep(0.001)
+
+        return summary_type
+
+    first = jobs.start("summarize", summarize, "SUMMARY")
+
+    assert jobs.start("summarize", summarize, "SUMMARY") is first
+
+    second = jobs.start("summarize", summarize, "BULLETS")
+    release.append(True)
+
+    wait(first)
+    wait(second)
+
+    assert first.status == jobs.CANCELLED
+    assert second.result == "BULLETS"
+    assert jobs.get("summarize") is second
@@ -0,0 +1,94 @@
+import asyncio
+import pytest
+from graphlit_samples_core import listings
+
+class Listing:
+    """
+    A listing query which waits until released.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.released = asyncio.Event()
+        self.started = asyncio.Event()
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+
+        await self.released.wait()
+
+        return self.value
+
+@pytest.fixture(autouse=True)
+def cache():
+    listings._listings.clear()
+    yield
+    listings._listings.clear()
+
+def test_cancelled_waiter_leaves_the_query_to_the_others():
+    async def scenario():
+        fetch = Listing(["library"])
+
+        owner = asyncio.ensure_future(listings.cached("waiter-token", ("libraries",), fetch))
+        await fetch.started.wait()
+
+        waiter = asyncio.ensure_future(listings.cached("waiter-token", ("libraries",), fetch))
+        other = asyncio.ensure_future(listings.cached("waiter-token", ("libraries",), fetch))
+        await asyncio.sleep(0)
+
+        # e.g. the prefetch job is forgotten
+        waiter.cancel()
+        await asyncio.sleep(0)
+
+        fetch.released.set()
+
+        assert await owner == ["library"]
+        assert await other == ["library"]
+
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert fetch.calls == 1
+
+    asyncio.run(scenario())
+
+def test_cancelled_query_is_taken_over_by_a_waiter():
+    async def scenario():
+        fetch = Listing(["folder"])
+
+        owner = asyncio.ensure_future(listings.cached("owner-token", ("folders",), fetch))
+        await fetch.started.wait()
+
+        waiter = asyncio.ensure_future(listings.cached("owner-token", ("folders",), fetch))
+        await asyncio.sleep(0)
+
+        owner.cancel()
+        await asyncio.sleep(0)
+
+        fetch.released.set()
+
+        assert await waiter == ["folder"]
+        assert fetch.calls == 2
+        assert not listings._inflight
+
+    asyncio.run(scenario())
+
+def test_query_closed_with_its_loop_releases_the_waiters():
+    fetch = Listing(["folder"])
+    query = listings.cached("closed-token", ("folders",), fetch)
+
+    async def start():
+        # runs the query until it waits for the listing, as a task would, then leaves it suspended
+        query.send(None)
+
+    asyncio.run(start())
+
+    future = next(iter(listings._inflight.values()))
+
+    # what the query gets when its abandoned loop is garbage collected
+    query.close()
+
+    assert future.cancelled()
+    assert not listings._inflight
@@ -0,0 +1,89 @@
+import asyncio
+import json
+import httpx
+import pytest
+from graphlit_samples_core import retry
+
+class ScriptedTransport:
+    """
+    Answers with the given statuses in turn, or waits forever on None.
+    """
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.requests = 0
+
+    async def handle_async_request(self, request):
+        self.requests += 1
+        status = self.statuses.pop(0)
+
+        if status is None:
+            await asyncio.Event().wait()
+
+        return httpx.Response(status, json={"data": {}}, request=request)
+
+def graphql_request(host):
+    body = {"operationName": "QueryContents", "query": "query QueryContents { contents { results { id } } }", "variables": {}}
+
+    return httpx.Request("POST", f"https://{host}/api/v1/graphql", content=json.dumps(body).encode("utf-8"))
+
+def half_open_breaker(host):
+    breaker = retry.get_breaker(f"{host}/api/v1/graphql")
+    breaker.state = "open"
+    breaker.opened_at = -breaker.reset_timeout
+
+    return breaker
+
+@pytest.fixture(autouse=True)
+def breakers():
+    retry._breakers.clear()
+    yield
+    retry._breakers.clear()
+
+def test_trial_retries_are_not_rejected():
+    breaker = half_open_breaker("trial-retries")
+    transport = ScriptedTransport([503, 200])
+
+    response = asyncio.run(retry.RetryTransport(transport, retry.RetryPolicy(base_delay=0)).handle_async_request(graphql_request("trial-retries")))
+
+    assert response.status_code == 200
+    assert transport.requests == 2
+    assert breaker.state == "closed"
+
+def test_throttled_trial_opens_again():
+    breaker = half_open_breaker("throttled-trial")
+    transport = ScriptedTransport([429])
+
+    response = asyncio.run(retry.RetryTransport(transport, retry.RetryPolicy(max_attempts=1)).handle_async_request(graphql_request("throttled-trial")))
+
+    assert response.status_code == 429
+    assert breaker.state == "open"
+
+    # and lets another trial through once the reset timeout passes
+    breaker.opened_at = -breaker.reset_timeout
+
+    assert breaker.allow() == (None, True)
+
+def test_cancelled_trial_opens_again():
+    breaker = half_open_breaker("cancelled-trial")
+    transport = ScriptedTransport([None])
+
+    async def cancel_trial():
+        task = asyncio.ensure_future(retry.RetryTransport(transport).handle_async_request(graphql_request("cancelled-trial")))
+
+        await asyncio.sleep(0.01)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_trial())
+
+    assert breaker.state == "open"
+
+@pytest.mark.parametrize("operation", ["ExtractContents", "SummarizeContents", "SuggestConversation"])
+def test_llm_operations_are_not_retried_after_timeouts(operation):
+    policy = retry.RetryPolicy()
+
+    assert not policy.is_idempotent(operation, "mutation", {})
+    assert not policy.should_retry(retry.TIMEOUT, policy.is_idempotent(operation, "mutation", {}), 0)
@@ -0,0 +1,19 @@
+import graphlit
+from graphlit_samples_core import client, mock, runtime
+
+def test_keep_alive_across_event_loops():
+    # the standalone mock keeps connections alive, unlike the in-process transport
+    httpd = mock.MockGraphlit().serve()
+    host, port = httpd.server_address[:2]
+
+    try:
+        graphlit_client = graphlit.Graphlit(organization_id="mock-organization", environment_id="mock-environment", jwt_secret="mock-secret", api_uri=f"http://{host}:{port}/api/v1/graphql")
+        client.instrument(graphlit_client)
+
+        # each call runs on a new event loop, so a connection pooled by the first one can't be reused by the second
+        for _ in range(2):
+            response = runtime.run_async_task(graphlit_client.client.query_contents)
+
+            assert response.contents is not None
+    finally:
+        httpd.shutdown()
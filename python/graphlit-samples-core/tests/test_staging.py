@@ -0,0 +1,47 @@
+import os
+from graphlit_samples_core import ingestion, mock, staging
+from graphlit_samples_core.runtime import run_async_task
+
+class UploadedFile:
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+    def getvalue(self):
+        return self.data
+
+def staged_files(directory):
+    return [name for _, _, names in os.walk(directory) for name in names]
+
+def test_keys_of_public_files_are_secret(tmp_path):
+    uploaded_file = UploadedFile("report.pdf", b"x" * 1000)
+
+    store = staging.LocalBlobStore(str(tmp_path), "http://localhost/staging")
+
+    assert staging.file_key(uploaded_file, secret=store.secret) != staging.file_key(uploaded_file)
+    assert staging.file_key(uploaded_file, secret=store.secret) == staging.file_key(uploaded_file, secret=store.secret)
+
+def test_staged_files_are_deleted_once_ingested(tmp_path, monkeypatch):
+    monkeypatch.setenv("GRAPHLIT_STAGING_THRESHOLD", "100")
+
+    mock.connect(content_polls=1)
+    staging.set_store(staging.LocalBlobStore(str(tmp_path), "http://localhost/staging"))
+
+    try:
+        content_id, error_message = run_async_task(ingestion.ingest_file, UploadedFile("report.pdf", b"x" * 1000))
+
+        assert error_message is None
+        assert staged_files(tmp_path) == []
+
+        # ingested asynchronously, deleted once the content is done
+        ingestion.clear_jobs()
+        run_async_task(ingestion.submit_files, [UploadedFile("slides.pdf", b"y" * 1000)])
+
+        assert len(staged_files(tmp_path)) == 1
+
+        while run_async_task(ingestion.poll_jobs) > 0:
+            pass
+
+        assert staged_files(tmp_path) == []
+    finally:
+        staging.set_store(None)
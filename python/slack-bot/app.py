@@ -18,6 +18,7 @@ graphlit_environment_id = os.getenv("GRAPHLIT_ENV_ID")
 graphlit_secret_key = os.getenv("GRAPHLIT_SECRET_KEY")
 graphlit_url = os.getenv("GRAPHLIT_URL")
 graphlit_conversation_id = os.getenv("GRAPHLIT_CONVERSATION_ID")
+slack_api_url = os.getenv("SLACK_API_URL", WebClient.BASE_URL)
 
 # creating flask app
 flask_app = Flask(__name__)
@@ -53,7 +54,7 @@ def get_graphlit_token(organization_id,
         raise ex
     return token
 
-slack_client = WebClient(token=slack_token)
+slack_client = WebClient(token=slack_token, base_url=slack_api_url)
 token = get_graphlit_token(graphlit_organization_id, graphlit_environment_id, graphlit_secret_key)
 transport = RequestsHTTPTransport(url=graphlit_url, headers={"Authorization": f"Bearer {token}"})
 gql_client = Client(transport=transport)
@@ -0,0 +1,339 @@
+import argparse
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from mock_servers import MockGraphlitAPI, MockSlackAPI
+
+BOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REPLY_PATTERN = re.compile(r"loadtest-(\d+)")
+
+def percentile(values, p):
+    if not values:
+        return None
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(p / 100.0 * len(ordered) + 0.5)) - 1))
+
+    return ordered[index]
+
+def summarize(values):
+    return {
+        "count": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "p99": percentile(values, 99),
+        "max": max(values) if values else None,
+    }
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def post_json(url, payload, headers=None, timeout=None):
+    data = json.dumps(payload).encode("utf-8")
+
+    request = urllib.request.Request(url, data=data, method="POST", headers={"Content-Type": "application/json", **(headers or {})})
+
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+        return response.status
+
+def bot_environment(slack, graphlit):
+    """
+    Environment variables pointing the bot at the local Slack and Graphlit stand-ins.
+    """
+
+    return {
+        "SLACK_BOT_TOKEN": "xoxb-loadtest",
+        "SLACK_CHANNEL": "loadtest",
+        "SLACK_SIGNING_SECRET": "loadtest",
+        "SLACK_API_URL": f"{slack.url}/api/",
+        "GRAPHLIT_ORG_ID": "loadtest-organization",
+        "GRAPHLIT_ENV_ID": "loadtest-environment",
+        "GRAPHLIT_SECRET_KEY": "loadtest-secret",
+        "GRAPHLIT_URL": f"{graphlit.url}/api/v1/graphql",
+        "GRAPHLIT_CONVERSATION_ID": MockGraphlitAPI.conversation_id,
+    }
+
+def start_bot(slack, graphlit, port):
+    """
+    Start `app.py` under Flask's threaded server, pointed at the local Slack and Graphlit stand-ins.
+    """
+
+    env = dict(os.environ)
+    env.update(bot_environment(slack, graphlit))
+
+    return subprocess.Popen(
+        [sys.executable, "-m", "flask", "--app", "app", "run", "--port", str(port), "--with-threads"],
+        cwd=BOT_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+def wait_for_bot(bot_url, timeout=30.0):
+    deadline = time.time() + timeout
+
+    while time.time() < deadline:
+        try:
+            if post_json(bot_url, {"challenge": "loadtest"}, timeout=2.0) == 200:
+                return True
+        except (urllib.error.URLError, ConnectionError, TimeoutError):
+            time.sleep(0.2)
+
+    return False
+
+def message_event(index):
+    return {
+        "token": "loadtest",
+        "team_id": "TLOADTEST",
+        "api_app_id": "ALOADTEST",
+        "type": "event_callback",
+        "event_id": f"EvLOADTEST{index}",
+        "event_time": int(time.time()),
+        "event": {
+            "type": "message",
+            "channel": "CLOADTEST",
+            "user": "ULOADTESTUSER",
+            "text": f"loadtest-{index}",
+            "ts": f"{time.time():.6f}",
+        },
+    }
+
+class EventReplayer:
+    """
+    Replays Slack message events at a fixed rate, emulating Slack's delivery semantics:
+    an event not acknowledged within `retry_timeout` seconds is redelivered with `X-Slack-Retry-Num`,
+    up to `max_retries` times.
+    """
+
+    def __init__(self, bot_url, rate, count, retry_timeout=3.0, max_retries=3, concurrency=64):
+        self.bot_url = bot_url
+        self.rate = rate
+        self.count = count
+        self.retry_timeout = retry_timeout
+        self.max_retries = max_retries
+        self.concurrency = concurrency
+
+        self.lock = threading.Lock()
+        self.sent_at = {}
+        self.ack_latencies = []
+        self.ack_timeouts = 0
+        self.ack_errors = 0
+        self.retries = 0
+
+    def deliver(self, index):
+        payload = message_event(index)
+
+        for attempt in range(self.max_retries + 1):
+            headers = {}
+
+            if attempt > 0:
+                headers = {"X-Slack-Retry-Num": str(attempt), "X-Slack-Retry-Reason": "timeout"}
+
+                with self.lock:
+                    self.retries += 1
+
+            start = time.perf_counter()
+
+            with self.lock:
+                self.sent_at.setdefault(index, start)
+
+            try:
+                post_json(self.bot_url, payload, headers=headers, timeout=self.retry_timeout)
+            except urllib.error.HTTPError:
+                with self.lock:
+                    self.ack_errors += 1
+                return
+            except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+                if isinstance(e, TimeoutError) or isinstance(getattr(e, "reason", None), TimeoutError):
+                    with self.lock:
+                        self.ack_timeouts += 1
+                    continue
+
+                with self.lock:
+                    self.ack_errors += 1
+                return
+
+            with self.lock:
+                self.ack_latencies.append(time.perf_counter() - start)
+            return
+
+    def run(self):
+        start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for index in range(self.count):
+                delay = start + index / self.rate - time.perf_counter()
+
+                if delay > 0:
+                    time.sleep(delay)
+
+                executor.submit(self.deliver, index)
+
+def collect_replies(slack, sent_at):
+    first_reply = {}
+    duplicates = 0
+    errors = 0
+
+    for received_at, _, text in list(slack.messages):
+        match = REPLY_PATTERN.search(text or "")
+
+        # the bot answers failed Graphlit requests with a generic apology
+        if match is None:
+            errors += 1
+            continue
+
+        index = int(match.group(1))
+
+        if index in first_reply:
+            duplicates += 1
+        else:
+            first_reply[index] = received_at
+
+    latencies = [first_reply[index] - sent_at[index] for index in first_reply if index in sent_at]
+
+    return latencies, len(first_reply), duplicates, errors
+
+def run_loadtest(args):
+    slack = MockSlackAPI(latency=args.slack_latency, jitter=args.jitter, seed=args.seed).start(port=args.slack_port)
+    graphlit = MockGraphlitAPI(latency=args.graphlit_latency, jitter=args.jitter, error_rate=args.graphlit_error_rate, seed=args.seed).start(port=args.graphlit_port)
+
+    bot = None
+    bot_url = args.bot_url
+
+    try:
+        if bot_url is None:
+            port = free_port()
+            bot = start_bot(slack, graphlit, port)
+            bot_url = f"http://127.0.0.1:{port}/slack-incoming"
+        else:
+            # replies are only counted if the bot sends them to these stand-ins
+            print("Expecting the bot to run with:", file=sys.stderr)
+
+            for name, value in bot_environment(slack, graphlit).items():
+                print(f"  {name}={value}", file=sys.stderr)
+
+        if not wait_for_bot(bot_url):
+            raise RuntimeError(f"Bot did not become ready at {bot_url}.")
+
+        # ignore calls made by the readiness probe
+        slack.messages.clear()
+        slack.auth_tests = 0
+        slack.requests = 0
+        graphlit.requests = 0
+        graphlit.prompts = 0
+
+        count = int(args.rate * args.duration)
+
+        replayer = EventReplayer(bot_url, args.rate, count, retry_timeout=args.retry_timeout, max_retries=args.max_retries, concurrency=args.concurrency)
+
+        started = time.perf_counter()
+        replayer.run()
+
+        # wait for in-flight replies, up to the drain timeout
+        deadline = time.perf_counter() + args.drain
+        while time.perf_counter() < deadline and len(slack.messages) < count:
+            time.sleep(0.1)
+
+        # allow late duplicates from redelivered events to land
+        time.sleep(min(args.drain, args.graphlit_latency + args.slack_latency + 0.5))
+
+        elapsed = time.perf_counter() - started
+
+        reply_latencies, replied, duplicates, error_replies = collect_replies(slack, replayer.sent_at)
+
+        return {
+            "config": {
+                "rate": args.rate,
+                "duration": args.duration,
+                "slack_latency": args.slack_latency,
+                "graphlit_latency": args.graphlit_latency,
+                "graphlit_error_rate": args.graphlit_error_rate,
+                "jitter": args.jitter,
+                "retry_timeout": args.retry_timeout,
+                "max_retries": args.max_retries,
+            },
+            "events": count,
+            "elapsed": elapsed,
+            "retries": replayer.retries,
+            "ack_timeouts": replayer.ack_timeouts,
+            "ack_errors": replayer.ack_errors,
+            "ack_latency": summarize(replayer.ack_latencies),
+            "reply_latency": summarize(reply_latencies),
+            "replied": replied,
+            "missing_replies": count - replied,
+            "duplicate_replies": duplicates,
+            "error_replies": error_replies,
+            "graphlit_requests": graphlit.requests,
+            "slack_auth_tests": slack.auth_tests,
+            "throughput": replied / elapsed if elapsed > 0 else 0.0,
+        }
+    finally:
+        if bot is not None:
+            bot.terminate()
+            bot.wait(timeout=10)
+
+        slack.stop()
+        graphlit.stop()
+
+def format_seconds(value):
+    return "-" if value is None else f"{value * 1000:.1f} ms"
+
+def print_report(report):
+    print(f"Events sent:         {report['events']} in {report['elapsed']:.1f}s ({report['throughput']:.2f} replies/s)")
+    print(f"Slack retries:       {report['retries']} (ack timeouts {report['ack_timeouts']}, errors {report['ack_errors']})")
+    print(f"Replies:             {report['replied']} (missing {report['missing_replies']}, duplicate {report['duplicate_replies']}, errors {report['error_replies']})")
+    print(f"Graphlit requests:   {report['graphlit_requests']}, Slack auth.test calls: {report['slack_auth_tests']}")
+
+    for name in ["ack_latency", "reply_latency"]:
+        stats = report[name]
+        print(f"{name:<20} p50 {format_seconds(stats['p50'])}, p95 {format_seconds(stats['p95'])}, p99 {format_seconds(stats['p99'])}, max {format_seconds(stats['max'])}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the Slack bot against local Slack and Graphlit stand-ins.")
+    parser.add_argument("--rate", type=float, default=5.0, help="Events per second.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to replay events for.")
+    parser.add_argument("--slack-latency", type=float, default=0.05, help="Artificial Slack API latency, in seconds.")
+    parser.add_argument("--graphlit-latency", type=float, default=1.0, help="Artificial promptConversation latency, in seconds.")
+    parser.add_argument("--graphlit-error-rate", type=float, default=0.0, help="Fraction of Graphlit requests failing with HTTP 500.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, in seconds, on both stand-ins.")
+    parser.add_argument("--retry-timeout", type=float, default=3.0, help="Seconds before Slack redelivers an unacknowledged event.")
+    parser.add_argument("--max-retries", type=int, default=3, help="Redeliveries per event, as done by Slack.")
+    parser.add_argument("--concurrency", type=int, default=64, help="Maximum in-flight event deliveries.")
+    parser.add_argument("--drain", type=float, default=30.0, help="Seconds to wait for outstanding replies.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter and error injection.")
+    parser.add_argument("--bot-url", default=None, help="Use an already running bot instead of starting app.py; needs --slack-port and --graphlit-port.")
+    parser.add_argument("--slack-port", type=int, default=0, help="Port of the Slack stand-in, e.g. the one a --bot-url bot was configured with.")
+    parser.add_argument("--graphlit-port", type=int, default=0, help="Port of the Graphlit stand-in, e.g. the one a --bot-url bot was configured with.")
+    parser.add_argument("--json", dest="json_path", default=None, help="Also write the report as JSON to this path.")
+
+    args = parser.parse_args(argv)
+
+    # on random ports, a bot started separately can't reach the stand-ins, and no reply would ever be counted
+    if args.bot_url is not None and not (args.slack_port and args.graphlit_port):
+        parser.error("--bot-url needs --slack-port and --graphlit-port, the ports of the stand-ins the bot's SLACK_API_URL and GRAPHLIT_URL point at")
+
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    report = run_loadtest(args)
+
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(report, f, indent=2)
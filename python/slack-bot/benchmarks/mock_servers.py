@@ -0,0 +1,163 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+class MockServer:
+    """
+    Local HTTP stand-in with configurable artificial latency.
+
+    Args:
+    latency (float): Fixed delay, in seconds, added to every response.
+    jitter (float): Extra uniformly distributed delay, in seconds.
+    error_rate (float): Fraction of requests answered with HTTP 500.
+    seed (int): Seed for the jitter and error generator, so runs are reproducible.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.httpd = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self, host="127.0.0.1", port=0):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+
+                status, payload = server.dispatch(self.path, self.headers, body)
+
+                data = json.dumps(payload).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+        return self
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+            self.httpd = None
+
+    def dispatch(self, path, headers, body):
+        with self.lock:
+            self.requests += 1
+            delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter > 0 else 0.0)
+            fail = self.error_rate > 0 and self.random.random() < self.error_rate
+
+        if delay > 0:
+            time.sleep(delay)
+
+        if fail:
+            return 500, {"error": "injected failure"}
+
+        return self.handle(path, headers, body)
+
+    def handle(self, path, headers, body):
+        raise NotImplementedError
+
+def parse_body(headers, body):
+    if not body:
+        return {}
+
+    if "json" in (headers.get("Content-Type") or ""):
+        return json.loads(body)
+
+    return {key: values[0] for key, values in parse_qs(body.decode("utf-8")).items()}
+
+class MockSlackAPI(MockServer):
+    """
+    Stand-in for the Slack Web API methods used by the bot (`auth.test`, `chat.postMessage`).
+
+    Every posted message is recorded with its arrival time, so replies can be matched back to events.
+    """
+
+    bot_user_id = "UBOTLOADTEST"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.auth_tests = 0
+        self.messages = []
+
+    def handle(self, path, headers, body):
+        method = path.rstrip("/").rsplit("/", 1)[-1]
+
+        if method == "auth.test":
+            with self.lock:
+                self.auth_tests += 1
+
+            return 200, {"ok": True, "user_id": self.bot_user_id, "user": "loadtest-bot", "team_id": "TLOADTEST"}
+
+        if method == "chat.postMessage":
+            params = parse_body(headers, body)
+
+            with self.lock:
+                self.messages.append((time.perf_counter(), params.get("channel"), params.get("text")))
+                ts = f"{time.time():.6f}"
+
+            return 200, {"ok": True, "channel": params.get("channel"), "ts": ts}
+
+        return 200, {"ok": False, "error": "unknown_method"}
+
+class MockGraphlitAPI(MockServer):
+    """
+    Stand-in for the Graphlit GraphQL endpoint, answering `promptConversation` by echoing the prompt.
+    """
+
+    conversation_id = "00000000-0000-0000-0000-000000000000"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prompts = 0
+
+    def handle(self, path, headers, body):
+        request = json.loads(body or b"{}")
+        query = request.get("query") or ""
+        variables = request.get("variables") or {}
+
+        if "promptConversation" not in query:
+            return 200, {"data": None, "errors": [{"message": "Operation not supported by mock server."}]}
+
+        with self.lock:
+            self.prompts += 1
+            count = self.prompts
+
+        return 200, {
+            "data": {
+                "promptConversation": {
+                    "message": {
+                        "message": f"reply: {variables.get('prompt')}"
+                    },
+                    "messageCount": count * 2,
+                    "conversation": {
+                        "id": variables.get("promptConversationId") or self.conversation_id
+                    }
+                }
+            }
+        }
@@ -1,7 +1,7 @@
 import streamlit as st
 from components import header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit import Graphlit
+from graphlit_samples_core import client as core_client
 
 st.set_page_config(
     page_title="Graphlit Demo Application",
@@ -30,10 +30,7 @@ with col1:
         if submit_credentials:
             if st.session_state['jwt_secret'] and st.session_state['environment_id'] and st.session_state['organization_id']:
                 # Initialize Graphlit client
-                graphlit = Graphlit(organization_id=st.session_state['organization_id'], environment_id=st.session_state['environment_id'], jwt_secret=st.session_state['jwt_secret'])
-
-                st.session_state['graphlit'] = graphlit
-                st.session_state['token'] = graphlit.token
+                core_client.connect(st.session_state['organization_id'], st.session_state['environment_id'], st.session_state['jwt_secret'])
 
                 st.switch_page("pages/1_Ingest_Azure_Blob_Storage_Container.py")
             else:
@@ -2,6 +2,7 @@ import streamlit as st
 from datetime import datetime
 import time
 from other import client
+from graphlit_samples_core import feeds
 
 async def handle_feed(account_name, container_name, storage_key, prefix):
     st.session_state['feed_done'] = False
@@ -28,13 +29,7 @@ async def handle_feed(account_name, container_name, storage_key, prefix):
         start_time = time.time()
 
         with st.spinner('Ingesting feed... Please wait.'):
-            done = False
-            time.sleep(5)
-            while not done:
-                done = await client.is_feed_done()
-
-                if not done:
-                    time.sleep(2)
+            await feeds.wait_for_feed(st.session_state['feed_id'])
 
         st.session_state["feed_done"] = True
 
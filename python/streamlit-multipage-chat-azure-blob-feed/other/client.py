@@ -1,11 +1,39 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
+from graphlit_api import (
+    AzureBlobFeedPropertiesInput,
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    ContentCriteriaInput,
+    ConversationInput,
+    EntityReferenceInput,
+    FeedInput,
+    FeedServiceTypes,
+    FeedTypes,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    ModelServiceTypes,
+    OpenAIModelPropertiesInput,
+    OpenAIModels,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    PromptStrategyInput,
+    PromptStrategyTypes,
+    RerankingModelServiceTypes,
+    RerankingStrategyInput,
+    RetrievalStrategyInput,
+    RetrievalStrategyTypes,
+    SearchTypes,
+    SiteFeedPropertiesInput,
+    SpecificationInput,
+    SpecificationTypes,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
 
 async def create_feed(account_name, container_name, storage_key, prefix):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
     input = FeedInput(
         name=f"{account_name}: {container_name}",
         type=FeedTypes.SITE,
@@ -24,14 +52,7 @@ async def create_feed(account_name, container_name, storage_key, prefix):
         )
     )
 
-    try:
-        response = await graphlit.client.create_feed(input)
-        
-        st.session_state['feed_id'] = response.create_feed.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_feed(input)
 
 async def delete_feed():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -42,19 +63,13 @@ async def delete_feed():
     st.session_state['feed_done'] = None
 
 async def delete_all_feeds():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_feeds()
+    await core_client.delete_all_feeds()
 
     st.session_state['feed_id'] = None
     st.session_state['feed_done'] = None
 
 async def is_feed_done():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    response = await graphlit.client.is_feed_done(st.session_state['feed_id'])
-    
-    return response.is_feed_done.result
+    return await core_client.is_feed_done(st.session_state['feed_id'])
 
 async def create_workflow():
     input = WorkflowInput(
@@ -73,16 +88,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -114,16 +120,7 @@ async def create_specification():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -147,16 +144,7 @@ async def create_conversation():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_conversation(input)
-
-        st.session_state['conversation_id'] = response.create_conversation.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_conversation(input)
 
 async def delete_conversation():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
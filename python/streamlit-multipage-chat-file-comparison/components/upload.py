@@ -1,8 +1,6 @@
 import streamlit as st
 import time
 from datetime import datetime
-import base64
-import os
 from other import client
 
 async def handle_upload(uploaded_file):
@@ -20,19 +18,9 @@ async def handle_upload(uploaded_file):
         st.session_state["content_id"] = None
 
     start_time = time.time()
-        
-    # Read the file content
-    file_content = uploaded_file.getvalue()
-    
-    base64_content = base64.b64encode(file_content).decode('utf-8')
-
-    file_name = uploaded_file.name
-
-    # Split the file name into the name and extension
-    content_name, _ = os.path.splitext(file_name)
 
     with st.spinner('Ingesting file... Please wait.'):
-        error_message = await client.ingest_file(content_name, uploaded_file.type, base64_content)
+        error_message = await client.ingest_file(uploaded_file)
 
         if error_message is not None:
             st.error(f"Failed to ingest file. {error_message}")
@@ -1,17 +1,44 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
-
-async def ingest_file(name, mime_type, data):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.ingest_encoded_file(name, data, mime_type, is_synchronous=True, workflow=EntityReferenceInput(id=st.session_state['workflow_id']))
-        
-        st.session_state['content_id'] = response.ingest_encoded_file.id
-    except GraphQLClientError as e:
-        return str(e)
+from graphlit_api import (
+    AnthropicModelPropertiesInput,
+    AnthropicModels,
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    CohereModelPropertiesInput,
+    CohereModels,
+    ConversationInput,
+    EntityReferenceInput,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    GroqModelPropertiesInput,
+    GroqModels,
+    ModelServiceTypes,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    PromptStrategyInput,
+    PromptStrategyTypes,
+    RerankingModelServiceTypes,
+    RerankingStrategyInput,
+    RetrievalStrategyInput,
+    RetrievalStrategyTypes,
+    SearchTypes,
+    SpecificationInput,
+    SpecificationTypes,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core import ingestion
+
+async def ingest_file(uploaded_file):
+    content_id, error_message = await ingestion.ingest_file(uploaded_file, st.session_state['workflow_id'])
+
+    if error_message is not None:
+        return error_message
+
+    st.session_state['content_id'] = content_id
 
     return None
 
@@ -24,9 +51,7 @@ async def delete_content():
     st.session_state['content_done'] = None
 
 async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents()
+    await core_client.delete_all_contents()
 
     st.session_state['content_id'] = None
     st.session_state['content_done'] = None
@@ -48,16 +73,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -1,69 +1,6 @@
 import streamlit as st
-import asyncio
-from typing import Optional, List
-from graphlit_api import *
-
-def run_async_task(async_func, *args):
-    """
-    Run an asynchronous function in a new event loop.
-
-    Args:
-    async_func (coroutine): The asynchronous function to execute.
-    *args: Arguments to pass to the asynchronous function.
-
-    Returns:
-    None
-    """
-    
-    loop = None
-
-    try:
-        loop = asyncio.new_event_loop()
-        return loop.run_until_complete(async_func(*args))
-    except:
-        # Close the existing loop if open
-        if loop is not None:
-            loop.close()
-
-        # Create a new loop for retry
-        loop = asyncio.new_event_loop()
-
-        return loop.run_until_complete(async_func(*args))
-    finally:
-        if loop is not None:
-            loop.close()
-
-def select_emoji(content_type, file_type):
-    # Emoji mappings for content types
-    content_emoji_map = {
-        "FILE": "📄",  # Default for files, overridden by specific file types below
-        "PAGE": "🌐",
-        "MESSAGE": "💬",
-        "TEXT": "📝",
-        "POST": "📰",
-        "EMAIL": "📧",
-        "EVENT": "📅",
-        "ISSUE": "🐛",
-    }
-
-    # Emoji mappings for file types (used only if content_type is "FILE")
-    file_emoji_map = {
-        "VIDEO": "🎥",
-        "AUDIO": "🎵",
-        "IMAGE": "🖼️",
-        "DOCUMENT": "📃",
-        "EMAIL": "📧",
-        "CODE": "💻",
-        "DATA": "📊",
-    }
-
-    # Select the appropriate emoji
-    if content_type == "FILE" and file_type is not None:
-        # Return the emoji corresponding to the specific file type
-        return file_emoji_map.get(file_type, "📄")
-    else:
-        # Return the emoji corresponding to the content type
-        return content_emoji_map.get(content_type, "📄")
+from graphlit_samples_core.runtime import run_async_task
+from graphlit_samples_core.citations import select_emoji
 
 def get_file_types_documents():
     """
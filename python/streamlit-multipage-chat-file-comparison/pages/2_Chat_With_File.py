@@ -2,7 +2,6 @@ import streamlit as st
 from other import helpers
 from components import prompt, header, sidebar, session_state
 #from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -17,10 +17,6 @@ def reset_session_state():
     # app-specific session state
     if 'workflow_id' not in st.session_state:
         st.session_state['workflow_id'] = None
-    if 'content_id' not in st.session_state:
-        st.session_state['content_id'] = None
-    if 'content_done' not in st.session_state:
-        st.session_state['content_done'] = None    
     if 'specification_id' not in st.session_state:
         st.session_state['specification_id'] = None
     if 'conversation_id' not in st.session_state:
@@ -1,35 +1,51 @@
+import asyncio
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
-
-async def ingest_file(name, mime_type, data):
+from graphlit_api import (
+    AnthropicModelPropertiesInput,
+    AnthropicModels,
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    ConversationInput,
+    ConversationStrategyInput,
+    EntityReferenceInput,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    ModelServiceTypes,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    PromptStrategyInput,
+    PromptStrategyTypes,
+    RerankingModelServiceTypes,
+    RerankingStrategyInput,
+    RetrievalStrategyInput,
+    RetrievalStrategyTypes,
+    SearchTypes,
+    SpecificationInput,
+    SpecificationTypes,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core import ingestion
+
+async def submit_files(uploaded_files):
+    return await ingestion.submit_files(uploaded_files, st.session_state['workflow_id'])
+
+async def delete_contents():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
 
-    try:
-        response = await graphlit.client.ingest_encoded_file(name, data, mime_type, is_synchronous=True, workflow=EntityReferenceInput(id=st.session_state['workflow_id']))
-        
-        st.session_state['content_id'] = response.ingest_encoded_file.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
-
-async def delete_content():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    content_ids = [job["content_id"] for job in ingestion.get_jobs().values() if job["content_id"] is not None]
 
-    _ = await graphlit.client.delete_content(st.session_state['content_id'])
+    _ = await asyncio.gather(*[graphlit.client.delete_content(content_id) for content_id in content_ids])
 
-    st.session_state['content_id'] = None
-    st.session_state['content_done'] = None
+    ingestion.clear_jobs()
 
 async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents()
+    await core_client.delete_all_contents()
 
-    st.session_state['content_id'] = None
-    st.session_state['content_done'] = None
+    ingestion.clear_jobs()
 
 async def create_workflow():
     input = WorkflowInput(
@@ -48,16 +64,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -92,16 +99,7 @@ async def create_specification():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -118,16 +116,7 @@ async def create_conversation():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_conversation(input)
-
-        st.session_state['conversation_id'] = response.create_conversation.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_conversation(input)
 
 async def delete_conversation():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -2,7 +2,7 @@ import streamlit as st
 from other import helpers
 from components import prompt, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
+from graphlit_samples_core import ingestion
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -14,7 +14,9 @@ else:
     col1, col2 = st.columns(2)
 
     with col1:
-        if st.session_state['content_done'] == True:
+        ingestion.render_jobs()
+
+        if ingestion.finished_content_ids():
             if "messages" not in st.session_state:
                 st.session_state.messages = []
 
@@ -45,6 +47,8 @@ else:
                         # render citations
                         if citations is not None:
                             helpers.render_citations(citations)
+        elif ingestion.pending_content_ids():
+            st.info("Chat becomes available as soon as the first file is ingested.")
         else:
             st.info("Please ingest files to chat with.")   
 
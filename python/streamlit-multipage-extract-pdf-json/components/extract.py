@@ -1,39 +1,46 @@
+import asyncio
 import streamlit as st
 from datetime import datetime
-import time
 from other import client
 
-async def handle_extract():        
-    if st.session_state['specification_id'] is not None:
-        with st.spinner('Deleting existing specification... Please wait.'):
-            await client.delete_specification()
-        st.session_state["specification_id"] = None
+async def handle_extract():
+    """
+    Runs as a background job (`graphlit_samples_core.jobs`), which carries on if the page reruns meanwhile,
+    so it returns errors instead of rendering them.
+
+    Returns:
+    The extracted JSON and None, or None and an error message.
+    """
 
-    if st.session_state['specification_id'] is None:
+    if st.session_state['specification_id'] is not None:
+        # the delete doesn't depend on the create, so both are sent in one round trip; the delete only clears the id it deleted
+        _, error_message = await asyncio.gather(client.delete_specification(), client.create_specification("extractJSON", st.session_state["schema"]))
+    else:
         error_message = await client.create_specification("extractJSON", st.session_state["schema"])
 
-        if error_message is not None:
-            st.error(f"Failed to create specification. {error_message}")
-        else:
-            start_time = time.time()
+    if error_message is not None:
+        return None, f"Failed to create specification. {error_message}"
+
+    response, error_message = await client.extract_contents()
+
+    if error_message is not None:
+        return None, f"Failed to extract JSON. {error_message}"
+
+    return response, None
 
-            with st.spinner('Extracting JSON... Please wait.'):
-                response, error_message = await client.extract_contents()
-            
-                if error_message is not None:
-                    st.error(f"Failed to extract JSON. {error_message}")
-                    return
+def render_extraction(job):
+    response, error_message = job.result
 
-                if response is not None:
-                    st.subheader("Extracted JSON (with page-level extraction):")
-                    st.json(response)
-                else:
-                    st.text("No JSON was extracted.")
+    if error_message is not None:
+        st.error(error_message)
+        return
 
-                duration = time.time() - start_time
+    if response is not None:
+        st.subheader("Extracted JSON (with page-level extraction):")
+        st.json(response)
+    else:
+        st.text("No JSON was extracted.")
 
-                current_time = datetime.now()
-                formatted_time = current_time.strftime("%H:%M:%S")
+    formatted_time = datetime.fromtimestamp(job.finished).strftime("%H:%M:%S")
 
-                st.success(f"JSON extraction took {duration:.2f} seconds. Finished at {formatted_time} UTC.")
-    
\ No newline at end of file
+    st.success(f"JSON extraction took {job.duration:.2f} seconds. Finished at {formatted_time} UTC.")
@@ -2,17 +2,40 @@ import streamlit as st
 import json
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
+from graphlit_api import (
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    ContentFilter,
+    EntityExtractionConnectorInput,
+    EntityExtractionServiceTypes,
+    EntityReferenceInput,
+    ExtractionWorkflowJobInput,
+    ExtractionWorkflowStageInput,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    ModelServiceTypes,
+    ObservableTypes,
+    OpenAIModelPropertiesInput,
+    OpenAIModels,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    SearchTypes,
+    SpecificationInput,
+    SpecificationTypes,
+    ToolDefinitionInput,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core import ingestion
 
 async def ingest_file(uri):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    content_id, error_message = await ingestion.ingest_uri(uri, st.session_state['workflow_id'])
 
-    try:
-        response = await graphlit.client.ingest_uri(uri, is_synchronous=True, workflow=EntityReferenceInput(id=st.session_state['workflow_id']))
-        
-        st.session_state['content_id'] = response.ingest_uri.id
-    except GraphQLClientError as e:
-        return str(e)
+    if error_message is not None:
+        return error_message
+
+    st.session_state['content_id'] = content_id
 
     return None
 
@@ -35,9 +58,7 @@ async def delete_content():
     st.session_state['content_done'] = None
 
 async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents()
+    await core_client.delete_all_contents()
 
     st.session_state['content_id'] = None
     st.session_state['content_done'] = None
@@ -72,16 +93,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -110,23 +122,17 @@ async def create_specification(name, schema):
         ]
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    specification_id = st.session_state['specification_id']
 
-    _ = await graphlit.client.delete_specification(st.session_state['specification_id'])
+    _ = await graphlit.client.delete_specification(specification_id)
 
-    st.session_state['specification_id'] = None
+    # unless a specification was created meanwhile, e.g. concurrently with this delete
+    if st.session_state['specification_id'] == specification_id:
+        st.session_state['specification_id'] = None
 
 async def extract_contents():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -3,7 +3,6 @@ import json
 from other import client, helpers
 from components import extract, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
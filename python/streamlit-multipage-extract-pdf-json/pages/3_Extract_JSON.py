@@ -2,7 +2,7 @@ import streamlit as st
 from other import client, helpers
 from components import extract, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
+from graphlit_samples_core import jobs
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -33,7 +33,14 @@ else:
                     with st.expander("See document text:", expanded=False):
                         st.markdown(content.markdown)
 
-                helpers.run_async_task(extract.handle_extract)
+                # extract once per document and schema, rather than on every rerun of the page
+                extraction = (st.session_state['content_id'], st.session_state['schema'])
+
+                if st.session_state.get('extraction') != extraction:
+                    st.session_state['extraction'] = extraction
+                    jobs.restart("extract", extract.handle_extract)
+
+                jobs.render("extract", "Extracting JSON... Please wait.", extract.render_extraction)
         else:
             st.info("Please upload a file to extract.")   
 
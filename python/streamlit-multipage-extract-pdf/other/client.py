@@ -1,17 +1,31 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
+from graphlit_api import (
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    EntityExtractionConnectorInput,
+    EntityExtractionServiceTypes,
+    ExtractionWorkflowJobInput,
+    ExtractionWorkflowStageInput,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    ObservableTypes,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core import ingestion
 
 async def ingest_file(uri):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    content_id, error_message = await ingestion.ingest_uri(uri, st.session_state['workflow_id'])
 
-    try:
-        response = await graphlit.client.ingest_uri(uri, is_synchronous=True, workflow=EntityReferenceInput(id=st.session_state['workflow_id']))
-        
-        st.session_state['content_id'] = response.ingest_uri.id
-    except GraphQLClientError as e:
-        return str(e)
+    if error_message is not None:
+        return error_message
+
+    st.session_state['content_id'] = content_id
 
     return None
 
@@ -34,9 +48,7 @@ async def delete_content():
     st.session_state['content_done'] = None
 
 async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents()
+    await core_client.delete_all_contents()
 
     st.session_state['content_id'] = None
     st.session_state['content_done'] = None
@@ -71,16 +83,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -1,39 +1,11 @@
 import streamlit as st
-import asyncio
-from typing import List
-from graphlit_api import *
+from typing import List, TYPE_CHECKING
+from graphlit_samples_core.runtime import run_async_task
 
-def run_async_task(async_func, *args):
-    """
-    Run an asynchronous function in a new event loop.
+if TYPE_CHECKING:
+    from graphlit_api import GetContentContentObservations
 
-    Args:
-    async_func (coroutine): The asynchronous function to execute.
-    *args: Arguments to pass to the asynchronous function.
-
-    Returns:
-    None
-    """
-    
-    loop = None
-
-    try:
-        loop = asyncio.new_event_loop()
-        return loop.run_until_complete(async_func(*args))
-    except:
-        # Close the existing loop if open
-        if loop is not None:
-            loop.close()
-
-        # Create a new loop for retry
-        loop = asyncio.new_event_loop()
-
-        return loop.run_until_complete(async_func(*args))
-    finally:
-        if loop is not None:
-            loop.close()
-
-def display_observations_as_chips(observations: List[GetContentContentObservations]):
+def display_observations_as_chips(observations: List["GetContentContentObservations"]):
     # Group observations by type
     result = {}
     
@@ -1,11 +1,25 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
+from graphlit_api import (
+    ContentFacetInput,
+    ContentFacetTypes,
+    ContentFilter,
+    EntityExtractionConnectorInput,
+    EntityExtractionServiceTypes,
+    EntityReferenceFilter,
+    EntityReferenceInput,
+    ExtractionWorkflowJobInput,
+    ExtractionWorkflowStageInput,
+    FeedInput,
+    FeedTypes,
+    GraphQLClientError,
+    WebFeedPropertiesInput,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
 
 async def create_feed(uri):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
     input = FeedInput(
         name=uri,
         type=FeedTypes.WEB,
@@ -18,14 +32,7 @@ async def create_feed(uri):
         )
     )
 
-    try:
-        response = await graphlit.client.create_feed(input)
-        
-        st.session_state['feed_id'] = response.create_feed.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_feed(input)
 
 async def delete_feed():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -36,19 +43,13 @@ async def delete_feed():
     st.session_state['feed_done'] = None
 
 async def delete_all_feeds():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_feeds()
+    await core_client.delete_all_feeds()
 
     st.session_state['feed_id'] = None
     st.session_state['feed_done'] = None
 
 async def is_feed_done():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    response = await graphlit.client.is_feed_done(st.session_state['feed_id'])
-    
-    return response.is_feed_done.result
+    return await core_client.is_feed_done(st.session_state['feed_id'])
 
 async def create_workflow():
     input = WorkflowInput(
@@ -64,16 +65,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-        
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
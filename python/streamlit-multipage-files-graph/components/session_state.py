@@ -21,15 +21,16 @@ def reset_session_state():
         st.session_state['specification_id'] = None
     if 'conversation_id' not in st.session_state:
         st.session_state['conversation_id'] = None
-    if 'content_id' not in st.session_state:
-        st.session_state['content_id'] = None
-    if 'content_done' not in st.session_state:
-        st.session_state['content_done'] = None    
 
 def clear_session_state():
     # app-specific session state
     st.session_state['workflow_id'] = None
     st.session_state['specification_id'] = None
     st.session_state['conversation_id'] = None
-    st.session_state['content_id'] = None
-    st.session_state['content_done'] = None
+
+    # imported here, since they load the Graphlit API models, which Start_Here doesn't need
+    from graphlit_samples_core import graph_loader, ingestion
+
+    ingestion.clear_jobs()
+
+    graph_loader.reset()
@@ -1,43 +1,48 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
-
-async def ingest_file(name, mime_type, data):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.ingest_encoded_file(
-            name,
-            data, 
-            mime_type, 
-            is_synchronous=True, 
-            workflow=EntityReferenceInput(
-                id=st.session_state['workflow_id']
-            )
-        )
-        
-        st.session_state['content_id'] = response.ingest_encoded_file.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
-
-async def delete_content():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_content(st.session_state['content_id'])
-
-    st.session_state['content_id'] = None
-    st.session_state['content_done'] = None
-
-async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents()
-
-    st.session_state['content_id'] = None
-    st.session_state['content_done'] = None
+from graphlit_api import (
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    ConversationInput,
+    DocumentPreparationPropertiesInput,
+    EmailPreparationPropertiesInput,
+    EnrichmentWorkflowJobInput,
+    EnrichmentWorkflowStageInput,
+    EntityEnrichmentConnectorInput,
+    EntityEnrichmentServiceTypes,
+    EntityExtractionConnectorInput,
+    EntityExtractionServiceTypes,
+    EntityReferenceInput,
+    ExtractionWorkflowJobInput,
+    ExtractionWorkflowStageInput,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    GraphStrategyInput,
+    GraphStrategyTypes,
+    ModelServiceTypes,
+    OpenAIImageExtractionPropertiesInput,
+    OpenAIModelPropertiesInput,
+    OpenAIModels,
+    OpenAIVisionDetailLevels,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    RerankingModelServiceTypes,
+    RerankingStrategyInput,
+    RetrievalStrategyInput,
+    RetrievalStrategyTypes,
+    SearchTypes,
+    SpecificationInput,
+    SpecificationTypes,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core.client import delete_all_data
+from graphlit_samples_core import ingestion
+
+async def submit_files(uploaded_files):
+    return await ingestion.submit_files(uploaded_files, st.session_state['workflow_id'])
 
 async def create_workflow():
     input = WorkflowInput(
@@ -98,16 +103,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -139,16 +135,7 @@ async def create_specification():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -165,16 +152,7 @@ async def create_conversation():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_conversation(input)
-
-        st.session_state['conversation_id'] = response.create_conversation.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_conversation(input)
 
 async def clear_conversation():
     if st.session_state['conversation_id'] is None:
@@ -206,59 +184,3 @@ async def prompt_conversation(prompt):
         return message, graph, None
     except GraphQLClientError as e:
         return None, None, str(e)
-
-async def query_contents_graph(search):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.query_contents_graph(
-            filter=ContentFilter(
-                search=search,
-                searchType=SearchTypes.VECTOR
-            ),
-            # NOTE: required, to return the graph, even if no observable filtering
-            graph=ContentGraphInput(                
-            )
-        )
-
-        return response.contents.graph, None
-    except GraphQLClientError as e:
-        return None, str(e)
-
-async def delete_all_feeds():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_feeds(is_synchronous=True)
-
-async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents(is_synchronous=True)
-
-async def delete_all_workflows():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_workflows(is_synchronous=True)
-
-async def delete_all_specifications():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_specifications(is_synchronous=True)
-
-async def delete_all_conversations():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_conversations(is_synchronous=True)
-
-async def delete_all_observables():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_persons()
-    _ = await graphlit.client.delete_all_organizations()
-    _ = await graphlit.client.delete_all_places()
-    _ = await graphlit.client.delete_all_events()
-    _ = await graphlit.client.delete_all_products()
-    _ = await graphlit.client.delete_all_softwares()
-    _ = await graphlit.client.delete_all_repos()
-    _ = await graphlit.client.delete_all_labels()
-    _ = await graphlit.client.delete_all_categories()
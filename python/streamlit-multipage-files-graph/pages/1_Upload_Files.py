@@ -37,8 +37,7 @@ else:
                 st.session_state.messages = []
             
                 with st.expander("Uploaded Files", expanded=True):
-                    for uploaded_file in uploaded_files:
-                        helpers.run_async_task(upload.handle_upload, uploaded_file)
+                    helpers.run_async_task(upload.handle_upload, uploaded_files)
 
                     st.switch_page("pages/2_Visualize_Knowledge_Graph.py")
 
@@ -60,14 +59,15 @@ else:
                     from graphlit import Graphlit
                     from graphlit_api import *
 
-                    # NOTE: Ingest Base64 encoded file, synchronously.
+                    # NOTE: Ingest Base64 encoded file, asynchronously.
                     # Using `workflow-id` for text extraction.
+                    # Poll `is_content_done` until the content is ready.
                                         
                     response = await graphlit.client.ingest_encoded_file(
                         "{name}", 
                         "{base64-data}", 
                         "{mime_type}", 
-                        is_synchronous=True, 
+                        is_synchronous=False, 
                         workflow=EntityReferenceInput(
                             id="{workflow-id}"
                         )
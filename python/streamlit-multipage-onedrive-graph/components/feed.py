@@ -1,53 +1,122 @@
 import streamlit as st
 from datetime import datetime
 import time
+from graphlit_samples_core import feeds, folder_tree, jobs, listings
 from other import client
 
 async def handle_onedrive_folders():
-    folders, error = await client.query_onedrive_folders()
+    # the top levels of the drive, and below the folders the user expanded, listed concurrently
+    tree = await folder_tree.crawl(client.query_onedrive_folders, roots=[None] + st.session_state["onedrive_expanded_folders"])
 
-    if error is not None:
-        st.error(error)
+    if None in tree.errors:
+        st.error(tree.errors[None])
 
         st.session_state["onedrive_folder_done"] = False
         return
-   
-    options = {folder.folder_name: folder.folder_id for folder in folders}
 
-    keys = list(options.keys())
+    if tree.truncated:
+        st.warning(f"Stopped after {folder_tree.MAX_LISTINGS} folder listings; folders marked ▸ can be expanded further.")
 
-    selected_key = st.selectbox(f'Select a OneDrive folder:', keys, placeholder="Choose a folder", index=None, key="onedrive_folders")
+    selected_folder = folder_tree.select_folder(tree, 'Select a OneDrive folder:', key="onedrive_folders")
 
-    if selected_key is not None:
-        selected_value = options[selected_key]
+    if selected_folder is not None:
+        selected_name = tree.path(selected_folder)
 
-        if selected_value:
-            st.info(f"Selected folder [{selected_key}]: [{selected_value}]")
+        st.info(f"Selected folder [{selected_name}]: [{selected_folder}]")
 
-            st.session_state["onedrive_folder_name"] = selected_key
-            st.session_state["onedrive_folder_id"] = selected_value
-            st.session_state["onedrive_folder_done"] = True
+        st.session_state["onedrive_folder_name"] = selected_name
+        st.session_state["onedrive_folder_id"] = selected_folder
+        st.session_state["onedrive_folder_done"] = True
 
-            st.rerun()
-        else:
-            st.session_state["onedrive_folder_done"] = False
+        st.rerun()
 
-async def handle_onedrive_feed():
+    expanded_folder = folder_tree.select_expansion(tree, key="onedrive_expand_folder")
+
+    if expanded_folder is not None:
+        st.session_state["onedrive_expanded_folders"].append(expanded_folder)
+
+        # listed on the rerun
+        del st.session_state["onedrive_expand_folder"]
+
+        st.rerun()
+
+def reset_onedrive_listings():
+    # listed again, e.g. to pick up new folders
+    st.session_state["onedrive_expanded_folders"] = []
+    listings.invalidate(st.session_state['refresh_token'])
+
+async def prepare_feeds():
     if st.session_state['workflow_id'] is None:
         error_message = await client.create_workflow()
 
         if error_message is not None:
             st.error(f"Failed to create workflow. {error_message}")
-            return
+            return False
 
     if st.session_state['feed_id'] is not None:
         with st.spinner('Deleting existing feed... Please wait.'):
             await client.delete_feed()
         st.session_state["feed_id"] = None
 
+    if st.session_state['feed_group'] is not None:
+        jobs.forget("feed_group")
+
+        with st.spinner('Deleting existing feeds... Please wait.'):
+            await client.delete_feed_group()
+
+    return True
+
+async def handle_onedrive_feed():
+    if not await prepare_feeds():
+        return
+
     error_message = await client.create_feed(st.session_state["onedrive_folder_id"])
 
     if error_message is not None:
         st.error(error_message)
     else:
-        st.session_state['feed_done'] = True
\ No newline at end of file
+        st.session_state['feed_done'] = True
+
+async def handle_onedrive_feeds(folders):
+    if not await prepare_feeds():
+        return
+
+    with st.spinner(f'Creating {len(folders)} feeds... Please wait.'):
+        group = await client.create_feeds(folders)
+
+    # tracked in the background, and shown by feeds.render_group
+    jobs.restart("feed_group", feeds.wait_for_group, group)
+
+async def handle_onedrive_batch():
+    """
+    Pick folders to index with a feed each.
+
+    Returns:
+    True once the feeds were created.
+    """
+
+    tree = await folder_tree.crawl(client.query_onedrive_folders, roots=[None] + st.session_state["onedrive_expanded_folders"])
+
+    if None in tree.errors:
+        st.error(tree.errors[None])
+        return False
+
+    selected_folders = st.multiselect('OneDrive folders:', list(tree.folders()), format_func=tree.path, placeholder="Choose folders", key="onedrive_batch_folders")
+
+    if st.button(f"Create {len(selected_folders)} OneDrive Feeds", type="primary", disabled=len(selected_folders) == 0, key="onedrive_batch_create"):
+        await handle_onedrive_feeds({tree.path(folder_id): folder_id for folder_id in selected_folders})
+
+        return True
+
+    return False
+
+def current_feed_ids():
+    """
+    Returns:
+    The ids of the feeds of the current feed group, or of the current feed.
+    """
+
+    if st.session_state['feed_group'] is not None:
+        return st.session_state['feed_group'].ids()
+
+    return [st.session_state['feed_id']] if st.session_state['feed_id'] is not None else []
@@ -1,9 +1,55 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
-
-async def query_onedrive_folders():
+from graphlit_api import (
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    ConversationInput,
+    DocumentPreparationPropertiesInput,
+    EmailPreparationPropertiesInput,
+    EnrichmentWorkflowJobInput,
+    EnrichmentWorkflowStageInput,
+    EntityEnrichmentConnectorInput,
+    EntityEnrichmentServiceTypes,
+    EntityExtractionConnectorInput,
+    EntityExtractionServiceTypes,
+    EntityReferenceInput,
+    ExtractionWorkflowJobInput,
+    ExtractionWorkflowStageInput,
+    FeedInput,
+    FeedSchedulePolicyInput,
+    FeedServiceTypes,
+    FeedTypes,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    GraphStrategyInput,
+    GraphStrategyTypes,
+    ModelServiceTypes,
+    OneDriveFeedPropertiesInput,
+    OneDriveFoldersInput,
+    OpenAIImageExtractionPropertiesInput,
+    OpenAIModelPropertiesInput,
+    OpenAIModels,
+    OpenAIVisionDetailLevels,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    RerankingModelServiceTypes,
+    RerankingStrategyInput,
+    RetrievalStrategyInput,
+    RetrievalStrategyTypes,
+    SearchTypes,
+    SiteFeedPropertiesInput,
+    SpecificationInput,
+    SpecificationTypes,
+    TimedPolicyRecurrenceTypes,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core import feeds, listings
+from graphlit_samples_core.client import delete_all_data
+
+async def query_onedrive_folders(folderId=None):
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
 
     input = OneDriveFoldersInput(
@@ -11,16 +57,16 @@ async def query_onedrive_folders():
     )
 
     try:
-        response = await graphlit.client.query_one_drive_folders(input)
+        # subfolders of folderId, or the top level of the drive, cached by refresh token, since the page reruns on
+        # every selection
+        response = await listings.cached(input.refresh_token, ("onedrive_folders", folderId), lambda: graphlit.client.query_one_drive_folders(input, folderId))
 
         return response.one_drive_folders.results, None
     except GraphQLClientError as e:
         return None, str(e)
 
-async def create_feed(folder_id):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    input = FeedInput(
+def feed_input(folder_id):
+    return FeedInput(
         name=f"OneDrive: {folder_id}",
         type=FeedTypes.SITE,
         site=SiteFeedPropertiesInput(
@@ -39,13 +85,16 @@ async def create_feed(folder_id):
         )
     )
 
-    try:
-        response = await graphlit.client.create_feed(input)
-                
-        st.session_state['feed_id'] = response.create_feed.id
-        return None
-    except GraphQLClientError as e:
-        return str(e)
+async def create_feed(folder_id):
+    return await core_client.create_feed(feed_input(folder_id))
+
+async def create_feeds(folders):
+    # a feed per folder id, by name, created concurrently and tracked as a group
+    group = await feeds.create_feeds({name: feed_input(folder_id) for name, folder_id in folders.items()})
+
+    st.session_state['feed_group'] = group
+
+    return group
 
 async def delete_feed():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -55,12 +104,13 @@ async def delete_feed():
     st.session_state['feed_id'] = None
     st.session_state['feed_done'] = None
 
-async def is_feed_done():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
+async def delete_feed_group():
+    await feeds.delete_feeds(st.session_state['feed_group'].ids())
 
-    response = await graphlit.client.is_feed_done(st.session_state['feed_id'])
-    
-    return response.is_feed_done.result
+    st.session_state['feed_group'] = None
+
+async def is_feed_done():
+    return await core_client.is_feed_done(st.session_state['feed_id'])
 
 async def create_workflow():
     input = WorkflowInput(
@@ -121,16 +171,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -162,16 +203,7 @@ async def create_specification():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -188,16 +220,7 @@ async def create_conversation():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_conversation(input)
-
-        st.session_state['conversation_id'] = response.create_conversation.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_conversation(input)
 
 async def clear_conversation():
     if st.session_state['conversation_id'] is None:
@@ -229,59 +252,3 @@ async def prompt_conversation(prompt):
         return message, graph, None
     except GraphQLClientError as e:
         return None, None, str(e)
-
-async def query_contents_graph(search):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.query_contents_graph(
-            filter=ContentFilter(
-                search=search,
-                searchType=SearchTypes.VECTOR
-            ),
-            # NOTE: required, to return the graph, even if no observable filtering
-            graph=ContentGraphInput(                
-            )
-        )
-
-        return response.contents.graph, None
-    except GraphQLClientError as e:
-        return None, str(e)
-
-async def delete_all_feeds():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_feeds(is_synchronous=True)
-
-async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents(is_synchronous=True)
-
-async def delete_all_workflows():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_workflows(is_synchronous=True)
-
-async def delete_all_specifications():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_specifications(is_synchronous=True)
-
-async def delete_all_conversations():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_conversations(is_synchronous=True)
-
-async def delete_all_observables():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_persons()
-    _ = await graphlit.client.delete_all_organizations()
-    _ = await graphlit.client.delete_all_places()
-    _ = await graphlit.client.delete_all_events()
-    _ = await graphlit.client.delete_all_products()
-    _ = await graphlit.client.delete_all_softwares()
-    _ = await graphlit.client.delete_all_repos()
-    _ = await graphlit.client.delete_all_labels()
-    _ = await graphlit.client.delete_all_categories()
@@ -39,8 +39,15 @@ else:
                     if reset_content:
                         st.session_state["onedrive_folder_done"] = False
 
+                        feed.reset_onedrive_listings()
+
                         st.rerun()
 
+            with st.expander("Index several folders"):
+                # a feed each, created at once, and tracked as a group
+                if helpers.run_async_task(feed.handle_onedrive_batch):
+                    st.switch_page("pages/2_Visualize_Knowledge_Graph.py")
+
     with col2:
         st.markdown("**Python SDK code example:**")
         
@@ -1,7 +1,6 @@
 import streamlit as st
-from other import client, helpers, graph_helpers
-from components import header, sidebar, session_state
-from graphlit_api import *
+from components import feed, header, sidebar, session_state
+from graphlit_samples_core import feeds, graph_analytics, graph_export, graph_loader
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -12,30 +11,40 @@ if st.session_state['token'] is None:
 else:
     if st.session_state['token']:
         st.write("Visualize ingested content and extracted entities.")
-        st.warning("Refresh knowledge graph, if none shown, as OneDrive feed is ingested in the background.")
+        st.warning("Refresh knowledge graph, if none shown, as OneDrive feed is ingested in the background, or turn on live updates.")
 
-        contents_graph = None
-        error_message = None
+        if st.session_state['feed_group'] is not None:
+            feeds.render_group(st.session_state['feed_group'])
 
-        with st.spinner("Loading knowledge graph..."):
-            contents_graph, error_message = helpers.run_async_task(client.query_contents_graph, None)
+        feed_ids = feed.current_feed_ids()
 
-        if error_message is not None:
-            st.error(error_message)
-        else:
-            if contents_graph is not None:
-                st.header('Knowledge graph:')
-                                
-                g = graph_helpers.create_pyvis_contents_graph(contents_graph)
+        query = graph_loader.render_filters(feed_ids)
 
-                graph_helpers.display_pyvis_graph(g)
-            else:
-                st.error('No knowledge graph was created.')
+        st.header('Knowledge graph:')
+
+        # the feed syncs every minute, so new contents can be added to the graph as they're found
+        live = st.toggle("Live updates", help="Add new contents and entities to the graph as the OneDrive feed syncs, without refreshing.")
+
+        feed_group = st.session_state['feed_group']
+
+        # reloaded when the feed, or all the feeds of the group, finish
+        load = graph_loader.render_graph(query, generation=(tuple(feed_ids), st.session_state['feed_done'], feed_group is not None and feed_group.finished()), live=live)
+
+        if load.done:
+            st.header('Insights:')
+
+            graph_analytics.render(load.graph)
+
+            st.header('Export:')
+
+            graph_export.render_downloads(load.graph)
 
         with st.form("data_graph_form"):
             refresh_graph = st.form_submit_button("Refresh the Knowledge Graph")
 
             if refresh_graph:
+                graph_loader.reset()
+
                 st.rerun()
 
         with st.form("data_search_form"):
@@ -1,7 +1,6 @@
 import streamlit as st
 from other import helpers, graph_helpers, client
 from components import prompt, header, sidebar, session_state
-from graphlit_api import *
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -14,10 +13,14 @@ else:
         st.session_state.messages = []
 
     # render previous messages
-    for message in st.session_state.messages:
+    for index, message in enumerate(st.session_state.messages):
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
 
+            # re-display the graph retrieved with the message, from its compact form
+            if message.get("graph") is not None:
+                graph_helpers.display_graph(message["graph"], key=f"message_graph_{index}")
+
     if user_prompt := st.chat_input("Ask me anything about your content.", key="chat_input"):
         st.session_state.messages.append({"role": "user", "content": user_prompt})
         
@@ -32,16 +35,17 @@ else:
         else:
             # prompt conversation
             with st.chat_message("assistant"):
-                st.session_state.messages.append({"role": "assistant", "content": message})
+                # keep the retrieved graph with the message, so it's shown again on later reruns
+                compact = graph_helpers.compact_graph(graph) if graph is not None else None
+
+                st.session_state.messages.append({"role": "assistant", "content": message, "graph": compact})
 
                 # render assistant message
                 st.markdown(message)
 
                 # render retrieved graph
-                if graph is not None:
-                    g = graph_helpers.create_pyvis_conversation_graph(graph)
-                    
-                    graph_helpers.display_pyvis_graph(g)
+                if compact is not None:
+                    graph_helpers.display_graph(compact, key=f"message_graph_{len(st.session_state.messages) - 1}")
 
     with st.form("data_feed_form"):    
         clear_conversation = st.form_submit_button("Clear RAG conversation")
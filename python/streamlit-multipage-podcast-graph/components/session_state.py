@@ -31,3 +31,8 @@ def clear_session_state():
     st.session_state['workflow_id'] = None
     st.session_state['specification_id'] = None
     st.session_state['conversation_id'] = None
+
+    # imported here, since it loads the Graphlit API models, which Start_Here doesn't need
+    from graphlit_samples_core import graph_loader
+
+    graph_loader.reset()
@@ -1,7 +1,6 @@
 import streamlit as st
-from other import client, helpers, graph_helpers
 from components import header, sidebar, session_state
-from graphlit_api import *
+from graphlit_samples_core import graph_analytics, graph_export, graph_loader
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -14,28 +13,28 @@ else:
         st.write("Visualize ingested content and extracted entities.")
         st.warning("Refresh knowledge graph, if none shown, as podcast episodes is ingested in the background.")
 
-        contents_graph = None
-        error_message = None
+        query = graph_loader.render_filters(st.session_state['feed_id'])
 
-        with st.spinner("Loading knowledge graph..."):
-            contents_graph, error_message = helpers.run_async_task(client.query_contents_graph, None)
+        st.header('Knowledge graph:')
 
-        if error_message is not None:
-            st.error(error_message)
-        else:
-            if contents_graph is not None:
-                st.header('Knowledge graph:')
-                                
-                g = graph_helpers.create_pyvis_contents_graph(contents_graph)
+        # reloaded when the feed finishes
+        load = graph_loader.render_graph(query, generation=(st.session_state['feed_id'], st.session_state['feed_done']))
 
-                graph_helpers.display_pyvis_graph(g)
-            else:
-                st.error('No knowledge graph was created.')
+        if load.done:
+            st.header('Insights:')
+
+            graph_analytics.render(load.graph)
+
+            st.header('Export:')
+
+            graph_export.render_downloads(load.graph)
 
         with st.form("data_graph_form"):
             refresh_graph = st.form_submit_button("Refresh the Knowledge Graph")
 
             if refresh_graph:
+                graph_loader.reset()
+
                 st.rerun()
 
         with st.form("data_search_form"):
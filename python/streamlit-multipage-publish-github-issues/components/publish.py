@@ -1,3 +1,4 @@
+import asyncio
 import streamlit as st
 import time
 from other import client
@@ -5,16 +6,15 @@ from datetime import datetime
 
 async def publish_contents(prompt):
     if st.session_state['specification_id'] is not None:
-        with st.spinner('Deleting existing specification... Please wait.'):
-            await client.delete_specification()
-        st.session_state["specification_id"] = None
-
-    if st.session_state['specification_id'] is None:
+        # the delete doesn't depend on the create, so both are sent in one round trip; the delete only clears the id it deleted
+        with st.spinner('Replacing existing specification... Please wait.'):
+            _, error_message = await asyncio.gather(client.delete_specification(), client.create_specification())
+    else:
         error_message = await client.create_specification()
 
-        if error_message is not None:
-            st.error(f"Failed to create specification. {error_message}")
-            return
+    if error_message is not None:
+        st.error(f"Failed to create specification. {error_message}")
+        return
 
     summary_type = time.time()
 
@@ -2,7 +2,6 @@ import streamlit as st
 from other import helpers
 from components import publish, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
 
 default_prompt = "Write me a report of recurring themes across all GitHub issues, which can be used to group issues into workstreams.  For each theme, provide an example of issues which fall into this theme."
 
@@ -0,0 +1,8 @@
+from graphlit_samples_core import dashboard
+from components import header, sidebar, session_state
+
+session_state.reset_session_state()
+sidebar.create_sidebar()
+header.create_header()
+
+dashboard.render_dashboard()
@@ -2,7 +2,7 @@ import streamlit as st
 from other import helpers
 from components import upload, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit import Graphlit
+from graphlit_samples_core import client as core_client
 
 st.set_page_config(
     page_title="Roast me, by Graphlit",
@@ -23,10 +23,7 @@ if st.secrets['organization_id'] is not None:
 
 if st.session_state['jwt_secret'] and st.session_state['environment_id'] and st.session_state['organization_id']:    
     # Initialize Graphlit client
-    graphlit = Graphlit(organization_id=st.session_state['organization_id'], environment_id=st.session_state['environment_id'], jwt_secret=st.session_state['jwt_secret'])
-
-    st.session_state['graphlit'] = graphlit
-    st.session_state['token'] = graphlit.token
+    core_client.connect(st.session_state['organization_id'], st.session_state['environment_id'], st.session_state['jwt_secret'])
 
 if st.session_state['token'] is not None:
     col1, col2 = st.columns(2)
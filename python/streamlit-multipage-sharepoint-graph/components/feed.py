@@ -1,6 +1,7 @@
 import streamlit as st
 from datetime import datetime
 import time
+from graphlit_samples_core import feeds, folder_tree, jobs, listings
 from other import client
 
 async def handle_sharepoint_libraries():    
@@ -12,6 +13,10 @@ async def handle_sharepoint_libraries():
         st.session_state["sharepoint_library_done"] = False
         return
     
+    # the folders of every library, in the background, while the user picks one
+    if jobs.get("sharepoint_prefetch") is None:
+        jobs.start("sharepoint_prefetch", client.prefetch_sharepoint_folders, [lib.library_id for lib in libraries])
+
     options = {f"{lib.site_name}: {lib.library_name}": lib.library_id for lib in libraries}
 
     keys = list(options.keys())
@@ -27,34 +32,39 @@ async def handle_sharepoint_libraries():
         st.session_state["sharepoint_library_name"] = selected_key
         st.session_state["sharepoint_library_id"] = selected_value
         st.session_state["sharepoint_library_done"] = True
+        st.session_state["sharepoint_expanded_folders"] = []
 
         st.rerun()
 
 async def handle_sharepoint_folders():
-    folders, error = await client.query_sharepoint_folders(st.session_state["sharepoint_library_id"])
+    library_id = st.session_state["sharepoint_library_id"]
 
-    if error is not None:
-        st.error(error)
+    # the top levels of the library, and below the folders the user expanded, listed concurrently
+    tree = await folder_tree.crawl(
+        lambda folder_id: client.query_sharepoint_folders(library_id, folder_id),
+        roots=[None] + st.session_state["sharepoint_expanded_folders"],
+    )
+
+    if None in tree.errors:
+        st.error(tree.errors[None])
 
         st.session_state["sharepoint_library_done"] = False
         st.session_state["sharepoint_folder_done"] = False
         return
-   
-    options = {folder.folder_name: folder.folder_id for folder in folders}
 
-    keys = list(options.keys())
-    keys.append("- Return to SharePoint libraries")
+    if tree.truncated:
+        st.warning(f"Stopped after {folder_tree.MAX_LISTINGS} folder listings; folders marked ▸ can be expanded further.")
 
-    selected_key = st.selectbox(f'Select a folder in your SharePoint document library:', keys, placeholder="Choose a folder", index=None, key="sharepoint_folders")
+    selected_folder = folder_tree.select_folder(tree, 'Select a folder in your SharePoint document library:', key="sharepoint_folders", extra_options=["- Return to SharePoint libraries"])
 
-    if selected_key is not None:
-        selected_value = options[selected_key]
+    if selected_folder is not None:
+        if selected_folder in tree.names:
+            selected_name = tree.path(selected_folder)
 
-        if selected_value:
-            st.info(f"Selected folder [{selected_key}]: [{selected_value}]")
+            st.info(f"Selected folder [{selected_name}]: [{selected_folder}]")
 
-            st.session_state["sharepoint_folder_name"] = selected_key
-            st.session_state["sharepoint_folder_id"] = selected_value
+            st.session_state["sharepoint_folder_name"] = selected_name
+            st.session_state["sharepoint_folder_id"] = selected_folder
             st.session_state["sharepoint_folder_done"] = True
 
             st.rerun()
@@ -62,22 +72,112 @@ async def handle_sharepoint_folders():
             st.session_state["sharepoint_library_done"] = False
             st.session_state["sharepoint_folder_done"] = False
 
-async def handle_sharepoint_feed():
+    expanded_folder = folder_tree.select_expansion(tree, key="sharepoint_expand_folder")
+
+    if expanded_folder is not None:
+        st.session_state["sharepoint_expanded_folders"].append(expanded_folder)
+
+        # listed on the rerun
+        del st.session_state["sharepoint_expand_folder"]
+
+        st.rerun()
+
+def reset_sharepoint_listings():
+    # listed again, e.g. to pick up new folders
+    jobs.forget("sharepoint_prefetch")
+    st.session_state["sharepoint_expanded_folders"] = []
+    listings.invalidate(st.session_state['refresh_token'])
+
+async def prepare_feeds():
     if st.session_state['workflow_id'] is None:
         error_message = await client.create_workflow()
 
         if error_message is not None:
             st.error(f"Failed to create workflow. {error_message}")
-            return
+            return False
 
     if st.session_state['feed_id'] is not None:
         with st.spinner('Deleting existing feed... Please wait.'):
             await client.delete_feed()
         st.session_state["feed_id"] = None
 
+    if st.session_state['feed_group'] is not None:
+        jobs.forget("feed_group")
+
+        with st.spinner('Deleting existing feeds... Please wait.'):
+            await client.delete_feed_group()
+
+    return True
+
+async def handle_sharepoint_feed():
+    if not await prepare_feeds():
+        return
+
     error_message = await client.create_feed(st.session_state["sharepoint_account_name"], st.session_state["sharepoint_library_id"], st.session_state["sharepoint_folder_id"])
 
     if error_message is not None:
         st.error(error_message)
     else:
-        st.session_state['feed_done'] = True
\ No newline at end of file
+        st.session_state['feed_done'] = True
+
+async def handle_sharepoint_feeds(targets):
+    if not await prepare_feeds():
+        return
+
+    with st.spinner(f'Creating {len(targets)} feeds... Please wait.'):
+        group = await client.create_feeds(targets)
+
+    # tracked in the background, and shown by feeds.render_group
+    jobs.restart("feed_group", feeds.wait_for_group, group)
+
+async def handle_sharepoint_batch():
+    """
+    Pick whole libraries, and folders of the selected library, to index with a feed each.
+
+    Returns:
+    True once the feeds were created.
+    """
+
+    account_name, libraries, error = await client.query_sharepoint_libraries()
+
+    if error is not None:
+        st.error(error)
+        return False
+
+    library_names = {lib.library_id: f"{lib.site_name}: {lib.library_name}" for lib in libraries}
+
+    selected_libraries = st.multiselect('Whole SharePoint document libraries:', list(library_names), format_func=library_names.get, placeholder="Choose libraries", key="sharepoint_batch_libraries")
+
+    targets = {library_names[library_id]: (account_name, library_id, None) for library_id in selected_libraries}
+
+    library_id = st.session_state["sharepoint_library_id"]
+
+    if st.session_state["sharepoint_library_done"] and library_id is not None:
+        tree = await folder_tree.crawl(
+            lambda folder_id: client.query_sharepoint_folders(library_id, folder_id),
+            roots=[None] + st.session_state["sharepoint_expanded_folders"],
+        )
+
+        selected_folders = st.multiselect(f'Folders of [{library_names.get(library_id)}]:', list(tree.folders()), format_func=tree.path, placeholder="Choose folders", key="sharepoint_batch_folders")
+
+        targets.update({f"{library_names.get(library_id)}: {tree.path(folder_id)}": (account_name, library_id, folder_id) for folder_id in selected_folders})
+    else:
+        st.caption("Select a library above to also pick folders of it.")
+
+    if st.button(f"Create {len(targets)} SharePoint Feeds", type="primary", disabled=len(targets) == 0, key="sharepoint_batch_create"):
+        await handle_sharepoint_feeds(targets)
+
+        return True
+
+    return False
+
+def current_feed_ids():
+    """
+    Returns:
+    The ids of the feeds of the current feed group, or of the current feed.
+    """
+
+    if st.session_state['feed_group'] is not None:
+        return st.session_state['feed_group'].ids()
+
+    return [st.session_state['feed_id']] if st.session_state['feed_id'] is not None else []
@@ -26,6 +26,8 @@ def reset_session_state():
         st.session_state['feed_id'] = None
     if 'feed_done' not in st.session_state:
         st.session_state['feed_done'] = None    
+    if 'feed_group' not in st.session_state:
+        st.session_state['feed_group'] = None
     if 'specification_id' not in st.session_state:
         st.session_state['specification_id'] = None
     if 'conversation_id' not in st.session_state:
@@ -45,12 +47,15 @@ def reset_session_state():
         st.session_state['sharepoint_folder_id'] = None
     if 'sharepoint_folder_done' not in st.session_state:
         st.session_state['sharepoint_folder_done'] = False
+    if 'sharepoint_expanded_folders' not in st.session_state:
+        st.session_state['sharepoint_expanded_folders'] = []
 
 def clear_session_state():
     # app-specific session state
     st.session_state['workflow_id'] = None
     st.session_state['specification_id'] = None
     st.session_state['conversation_id'] = None
+    st.session_state['feed_group'] = None
 
     st.session_state['sharepoint_account_name'] = None
     st.session_state['sharepoint_library_name'] = None
@@ -59,3 +64,9 @@ def clear_session_state():
     st.session_state['sharepoint_folder_name'] = None
     st.session_state['sharepoint_folder_id'] = None
     st.session_state['sharepoint_folder_done'] = False
+    st.session_state['sharepoint_expanded_folders'] = []
+
+    # imported here, since it loads the Graphlit API models, which Start_Here doesn't need
+    from graphlit_samples_core import graph_loader
+
+    graph_loader.reset()
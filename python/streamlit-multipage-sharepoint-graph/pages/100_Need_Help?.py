@@ -17,20 +17,5 @@ else:
         if submit_reset:
             session_state.clear_session_state()
             
-            with st.spinner('Deleting workflows... Please wait.'):             
-                helpers.run_async_task(client.delete_all_workflows)
-
-            with st.spinner('Deleting conversations... Please wait.'):             
-                helpers.run_async_task(client.delete_all_conversations)
-
-            with st.spinner('Deleting specifications... Please wait.'):             
-                helpers.run_async_task(client.delete_all_specifications)
-
-            with st.spinner('Deleting feeds... Please wait.'):  
-                helpers.run_async_task(client.delete_all_feeds)
-                
-            with st.spinner('Deleting contents... Please wait.'):             
-                helpers.run_async_task(client.delete_all_contents)
-
-            with st.spinner('Deleting observables... Please wait.'):             
-                helpers.run_async_task(client.delete_all_observables)
+            with st.spinner('Deleting workflows, conversations, specifications, feeds, contents and observables... Please wait.'):
+                helpers.run_async_task(client.delete_all_data)
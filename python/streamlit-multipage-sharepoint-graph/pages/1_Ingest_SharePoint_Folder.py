@@ -45,8 +45,15 @@ else:
                         st.session_state["sharepoint_library_done"] = False
                         st.session_state["sharepoint_folder_done"] = False
 
+                        feed.reset_sharepoint_listings()
+
                         st.rerun()
 
+            with st.expander("Index several libraries or folders"):
+                # a feed each, created at once, and tracked as a group
+                if helpers.run_async_task(feed.handle_sharepoint_batch):
+                    st.switch_page("pages/2_Visualize_Knowledge_Graph.py")
+
     with col2:
         st.markdown("**Python SDK code example:**")
         
@@ -1,11 +1,15 @@
 import streamlit as st
 import time
 from other import client
+from graphlit_samples_core import jobs
 from datetime import datetime
 
 async def handle_upload(uri):
     st.session_state['content_done'] = False
 
+    # a summary of the previous content no longer applies
+    jobs.forget("summarize")
+
     if st.session_state['workflow_id'] is None:
         error_message = await client.create_workflow()
 
@@ -1,17 +1,36 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
+from graphlit_api import (
+    AnthropicModelPropertiesInput,
+    AnthropicModels,
+    AzureDocumentIntelligenceModels,
+    AzureDocumentPreparationPropertiesInput,
+    ContentFilter,
+    EntityReferenceInput,
+    FilePreparationConnectorInput,
+    FilePreparationServiceTypes,
+    GraphQLClientError,
+    ModelServiceTypes,
+    PreparationWorkflowJobInput,
+    PreparationWorkflowStageInput,
+    SearchTypes,
+    SpecificationInput,
+    SpecificationTypes,
+    SummarizationStrategyInput,
+    SummarizationTypes,
+    WorkflowInput,
+)
+from graphlit_samples_core import client as core_client
+from graphlit_samples_core import ingestion
 
 async def ingest_file(uri):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    content_id, error_message = await ingestion.ingest_uri(uri, st.session_state['workflow_id'])
 
-    try:
-        response = await graphlit.client.ingest_uri(uri, is_synchronous=True, workflow=EntityReferenceInput(id=st.session_state['workflow_id']))
-        
-        st.session_state['content_id'] = response.ingest_uri.id
-    except GraphQLClientError as e:
-        return str(e)
+    if error_message is not None:
+        return error_message
+
+    st.session_state['content_id'] = content_id
 
     return None
 
@@ -34,9 +53,7 @@ async def delete_content(id):
     st.session_state['content_done'] = None
 
 async def delete_all_contents():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_contents()
+    await core_client.delete_all_contents()
 
     st.session_state['content_id'] = None
     st.session_state['content_done'] = None
@@ -58,16 +75,7 @@ async def create_workflow():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_workflow(input)
-
-        st.session_state['workflow_id'] = response.create_workflow.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_workflow(input)
 
 async def delete_workflow():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -95,24 +103,18 @@ async def create_specification():
         )
     )
 
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    specification_id = st.session_state['specification_id']
 
     try:
-        _ = await graphlit.client.delete_specification(st.session_state['specification_id'])
+        _ = await graphlit.client.delete_specification(specification_id)
 
-        st.session_state['specification_id'] = None
+        # unless a specification was created meanwhile, e.g. concurrently with this delete
+        if st.session_state['specification_id'] == specification_id:
+            st.session_state['specification_id'] = None
     except GraphQLClientError as e:
         return str(e)
 
@@ -1,8 +1,8 @@
 import streamlit as st
-from other import helpers
 from components import summarize, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
+from graphlit_samples_core import jobs
+from graphlit_api import SummarizationTypes
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -33,7 +33,9 @@ else:
                 submit_summarization = st.form_submit_button("Summarize")
 
                 if submit_summarization:
-                    helpers.run_async_task(summarize.handle_summarize, summarization_type, summarization_prompt)
+                    jobs.start("summarize", summarize.handle_summarize, summarization_type, summarization_prompt)
+
+            jobs.render("summarize", "Generating summary... Please wait.", summarize.render_summary)
         else:
             st.info("Please upload a file to summarize.")   
 
@@ -1,11 +1,28 @@
 import streamlit as st
 from typing import Optional
 from graphlit import Graphlit
-from graphlit_api import *
+from graphlit_api import (
+    AnthropicModelPropertiesInput,
+    AnthropicModels,
+    ContentFilter,
+    ContentTypes,
+    EntityReferenceFilter,
+    EntityReferenceInput,
+    FeedInput,
+    FeedTypes,
+    FileTypes,
+    GraphQLClientError,
+    ModelServiceTypes,
+    RSSFeedPropertiesInput,
+    SearchTypes,
+    SpecificationInput,
+    SpecificationTypes,
+    SummarizationStrategyInput,
+    SummarizationTypes,
+)
+from graphlit_samples_core import client as core_client
 
 async def create_feed(uri):
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
     input = FeedInput(
         name=uri,
         type=FeedTypes.RSS,
@@ -15,14 +32,7 @@ async def create_feed(uri):
         )
     )
 
-    try:
-        response = await graphlit.client.create_feed(input)
-        
-        st.session_state['feed_id'] = response.create_feed.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_feed(input)
 
 async def delete_feed():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -32,22 +42,14 @@ async def delete_feed():
     st.session_state['feed_id'] = None
 
 async def delete_all_feeds():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    _ = await graphlit.client.delete_all_feeds()
+    await core_client.delete_all_feeds()
 
     st.session_state['feed_id'] = None
 
 async def is_feed_done():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
-    response = await graphlit.client.is_feed_done(st.session_state['feed_id'])
-    
-    return response.is_feed_done.result
+    return await core_client.is_feed_done(st.session_state['feed_id'])
 
 async def create_specification():
-    graphlit: Optional[Graphlit] = st.session_state['graphlit']
-
     input = SpecificationInput(
         name="Summarization",
         type=SpecificationTypes.COMPLETION,
@@ -61,21 +63,17 @@ async def create_specification():
         )
     )
 
-    try:
-        response = await graphlit.client.create_specification(input)
-
-        st.session_state['specification_id'] = response.create_specification.id
-    except GraphQLClientError as e:
-        return str(e)
-
-    return None
+    return await core_client.create_specification(input)
 
 async def delete_specification():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
+    specification_id = st.session_state['specification_id']
 
-    _ = await graphlit.client.delete_specification(st.session_state['specification_id'])
+    _ = await graphlit.client.delete_specification(specification_id)
 
-    st.session_state['specification_id'] = None
+    # unless a specification was created meanwhile, e.g. concurrently with this delete
+    if st.session_state['specification_id'] == specification_id:
+        st.session_state['specification_id'] = None
 
 async def summarize_contents():
     graphlit: Optional[Graphlit] = st.session_state['graphlit']
@@ -1,8 +1,7 @@
 import streamlit as st
-from other import helpers
 from components import summarize, header, sidebar, session_state
 from streamlit_extras.stylable_container import stylable_container
-from graphlit_api import *
+from graphlit_samples_core import jobs
 
 session_state.reset_session_state()
 sidebar.create_sidebar()
@@ -19,7 +18,9 @@ else:
                 submit_summarization = st.form_submit_button("Generate Chapters")
 
                 if submit_summarization:
-                    helpers.run_async_task(summarize.handle_summarize)
+                    jobs.start("summarize", summarize.handle_summarize)
+
+            jobs.render("summarize", "Generating summary... Please wait.", summarize.render_summary)
         else:
             st.info("Please ingest a podcast to generate chapters.")   
 
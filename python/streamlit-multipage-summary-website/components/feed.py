@@ -2,10 +2,14 @@ import streamlit as st
 from datetime import datetime
 import time
 from other import client
+from graphlit_samples_core import feeds, jobs
 
 async def handle_feed(name):
     st.session_state['feed_done'] = False
 
+    # a summary of the previous content no longer applies
+    jobs.forget("summarize")
+
     if st.session_state['workflow_id'] is None:
         error_message = await client.create_workflow()
 
@@ -28,13 +32,7 @@ async def handle_feed(name):
         start_time = time.time()
 
         with st.spinner('Ingesting website... Please wait.'):
-            done = False
-            time.sleep(5)
-            while not done:
-                done = await client.is_feed_done()
-
-                if not done:
-                    time.sleep(2)
+            await feeds.wait_for_feed(st.session_state['feed_id'])
 
         st.session_state["feed_done"] = True
 
@@ -1,42 +1,17 @@
 import streamlit as st
-from typing import List
-import plotly.express as px
-import pandas as pd
+from typing import List, TYPE_CHECKING
 import json
-import asyncio
-from graphlit_api import *
+from graphlit_samples_core.runtime import run_async_task
+from graphlit_samples_core.lazy import lazy_import
 
-def run_async_task(async_func, *args):
-    """
-    Run an asynchronous function in a new event loop.
+if TYPE_CHECKING:
+    from graphlit_api import QueryContentsFacetsContentsFacets
 
-    Args:
-    async_func (coroutine): The asynchronous function to execute.
-    *args: Arguments to pass to the asynchronous function.
+# only loaded when a chart is rendered
+px = lazy_import("plotly.express")
+pd = lazy_import("pandas")
 
-    Returns:
-    None
-    """
-    
-    loop = None
-
-    try:
-        loop = asyncio.new_event_loop()
-        return loop.run_until_complete(async_func(*args))
-    except:
-        # Close the existing loop if open
-        if loop is not None:
-            loop.close()
-
-        # Create a new loop for retry
-        loop = asyncio.new_event_loop()
-
-        return loop.run_until_complete(async_func(*args))
-    finally:
-        if loop is not None:
-            loop.close()
-
-def render_observable_facet_chart(facets: List[QueryContentsFacetsContentsFacets]):
+def render_observable_facet_chart(facets: List["QueryContentsFacetsContentsFacets"]):
     json_strings = [facet.model_dump_json(indent=2) for facet in facets]  # Using indent for pretty printing
     json_dicts = [json.loads(js) for js in json_strings]
 
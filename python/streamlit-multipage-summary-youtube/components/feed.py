@@ -2,10 +2,14 @@ import streamlit as st
 from datetime import datetime
 import time
 from other import client
+from graphlit_samples_core import feeds, jobs
 
 async def handle_feed(identifier):
     st.session_state['feed_done'] = False
 
+    # a summary of the previous content no longer applies
+    jobs.forget("summarize")
+
     if st.session_state['feed_id'] is not None:
         with st.spinner('Deleting existing feed... Please wait.'):
             await client.delete_feed()
@@ -21,13 +25,7 @@ async def handle_feed(identifier):
         start_time = time.time()
 
         with st.spinner('Ingesting and transcribing video... Please wait.'):
-            done = False
-            time.sleep(5)
-            while not done:
-                done = await client.is_feed_done()
-
-                if not done:
-                    time.sleep(2)
+            await feeds.wait_for_feed(st.session_state['feed_id'])
 
         st.session_state["feed_done"] = True
 
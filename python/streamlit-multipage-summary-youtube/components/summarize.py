@@ -1,36 +1,37 @@
+import asyncio
 import streamlit as st
-import time
 from datetime import datetime
 from other import client
 
 async def handle_summarize():
-    if st.session_state['token']:
-        if st.session_state['specification_id'] is not None:
-            with st.spinner('Deleting existing specification... Please wait.'):
-                await client.delete_specification()
-            st.session_state["specification_id"] = None
-
+    """
+    Runs as a background job (`graphlit_samples_core.jobs`), which carries on if the page reruns meanwhile,
+    so it returns errors instead of rendering them.
+
+    Returns:
+    The summary and None, or None and an error message.
+    """
+
+    if st.session_state['specification_id'] is not None:
+        # the delete doesn't depend on the create, so both are sent in one round trip; the delete only clears the id it deleted
+        _, error_message = await asyncio.gather(client.delete_specification(), client.create_specification())
+    else:
         error_message = await client.create_specification()
 
-        if error_message is not None:
-            st.error(error_message)
-        else:
-            start_summary_time = time.time()
-
-            with st.spinner('Generating summary... Please wait.'):
-                placeholder = st.empty()
+    if error_message is not None:
+        return None, error_message
 
-                summary, error_message = await client.summarize_contents()
+    return await client.summarize_contents()
 
-                if error_message is not None:
-                    st.error(error_message)
-                    return
+def render_summary(job):
+    summary, error_message = job.result
 
-                placeholder.markdown(summary)
+    if error_message is not None:
+        st.error(error_message)
+        return
 
-                summary_duration = time.time() - start_summary_time
+    st.markdown(summary)
 
-                current_time = datetime.now()
-                formatted_time = current_time.strftime("%H:%M:%S")
+    formatted_time = datetime.fromtimestamp(job.finished).strftime("%H:%M:%S")
 
-                st.success(f"Summary generation took {summary_duration:.2f} seconds. Finished at {formatted_time} UTC.")
+    st.success(f"Summary generation took {job.duration:.2f} seconds. Finished at {formatted_time} UTC.")